@@ -0,0 +1,103 @@
+"""
+카탈로그 조회 오프로딩 전후의 비동기 도구 지연 비교
+
+카탈로그를 큰 크기로 부풀린 뒤, 무거운 search_agents / recommend_for_task 조회를
+동시에 여러 개 실행하는 동안
+- 이벤트 루프 지연 (LoopLagMonitor)
+- 짧은 비동기 작업(뉴스 / 순위 캐시 조회를 흉내 낸 10ms 대기)의 실제 소요 시간
+을 실행 방식(inline | thread | process)별로 측정합니다.
+
+    python bench/catalog_offload.py --agents 200000 --queries 16
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "server"))
+
+from tools.ai_agents import AIAgentCatalog  # noqa: E402
+from tools.catalog_pool import CatalogQueryPool  # noqa: E402
+from tools.loop_monitor import LoopLagMonitor  # noqa: E402
+
+
+def inflated_catalog(size: int) -> AIAgentCatalog:
+    catalog = AIAgentCatalog()
+    base = catalog.agents
+    catalog.agents = [
+        {**base[i % len(base)], "id": f"{base[i % len(base)]['id']}-{i}"}
+        for i in range(size)
+    ]
+    return catalog
+
+
+async def probe(stop: asyncio.Event, samples: list):
+    """10ms 비동기 작업을 반복하며 실제 소요 시간 기록"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        samples.append((time.perf_counter() - started) * 1000)
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * q))], 1) if values else 0
+
+
+async def run_mode(mode: str, snapshot, args) -> dict:
+    pool = CatalogQueryPool(snapshot, mode=mode, workers=args.workers)
+    # 워커 시작 / 스냅샷 설치 비용은 측정에서 제외
+    await pool.query("list_agents", "none")
+
+    monitor = LoopLagMonitor(interval=0.005)
+    monitor.start()
+    stop, samples = asyncio.Event(), []
+    probe_task = asyncio.create_task(probe(stop, samples))
+
+    started = time.perf_counter()
+    queries = [
+        pool.query("search_agents", "code") if i % 2 else
+        pool.query("recommend_for_task", "웹 개발 코딩", "beginner", "free")
+        for i in range(args.queries)
+    ]
+    await asyncio.gather(*queries)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe_task
+    lag = monitor.stats()
+    await monitor.stop()
+    if pool._pool is not None:
+        pool._pool.shutdown()
+
+    return {
+        "mode": mode,
+        "queries": args.queries,
+        "elapsed_s": round(elapsed, 2),
+        "loop_lag_p99_ms": lag.get("p99_ms"),
+        "loop_lag_max_ms": lag.get("max_ms"),
+        "async_10ms_task_p50_ms": percentile(samples, 0.5),
+        "async_10ms_task_p99_ms": percentile(samples, 0.99),
+        "async_10ms_task_mean_ms": round(statistics.mean(samples), 1) if samples else 0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=200000)
+    parser.add_argument("--queries", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--modes", default="inline,thread,process")
+    args = parser.parse_args()
+
+    snapshot = inflated_catalog(args.agents).snapshot()
+    for mode in args.modes.split(","):
+        print(json.dumps(await run_mode(mode, snapshot, args)))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,317 @@
+"""
+MCP tools/call 부하 재생기
+
+JSONL 트래픽 로그의 tools/call 요청을 streamable-HTTP 서버에 정해진 속도와 동시성으로
+재생하고 도구별 처리량과 p50 / p95 / p99 지연을 보고합니다.
+
+로그 한 줄은 둘 중 하나입니다.
+    {"tool": "get_ai_news", "arguments": {"limit": 5}, "at": 0.25}
+    {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "get_ai_news", "arguments": {}}}
+at(로그 시작 후 초)은 --rate 0일 때 기록된 간격대로 재생하는 데 씁니다. (--speed 배속)
+
+요청은 예정 시각에 보내며(open loop), 지연은 예정 시각부터 응답까지로 잽니다.
+서버가 밀려 예정보다 늦게 보낸 시간도 지연에 포함됩니다.
+
+    # 업스트림 에뮬레이터와 서버를 띄워 재생
+    python bench/load_replay.py bench/traffic/sample.jsonl --spawn --rate 20 --concurrency 8 --duration 30 \\
+        --emulator-args "--latency-ms 150 --jitter-ms 50 --rate-limit-rate 0.05"
+
+    # 이미 떠 있는 서버에 재생
+    python bench/load_replay.py bench/traffic/sample.jsonl --url http://127.0.0.1:8000/mcp --rate 50
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import shlex
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+from urllib.request import urlopen
+
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from upstream_emulator import upstream_env  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+Call = Tuple[str, Dict[str, Any], Optional[float]]
+
+
+def load_log(path: str) -> List[Call]:
+    """JSONL 로그 → [(도구, 인자, at)]"""
+    calls = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError as e:
+                print(f"Error parsing {path}:{lineno}: {e}", file=sys.stderr)
+                continue
+            if entry.get("method") == "tools/call":
+                params = entry.get("params", {})
+                calls.append((params["name"], params.get("arguments") or {}, entry.get("at")))
+            elif "tool" in entry:
+                calls.append((entry["tool"], entry.get("arguments") or {}, entry.get("at")))
+    return calls
+
+
+def schedule(calls: List[Call], rate: float, speed: float, loops: int, duration: Optional[float],
+             unthrottled: bool = False) -> List[Tuple[float, str, Dict[str, Any]]]:
+    """재생 계획 [(시작 후 초, 도구, 인자)]"""
+    recorded = rate <= 0 and all(at is not None for _, _, at in calls)
+    if unthrottled or (rate <= 0 and not recorded):
+        # 속도 제한 없음 (동시성만큼 최대한 빨리), 시간 기준이 없으므로 --loops만 사용
+        return [(0.0, tool, arguments) for _ in range(loops) for tool, arguments, _ in calls]
+
+    span = max(at for _, _, at in calls) + 1 / len(calls) if recorded else len(calls) / rate
+    plan = []
+    loop = 0
+    while duration is not None or loop < loops:
+        for i, (tool, arguments, at) in enumerate(calls):
+            t = (loop * span + at) / speed if recorded else (loop * len(calls) + i) / rate
+            if duration is not None and t >= duration:
+                return plan
+            plan.append((t, tool, arguments))
+        loop += 1
+    return plan
+
+
+def percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * q))], 1) if values else 0
+
+
+class Results:
+    """도구별 지연 / 결과 집계"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.outcomes: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.started = 0.0
+        self.finished = 0.0
+
+    def add(self, tool: str, latency_ms: float, outcome: str):
+        self.latencies[tool].append(latency_ms)
+        self.outcomes[tool][outcome] += 1
+        self.finished = time.perf_counter()
+
+    def summary(self) -> Dict[str, Any]:
+        # 세션 연결 / 종료 시간은 빼고 첫 요청 예정 시각부터 마지막 응답까지
+        elapsed = max(0.0, self.finished - self.started)
+
+        def row(latencies, outcomes):
+            return {
+                "calls": len(latencies),
+                "ok": outcomes.get("ok", 0),
+                "stale": outcomes.get("stale", 0),
+                "shed": outcomes.get("shed", 0),
+                "errors": outcomes.get("error", 0),
+                "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0,
+                "p50_ms": percentile(latencies, 0.50),
+                "p95_ms": percentile(latencies, 0.95),
+                "p99_ms": percentile(latencies, 0.99),
+                "max_ms": round(max(latencies), 1) if latencies else 0,
+            }
+
+        all_latencies = [v for values in self.latencies.values() for v in values]
+        all_outcomes: Dict[str, int] = defaultdict(int)
+        for outcomes in self.outcomes.values():
+            for key, count in outcomes.items():
+                all_outcomes[key] += count
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "tools": {tool: row(self.latencies[tool], self.outcomes[tool]) for tool in sorted(self.latencies)},
+            "overall": row(all_latencies, all_outcomes),
+        }
+
+
+def classify(result) -> str:
+    """도구 결과 → ok | stale | shed | error"""
+    text = " ".join(getattr(c, "text", "") for c in result.content)
+    if result.isError:
+        return "shed" if "Server busy" in text else "error"
+    return "stale" if '"stale": true' in text else "ok"
+
+
+async def worker(url: str, queue: "asyncio.Queue", results: Results, ready: asyncio.Barrier, timeout: float):
+    """세션 하나로 큐의 요청을 차례로 실행"""
+    async with streamablehttp_client(url, timeout=timeout) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            try:
+                await asyncio.wait_for(session.initialize(), timeout)
+            except BaseException:
+                await ready.abort()
+                raise
+            # 모든 세션이 연결된 뒤에 재생 시작
+            await ready.wait()
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                due, tool, arguments = item
+                try:
+                    result = await session.call_tool(tool, arguments)
+                    outcome = classify(result)
+                except Exception as e:
+                    print(f"Error calling {tool}: {e}", file=sys.stderr)
+                    outcome = "error"
+                results.add(tool, (time.perf_counter() - (results.started + due)) * 1000, outcome)
+
+
+async def replay(url: str, plan, concurrency: int, timeout: float) -> Dict[str, Any]:
+    results = Results()
+    queue: asyncio.Queue = asyncio.Queue()
+    ready = asyncio.Barrier(concurrency + 1)
+    workers = [asyncio.create_task(worker(url, queue, results, ready, timeout)) for _ in range(concurrency)]
+
+    try:
+        await ready.wait()
+        results.started = started = time.perf_counter()
+        for due, tool, arguments in plan:
+            delay = started + due - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            queue.put_nowait((due, tool, arguments))
+    finally:
+        for _ in workers:
+            queue.put_nowait(None)
+        for outcome in await asyncio.gather(*workers, return_exceptions=True):
+            if isinstance(outcome, BaseException):
+                print(f"Error in replay worker: {outcome!r}", file=sys.stderr)
+    return results.summary()
+
+
+def fetch_server_stats(url: str) -> Optional[Dict[str, Any]]:
+    """서버 /stats (없으면 None)"""
+    parts = urlsplit(url)
+    try:
+        with urlopen(f"{parts.scheme}://{parts.netloc}/stats", timeout=5) as response:
+            return json.loads(response.read())
+    except Exception:
+        return None
+
+
+# =========================
+# 에뮬레이터 + 서버 실행 (--spawn)
+# =========================
+
+def wait_for_port(host: str, port: int, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{host}:{port} did not start within {timeout}s")
+
+
+def stop_process(process: subprocess.Popen):
+    """프로세스 그룹 전체 종료 (서버의 프로세스 풀 워커까지)
+
+    fork된 풀 워커는 uvicorn의 SIGTERM 핸들러와 리슨 소켓을 물려받아 남아 있으므로
+    서버가 끝나면 그룹에 남은 프로세스를 SIGKILL로 정리합니다.
+    """
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass
+        if sig == signal.SIGTERM:
+            process.wait()
+
+
+def spawn(args) -> List[subprocess.Popen]:
+    """업스트림 에뮬레이터와 MCP 서버를 띄우고 --url을 서버로 설정"""
+    emulator_cmd = [sys.executable, str(ROOT / "bench" / "upstream_emulator.py"), "serve",
+                    "--port", str(args.emulator_port), *shlex.split(args.emulator_args)]
+    emulator = subprocess.Popen(emulator_cmd, stdout=subprocess.DEVNULL, start_new_session=True)
+    wait_for_port("127.0.0.1", args.emulator_port)
+
+    env = {
+        **os.environ,
+        **upstream_env("127.0.0.1", args.emulator_port),
+        "MCP_MODE": "sse",
+        "PORT": str(args.server_port),
+        "FASTMCP_LOG_LEVEL": "WARNING",
+    }
+    server_log = open(args.server_log, "w") if args.server_log else subprocess.DEVNULL
+    server = subprocess.Popen([sys.executable, "main.py"], cwd=ROOT / "server", env=env,
+                              stdout=server_log, stderr=server_log, start_new_session=True)
+    try:
+        wait_for_port("127.0.0.1", args.server_port)
+    except RuntimeError:
+        stop_process(emulator)
+        stop_process(server)
+        raise
+    args.url = f"http://127.0.0.1:{args.server_port}/mcp"
+    return [server, emulator]
+
+
+def print_table(report: Dict[str, Any]):
+    header = f"{'tool':<26}{'calls':>7}{'ok':>6}{'stale':>6}{'shed':>6}{'err':>5}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}"
+    print(header)
+    print("-" * len(header))
+    rows = list(report["tools"].items()) + [("overall", report["overall"])]
+    for tool, r in rows:
+        print(f"{tool:<26}{r['calls']:>7}{r['ok']:>6}{r['stale']:>6}{r['shed']:>6}{r['errors']:>5}"
+              f"{r['throughput_rps']:>8}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}")
+    print(f"\nelapsed {report['elapsed_s']}s, latency in ms (from scheduled send time)")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", help="JSONL 트래픽 로그")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/mcp")
+    parser.add_argument("--rate", type=float, default=10, help="초당 요청 수 (0이면 로그의 at 간격 또는 제한 없음)")
+    parser.add_argument("--speed", type=float, default=1.0, help="--rate 0에서 기록 간격 재생 배속")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 MCP 세션 수")
+    parser.add_argument("--max", action="store_true", help="속도 제한 없이 동시성만큼 최대한 빨리 (--loops만 사용)")
+    parser.add_argument("--loops", type=int, default=1, help="로그 반복 횟수")
+    parser.add_argument("--duration", type=float, help="재생 시간(초), 지정하면 --loops 대신 시간까지 반복")
+    parser.add_argument("--timeout", type=float, default=60, help="요청 타임아웃(초)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    parser.add_argument("--spawn", action="store_true", help="업스트림 에뮬레이터와 서버를 직접 실행")
+    parser.add_argument("--server-port", type=int, default=8765)
+    parser.add_argument("--emulator-port", type=int, default=9100)
+    parser.add_argument("--emulator-args", default="", help='에뮬레이터 옵션 (예: "--latency-ms 100 --error-rate 0.05")')
+    parser.add_argument("--server-log", help="--spawn 서버 출력 저장 파일")
+    args = parser.parse_args()
+
+    calls = load_log(args.log)
+    if not calls:
+        parser.error(f"No tools/call requests in {args.log}")
+    plan = schedule(calls, args.rate, args.speed, args.loops, args.duration, args.max)
+
+    processes = spawn(args) if args.spawn else []
+    try:
+        report = await replay(args.url, plan, args.concurrency, args.timeout)
+        stats = fetch_server_stats(args.url)
+        if stats is not None:
+            report["server"] = {key: stats.get(key) for key in ("event_loop_lag", "admission")}
+    finally:
+        for process in processes:
+            stop_process(process)
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        print_table(report)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+"""
+디코딩 오프로딩 전후의 이벤트 루프 지연 비교
+
+로컬 스텁 서버가 큰 arXiv 피드와 HF full=True 목록을 돌려주고,
+여러 세션이 동시에 뉴스를 가져오는 동안 이벤트 루프 지연을 측정합니다.
+
+    python bench/loop_lag.py --concurrency 16 --rounds 5
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "server"))
+
+from tools.ai_news import AINewsCollector  # noqa: E402
+from tools.executors import configure_executor  # noqa: E402
+from tools.loop_monitor import LoopLagMonitor  # noqa: E402
+
+
+def make_arxiv_feed(entries: int) -> str:
+    items = "".join(
+        f"""<entry><id>http://arxiv.org/abs/2501.{i:05d}</id>
+<published>2025-01-{i % 28 + 1:02d}T10:00:00Z</published>
+<title>Paper {i}</title><summary>{"lorem ipsum " * 120}</summary>
+<author><name>Author {i}</name></author><author><name>Coauthor {i}</name></author>
+<link href="http://arxiv.org/abs/2501.{i:05d}"/>
+<category term="cs.AI"/><category term="cs.LG"/></entry>"""
+        for i in range(entries)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom">{items}</feed>'
+
+
+def make_hf_models(count: int) -> str:
+    return json.dumps([
+        {
+            "id": f"org{i}/model-{i}",
+            "author": f"org{i}",
+            "downloads": i * 10,
+            "likes": i,
+            "tags": ["transformers", "text-generation", f"tag{i % 50}"] * 5,
+            "lastModified": f"2025-01-{i % 28 + 1:02d}T10:00:00.000Z",
+            "siblings": [{"rfilename": f"file{j}.safetensors"} for j in range(20)],
+            "cardData": {"license": "apache-2.0", "language": ["en", "ko"]},
+        }
+        for i in range(count)
+    ])
+
+
+async def start_stub(arxiv_body: str, hf_body: str, port: int) -> web.AppRunner:
+    app = web.Application()
+    app.router.add_get("/arxiv", lambda r: web.Response(text=arxiv_body, content_type="application/atom+xml"))
+    app.router.add_get("/models", lambda r: web.Response(text=hf_body, content_type="application/json"))
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+async def run_mode(mode: str, args) -> dict:
+    configure_executor(mode, args.workers)
+
+    collector = AINewsCollector()
+    collector.sources["arxiv"] = f"http://127.0.0.1:{args.port}/arxiv?max_results="
+    collector.sources["huggingface"] = f"http://127.0.0.1:{args.port}/models"
+
+    monitor = LoopLagMonitor(interval=0.01)
+    monitor.start()
+    started = time.perf_counter()
+    for _ in range(args.rounds):
+        await asyncio.gather(*(
+            collector.fetch_arxiv_papers(10) if i % 2 else collector.fetch_huggingface_models(10)
+            for i in range(args.concurrency)
+        ))
+    elapsed = time.perf_counter() - started
+    await monitor.stop()
+
+    return {"mode": mode, "elapsed_s": round(elapsed, 2), **monitor.stats()}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--arxiv-entries", type=int, default=300)
+    parser.add_argument("--hf-models", type=int, default=3000)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--modes", default="inline,thread,process")
+    args = parser.parse_args()
+
+    runner = await start_stub(make_arxiv_feed(args.arxiv_entries), make_hf_models(args.hf_models), args.port)
+    try:
+        for mode in args.modes.split(","):
+            print(json.dumps(await run_mode(mode, args)))
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,128 @@
+"""
+저장용 레코드 메모리 비교
+
+뉴스 항목(arXiv / HF / GitHub 혼합)과 HF 카탈로그 코퍼스 레코드 10,000개를
+- dict (기존 방식, 항목마다 디코딩된 새 문자열)
+- __slots__ 레코드 + 범주형 문자열 intern (tools/records.py)
+로 보관했을 때 tracemalloc 기준 메모리를 비교합니다.
+
+    python bench/record_memory.py [--items 10000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "server"))
+
+from tools.decoders import decode_arxiv_news, decode_github_news, decode_hf_news  # noqa: E402
+from tools.hf_crawler import normalize_model  # noqa: E402
+from tools.records import ModelRecord, NewsItem  # noqa: E402
+
+AUTHORS = [f"org{i}" for i in range(300)]
+HF_TAGS = ["transformers", "pytorch", "safetensors", "llama", "text-generation", "conversational",
+           "en", "ko", "gguf", "license:apache-2.0", "region:us", "endpoints_compatible"]
+ARXIV_CATEGORIES = ["cs.AI", "cs.LG", "cs.CL", "cs.CV", "stat.ML"]
+LANGUAGES = ["Python", "TypeScript", "Rust", "Jupyter Notebook", None]
+
+
+def arxiv_feed(n: int) -> str:
+    entries = "".join(
+        f"""<entry><id>http://arxiv.org/abs/2501.{i:05d}</id>
+        <title>Paper {i} on scaling laws</title><summary>{'Abstract text. ' * 30}</summary>
+        <published>2025-01-{i % 28 + 1:02d}T00:00:00Z</published>
+        <link href="http://arxiv.org/abs/2501.{i:05d}"/>
+        <author><name>Author {i % 50}</name></author><author><name>Author {i % 70}</name></author>
+        {''.join(f'<category term="{c}"/>' for c in random.sample(ARXIV_CATEGORIES, 2))}
+        </entry>"""
+        for i in range(n)
+    )
+    return f'<feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+
+
+def hf_listing(n: int) -> bytes:
+    return json.dumps([
+        {
+            "id": f"{random.choice(AUTHORS)}/model-{i}",
+            "author": random.choice(AUTHORS),
+            "downloads": random.randint(0, 10**6),
+            "likes": random.randint(0, 1000),
+            "tags": random.sample(HF_TAGS, 6),
+            "pipeline_tag": "text-generation",
+            "library_name": "transformers",
+            "createdAt": "2025-01-01T00:00:00.000Z",
+            "lastModified": f"2025-02-{i % 28 + 1:02d}T00:00:00.000Z",
+        }
+        for i in range(n)
+    ]).encode()
+
+
+def github_search(n: int) -> bytes:
+    return json.dumps({"items": [
+        {
+            "full_name": f"{random.choice(AUTHORS)}/repo-{i}",
+            "description": "An AI project",
+            "stargazers_count": random.randint(0, 5000),
+            "language": random.choice(LANGUAGES),
+            "html_url": f"https://github.com/x/repo-{i}",
+            "created_at": "2025-01-01T00:00:00Z",
+            "topics": random.sample(["llm", "agents", "rag", "ai", "nlp"], 3),
+        }
+        for i in range(n)
+    ]}).encode()
+
+
+def measure(build) -> int:
+    """build()가 만든 객체가 차지하는 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000)
+    args = parser.parse_args()
+    n = args.items
+    random.seed(0)
+
+    # 업스트림 응답 원문 (측정 대상 아님)
+    third = n // 3
+    payloads = (arxiv_feed(third), hf_listing(third), github_search(n - 2 * third))
+    crawl = json.loads(hf_listing(n))
+
+    def news_dicts():
+        return (decode_arxiv_news(payloads[0]) + decode_hf_news(payloads[1])
+                + decode_github_news(payloads[2], n))
+
+    def news_records():
+        return [NewsItem.from_dict(item) for item in news_dicts()]
+
+    def corpus_dicts():
+        return {m["id"]: normalize_model(m) for m in json.loads(json.dumps(crawl))}
+
+    def corpus_records():
+        return {m["id"]: ModelRecord.from_dict(normalize_model(m)) for m in json.loads(json.dumps(crawl))}
+
+    print(f"{'payload':<16} {'dict':>12} {'record':>12} {'saved':>8}")
+    for name, as_dict, as_record in (
+        ("news items", news_dicts, news_records),
+        ("hf corpus", corpus_dicts, corpus_records),
+    ):
+        before = measure(as_dict)
+        after = measure(as_record)
+        print(f"{name:<16} {before / 1e6:>10.2f}MB {after / 1e6:>10.2f}MB {1 - after / before:>7.0%}")
+    print(f"(per {n:,} items)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+stateless 모드 다중 인스턴스 처리량
+
+MCP_STATELESS=1 서버 인스턴스 N개를 같은 SQLite 상태 저장소로 띄우고,
+요청마다 다음 인스턴스로 넘기는 라운드 로빈 프록시 뒤에서 트래픽 로그를 최대 속도로 재생해
+인스턴스 수별 처리량을 비교합니다. (initialize와 tools/call도 서로 다른 인스턴스가 받음)
+업스트림은 bench/upstream_emulator.py가 대신합니다.
+
+인스턴스 하나가 CPU 코어 하나에 해당하도록 카탈로그 조회는 inline, 디코딩은 스레드로 실행합니다.
+코어 수보다 인스턴스가 많으면 처리량은 늘지 않습니다.
+
+병목을 확인할 수 있도록 측정 구간의 CPU 시간도 함께 출력합니다. (Linux /proc/<pid>/stat)
+- server_cpu_ms_per_call: 서버 인스턴스들이 호출 하나에 쓴 CPU 시간 (세션 연결 / 종료 포함)
+- total_cpu_ms_per_call: 서버 + 에뮬레이터 + 이 프로세스(프록시 / 부하 생성기) 합계
+- server_cpu_share: 전체 CPU 시간 중 서버 인스턴스 몫
+- cpu_utilization: 측정 구간 동안 호스트 CPU 사용률
+- cpu_bound_rps: 호스트 CPU를 모두 썼을 때의 처리량 상한 (throughput_rps / cpu_utilization)
+cpu_utilization이 1에 가까워 처리량이 cpu_bound_rps에 닿아 있으면 인스턴스를 늘려도
+같은 코어를 나눠 쓸 뿐이므로 처리량이 그대로입니다.
+
+1 CPU 호스트 측정 예 (--instances 1,2,4 --concurrency 32 --loops 10):
+인스턴스 1 / 2 / 4개에서 62 / 84 / 74 rps, CPU 사용률 0.98 이상,
+호출당 CPU는 서버 7~9ms + 프록시 / 부하 생성기 / 에뮬레이터 약 12~16ms로 서버 몫은 35~38%입니다.
+이 환경의 처리량은 코어 하나에 묶여 있으며, 인스턴스 수에 따른 확장은 코어 수가 인스턴스 수 이상이고
+부하 생성기를 다른 호스트에서 돌릴 때만 확인할 수 있습니다.
+
+    python bench/stateless_scaling.py bench/traffic/sample.jsonl --instances 1,2,4 --concurrency 32 --loops 20
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from load_replay import fetch_server_stats, load_log, replay, schedule, stop_process, wait_for_port  # noqa: E402
+from upstream_emulator import upstream_env  # noqa: E402
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# 프록시가 그대로 넘기지 않는 헤더
+HOP_HEADERS = {"host", "connection", "keep-alive", "transfer-encoding", "content-length", "upgrade"}
+
+
+def cpu_seconds(pid: int) -> float:
+    """프로세스의 user + system CPU 시간(초) (읽을 수 없으면 0)"""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            # 프로세스 이름에 공백이 있을 수 있으므로 ")" 뒤부터 나눔 (utime / stime은 14 / 15번째 필드)
+            fields = f.read().rsplit(")", 1)[1].split()
+    except OSError:
+        return 0.0
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+class RoundRobinProxy:
+    """요청 단위 라운드 로빈 리버스 프록시 (SSE 응답은 받은 대로 흘려보냄)"""
+
+    def __init__(self, backends: List[str]):
+        self.backends = backends
+        self._next = itertools.cycle(backends)
+        self.counts: Counter = Counter()
+        self._session: aiohttp.ClientSession = None
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        backend = next(self._next)
+        self.counts[backend] += 1
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in HOP_HEADERS}
+        async with self._session.request(request.method, backend + request.rel_url.path_qs,
+                                         headers=headers, data=await request.read()) as upstream:
+            response = web.StreamResponse(
+                status=upstream.status,
+                headers={k: v for k, v in upstream.headers.items() if k.lower() not in HOP_HEADERS},
+            )
+            await response.prepare(request)
+            try:
+                async for chunk in upstream.content.iter_any():
+                    await response.write(chunk)
+                await response.write_eof()
+            except ConnectionResetError:
+                pass  # 클라이언트가 먼저 연결을 닫음
+            return response
+
+    async def start(self, port: int) -> web.AppRunner:
+        self._session = aiohttp.ClientSession(auto_decompress=False, timeout=aiohttp.ClientTimeout(total=None))
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", self.handle)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        return runner
+
+    async def close(self, runner: web.AppRunner):
+        await runner.cleanup()
+        await self._session.close()
+
+
+def start_instances(count: int, args, log_dir: str) -> List[subprocess.Popen]:
+    processes = []
+    for i in range(count):
+        port = args.base_port + i
+        env = {
+            **os.environ,
+            **upstream_env("127.0.0.1", args.emulator_port),
+            "MCP_MODE": "sse",
+            "MCP_STATELESS": "1",
+            "PORT": str(port),
+            "STATE_STORE": "sqlite",
+            "STATE_STORE_PATH": os.path.join(log_dir, "state.sqlite3"),
+            "CATALOG_EXECUTOR": "inline",
+            "DECODE_EXECUTOR": "thread",
+            "DECODE_WORKERS": "1",
+        }
+        log = open(os.path.join(log_dir, f"instance-{i}.log"), "w")
+        processes.append(subprocess.Popen([sys.executable, "main.py"], cwd=ROOT / "server", env=env,
+                                          stdout=log, stderr=log, start_new_session=True))
+    for i in range(count):
+        wait_for_port("127.0.0.1", args.base_port + i)
+    return processes
+
+
+async def run(count: int, calls, args, emulator_pid: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = os.path.join(args.log_dir, f"instances-{count}") if args.log_dir else tmp
+        os.makedirs(log_dir, exist_ok=True)
+        processes = start_instances(count, args, log_dir)
+        proxy = RoundRobinProxy([f"http://127.0.0.1:{args.base_port + i}" for i in range(count)])
+        runner = await proxy.start(args.proxy_port)
+        url = f"http://127.0.0.1:{args.proxy_port}/mcp"
+        try:
+            # 캐시 채우기 (어느 인스턴스가 가져오든 공유 저장소에 남음)
+            await replay(url, schedule(calls, 0, 1, 1, None, unthrottled=True), count, args.timeout)
+
+            pids = [process.pid for process in processes]
+            server_cpu = sum(cpu_seconds(pid) for pid in pids)
+            emulator_cpu = cpu_seconds(emulator_pid)
+            own_cpu = time.process_time()
+            started = time.perf_counter()
+            report = await replay(url, schedule(calls, 0, 1, args.loops, None, unthrottled=True), args.concurrency, args.timeout)
+            elapsed = time.perf_counter() - started
+            server_cpu = sum(cpu_seconds(pid) for pid in pids) - server_cpu
+            total_cpu = server_cpu + cpu_seconds(emulator_pid) - emulator_cpu + time.process_time() - own_cpu
+            stores = [fetch_server_stats(f"http://127.0.0.1:{args.base_port + i}/mcp") for i in range(count)]
+        finally:
+            await proxy.close(runner)
+            for process in processes:
+                stop_process(process)
+
+    overall = report["overall"]
+    cpus = os.cpu_count() or 1
+    calls_done = overall["calls"] or 1
+    utilization = total_cpu / (elapsed * cpus) if elapsed else 0
+    return {
+        "instances": count,
+        "cpus": cpus,
+        "calls": overall["calls"],
+        "errors": overall["errors"] + overall["shed"],
+        "throughput_rps": overall["throughput_rps"],
+        "server_cpu_ms_per_call": round(server_cpu * 1000 / calls_done, 2),
+        "total_cpu_ms_per_call": round(total_cpu * 1000 / calls_done, 2),
+        "server_cpu_share": round(server_cpu / total_cpu, 2) if total_cpu else None,
+        "cpu_utilization": round(utilization, 2),
+        "cpu_bound_rps": round(overall["throughput_rps"] / utilization, 1) if utilization else None,
+        "requests_per_instance": sorted(proxy.counts.values()),
+        "state_store_hits": sum((s or {}).get("state_store", {}).get("hits", 0) for s in stores),
+        "state_store_sets": sum((s or {}).get("state_store", {}).get("sets", 0) for s in stores),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", help="JSONL 트래픽 로그")
+    parser.add_argument("--instances", default="1,2,4")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--base-port", type=int, default=8800)
+    parser.add_argument("--proxy-port", type=int, default=8790)
+    parser.add_argument("--emulator-port", type=int, default=9100)
+    parser.add_argument("--emulator-args", default="--latency-ms 50")
+    parser.add_argument("--log-dir", help="인스턴스 로그 / 상태 저장소 위치 (기본 임시 디렉터리)")
+    args = parser.parse_args()
+
+    calls = load_log(args.log)
+    emulator = subprocess.Popen([sys.executable, str(ROOT / "bench" / "upstream_emulator.py"), "serve",
+                                 "--port", str(args.emulator_port), *shlex.split(args.emulator_args)],
+                                stdout=subprocess.DEVNULL, start_new_session=True)
+    try:
+        wait_for_port("127.0.0.1", args.emulator_port)
+        baseline = None
+        for count in (int(n) for n in args.instances.split(",")):
+            result = await run(count, calls, args, emulator.pid)
+            baseline = baseline or result["throughput_rps"] / count
+            result["scaling_efficiency"] = round(result["throughput_rps"] / (baseline * count), 2) if baseline else None
+            print(json.dumps(result))
+    finally:
+        stop_process(emulator)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
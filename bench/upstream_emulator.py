@@ -0,0 +1,375 @@
+"""
+업스트림 에뮬레이터
+
+부하 테스트 중 실제 arXiv / Hugging Face / GitHub / 리더보드를 호출하지 않도록
+같은 경로와 응답 형식을 흉내 내는 로컬 HTTP 서버입니다.
+기본은 합성 응답이며, --payload-dir의 녹화 파일이 있으면 그 내용을 그대로 돌려줍니다.
+지연 / 오류 / 429(rate limit)를 주입할 수 있습니다.
+
+    python bench/upstream_emulator.py serve --port 9100 --latency-ms 120 --jitter-ms 40 --error-rate 0.02
+    python bench/upstream_emulator.py record --payload-dir bench/payloads   # 실제 응답 녹화
+
+서버는 아래 환경 변수로 에뮬레이터를 가리키게 합니다. (serve 시작 시 출력)
+    ARXIV_API_BASE=http://127.0.0.1:9100/arxiv
+    HF_API_BASE=http://127.0.0.1:9100/hf
+    GITHUB_API_BASE=http://127.0.0.1:9100/github
+    ARTIFICIAL_ANALYSIS_URL=http://127.0.0.1:9100/aa/leaderboards/models
+    LMSYS_ARENA_URL=http://127.0.0.1:9100/arena/
+
+실행 중에는 POST /_faults로 장애 설정을 바꾸고 GET /_stats로 호출 수를 볼 수 있습니다.
+    curl -X POST localhost:9100/_faults -d '{"upstream": "arxiv", "error_rate": 0.5}'
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+from aiohttp import web
+
+UPSTREAMS = ("arxiv", "hf", "github", "aa", "arena")
+
+# 녹화 파일 이름과 녹화할 실제 주소
+PAYLOAD_FILES = {
+    "arxiv": "arxiv.xml",
+    "hf": "hf_models.json",
+    "github": "github_repos.json",
+    "aa": "artificial_analysis.html",
+    "arena": "lmsys_arena.html",
+}
+RECORD_URLS = {
+    "arxiv": "http://export.arxiv.org/api/query?search_query=cat:cs.AI+OR+cat:cs.LG+OR+cat:cs.CL"
+             "&sortBy=submittedDate&sortOrder=descending&max_results=100",
+    "hf": "https://huggingface.co/api/models?sort=downloads&direction=-1&limit=100&full=true",
+    "github": "https://api.github.com/search/repositories?q=topic:artificial-intelligence&sort=stars&per_page=100",
+    "aa": "https://artificialanalysis.ai/leaderboards/models",
+    "arena": "https://chat.lmsys.org/",
+}
+
+PIPELINES = ["text-generation", "text-to-image", "translation", "automatic-speech-recognition",
+             "image-classification", "summarization", "feature-extraction", "text-classification"]
+
+LEADERBOARD_MODELS = [
+    # (모델, 제작사, intelligence, speed, price, context, arena elo)
+    ("Gemini 3 Pro Preview (high)", "Google", 73, 136, 4.50, "1m", 1305),
+    ("GPT-5.2 (xhigh)", "OpenAI", 73, 114, 4.81, "400k", 1298),
+    ("Claude Opus 4.5", "Anthropic", 71, 95, 15.00, "200k", 1290),
+    ("Grok 4", "xAI", 68, 70, 6.00, "256k", 1270),
+    ("DeepSeek V3.2", "DeepSeek", 66, 40, 0.32, "128k", 1262),
+    ("Qwen3 235B A22B", "Alibaba", 62, 80, 0.70, "256k", 1245),
+    ("Llama 4 Maverick", "Meta", 51, 150, 0.40, "1m", 1210),
+    ("Mistral Large 2", "Mistral", 47, 60, 3.00, "128k", 1190),
+]
+
+
+# =========================
+# 합성 응답
+# =========================
+
+def _iso(ts: datetime) -> str:
+    return ts.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def synthetic_hf_models(count: int = 200) -> List[Dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    models = []
+    for i in range(count):
+        pipeline = PIPELINES[i % len(PIPELINES)]
+        author = f"org{i % 23}"
+        models.append({
+            "id": f"{author}/model-{i}-{pipeline.split('-')[0]}",
+            "author": author,
+            "downloads": max(10, 2_000_000 // (i + 1)),
+            "likes": max(1, 5000 // (i + 1)),
+            "tags": [pipeline, "pytorch", "en" if i % 3 else "multilingual"],
+            "pipeline_tag": pipeline,
+            "library_name": "transformers",
+            "createdAt": _iso(now - timedelta(days=60 + i)),
+            "lastModified": _iso(now - timedelta(hours=i * 3)),
+        })
+    return models
+
+
+def synthetic_github_repos(count: int = 100) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    items = [
+        {
+            "full_name": f"ai-lab{i % 17}/project-{i}",
+            "description": f"Synthetic AI project {i}",
+            "stargazers_count": max(5, 20_000 // (i + 1)),
+            "language": ["Python", "TypeScript", "Rust", "Go"][i % 4],
+            "html_url": f"https://github.com/ai-lab{i % 17}/project-{i}",
+            "topics": ["artificial-intelligence", "machine-learning"],
+            "created_at": _iso(now - timedelta(hours=i * 5)),
+            "updated_at": _iso(now - timedelta(hours=i)),
+        }
+        for i in range(count)
+    ]
+    return {"total_count": len(items), "items": items}
+
+
+def synthetic_arxiv(count: int) -> str:
+    now = datetime.now(timezone.utc)
+    entries = []
+    for i in range(count):
+        published = _iso(now - timedelta(hours=i * 2)).replace(".000", "")
+        entries.append(f"""  <entry>
+    <id>http://arxiv.org/abs/2601.{10000 + i}v1</id>
+    <published>{published}</published>
+    <updated>{published}</updated>
+    <title>Synthetic Paper {i} on Efficient Language Models</title>
+    <summary>{"We study efficient inference for large language models. " * 12}</summary>
+    <author><name>Author {i}</name></author>
+    <author><name>Coauthor {i}</name></author>
+    <link href="http://arxiv.org/abs/2601.{10000 + i}v1" rel="alternate" type="text/html"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>""")
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+            '  <title>arXiv Query Results</title>\n'
+            + "\n".join(entries) + "\n</feed>\n")
+
+
+def _html_table(headers: List[str], rows: List[List[Any]]) -> str:
+    head = "".join(f"<th>{h}</th>" for h in headers)
+    body = "".join("<tr>" + "".join(f"<td>{c}</td>" for c in row) + "</tr>" for row in rows)
+    return f"<html><body><table><thead><tr>{head}</tr></thead><tbody>{body}</tbody></table></body></html>"
+
+
+def synthetic_artificial_analysis() -> str:
+    return _html_table(
+        ["Model", "Creator", "Intelligence Index", "Speed (tokens/s)", "Price (USD/1M)", "Context Window"],
+        [[m, c, q, s, f"${p:.2f}", ctx] for m, c, q, s, p, ctx, _ in LEADERBOARD_MODELS],
+    )
+
+
+def synthetic_lmsys_arena() -> str:
+    ranked = sorted(LEADERBOARD_MODELS, key=lambda m: -m[6])
+    return _html_table(
+        ["Rank", "Model", "Arena Score", "Organization"],
+        [[i, m, elo, c] for i, (m, c, _, _, _, _, elo) in enumerate(ranked, start=1)],
+    )
+
+
+# =========================
+# 에뮬레이터 서버
+# =========================
+
+class UpstreamEmulator:
+    """녹화 / 합성 응답 + 지연 / 오류 / 429 주입"""
+
+    def __init__(self, payload_dir: Optional[str] = None, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, rate_limit_rate: float = 0, retry_after: int = 1, seed: Optional[int] = None):
+        self.default_faults = {
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+            "error_rate": error_rate,
+            "rate_limit_rate": rate_limit_rate,
+            "retry_after": retry_after,
+        }
+        # 업스트림별 덮어쓰기 (POST /_faults)
+        self.faults: Dict[str, Dict[str, float]] = {}
+        self.random = random.Random(seed)
+        self.counts: Counter = Counter()
+
+        self.recorded: Dict[str, bytes] = {}
+        if payload_dir:
+            for upstream, name in PAYLOAD_FILES.items():
+                path = Path(payload_dir) / name
+                if path.exists():
+                    self.recorded[upstream] = path.read_bytes()
+
+        self.hf_models = synthetic_hf_models()
+        if "hf" in self.recorded:
+            self.hf_models = json.loads(self.recorded["hf"])
+        self.hf_by_id = {m["id"]: m for m in self.hf_models}
+
+    def faults_for(self, upstream: str) -> Dict[str, float]:
+        return {**self.default_faults, **self.faults.get(upstream, {})}
+
+    async def _inject(self, upstream: str) -> Optional[web.Response]:
+        """설정된 지연 후 오류 / 429 응답 (정상이면 None)"""
+        faults = self.faults_for(upstream)
+        delay = faults["latency_ms"] + self.random.uniform(-1, 1) * faults["jitter_ms"]
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        roll = self.random.random()
+        if roll < faults["rate_limit_rate"]:
+            self.counts[f"{upstream}:429"] += 1
+            return web.json_response({"message": "API rate limit exceeded"}, status=429,
+                                     headers={"Retry-After": str(int(faults["retry_after"]))})
+        if roll < faults["rate_limit_rate"] + faults["error_rate"]:
+            self.counts[f"{upstream}:503"] += 1
+            return web.json_response({"message": "Service unavailable"}, status=503)
+        self.counts[f"{upstream}:200"] += 1
+        return None
+
+    async def arxiv(self, request: web.Request) -> web.Response:
+        error = await self._inject("arxiv")
+        if error is not None:
+            return error
+        if "arxiv" in self.recorded:
+            return web.Response(body=self.recorded["arxiv"], content_type="application/atom+xml")
+        count = min(int(request.query.get("max_results", "20")), 200)
+        return web.Response(text=synthetic_arxiv(count), content_type="application/atom+xml")
+
+    async def hf_models_list(self, request: web.Request) -> web.Response:
+        error = await self._inject("hf")
+        if error is not None:
+            return error
+        models = self.hf_models
+        pipeline = request.query.get("pipeline_tag") or request.query.get("filter")
+        if pipeline:
+            models = [m for m in models if m.get("pipeline_tag") == pipeline or pipeline in m.get("tags", [])]
+        sort = request.query.get("sort")
+        descending = request.query.get("direction") == "-1"
+        if sort in ("downloads", "likes"):
+            models = sorted(models, key=lambda m: m.get(sort) or 0, reverse=descending)
+        elif sort in ("lastModified", "createdAt"):
+            models = sorted(models, key=lambda m: m.get(sort) or "", reverse=descending)
+
+        # HF처럼 cursor 기반 페이지네이션 (다음 페이지가 있으면 Link: rel="next")
+        limit = min(int(request.query.get("limit", "100")), 1000)
+        offset = int(request.query.get("cursor", "0"))
+        headers = {}
+        if offset + limit < len(models):
+            next_url = request.url.update_query({"cursor": str(offset + limit)})
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return web.json_response(models[offset:offset + limit], headers=headers)
+
+    async def hf_model_detail(self, request: web.Request) -> web.Response:
+        error = await self._inject("hf")
+        if error is not None:
+            return error
+        model = self.hf_by_id.get(request.match_info["model_id"])
+        if model is None:
+            return web.json_response({"error": "Repository not found"}, status=404)
+        return web.json_response({**model, "cardData": {"license": "apache-2.0", "language": ["en"]}})
+
+    async def github_search(self, request: web.Request) -> web.Response:
+        error = await self._inject("github")
+        if error is not None:
+            return error
+        if "github" in self.recorded:
+            return web.Response(body=self.recorded["github"], content_type="application/json")
+        payload = synthetic_github_repos()
+        per_page = int(request.query.get("per_page", "30"))
+        return web.json_response({**payload, "items": payload["items"][:per_page]})
+
+    async def artificial_analysis(self, request: web.Request) -> web.Response:
+        error = await self._inject("aa")
+        if error is not None:
+            return error
+        body = self.recorded.get("aa") or synthetic_artificial_analysis().encode()
+        return web.Response(body=body, content_type="text/html")
+
+    async def arena(self, request: web.Request) -> web.Response:
+        error = await self._inject("arena")
+        if error is not None:
+            return error
+        body = self.recorded.get("arena") or synthetic_lmsys_arena().encode()
+        return web.Response(body=body, content_type="text/html")
+
+    async def set_faults(self, request: web.Request) -> web.Response:
+        """{"upstream": "arxiv" | 생략(전체), "latency_ms": ..., "error_rate": ...}"""
+        data = await request.json()
+        upstream = data.pop("upstream", None)
+        unknown = set(data) - set(self.default_faults)
+        if unknown or (upstream is not None and upstream not in UPSTREAMS):
+            return web.json_response({"error": f"Unknown fault setting: {sorted(unknown) or upstream}"}, status=400)
+        if upstream is None:
+            self.default_faults.update(data)
+        else:
+            self.faults.setdefault(upstream, {}).update(data)
+        return web.json_response({"default": self.default_faults, "overrides": self.faults})
+
+    async def stats(self, request: web.Request) -> web.Response:
+        return web.json_response({"counts": dict(self.counts), "default": self.default_faults, "overrides": self.faults})
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.add_routes([
+            web.get("/arxiv/api/query", self.arxiv),
+            web.get("/hf/api/models", self.hf_models_list),
+            web.get("/hf/api/models/{model_id:.+}", self.hf_model_detail),
+            web.get("/github/search/repositories", self.github_search),
+            web.get("/aa/leaderboards/models", self.artificial_analysis),
+            web.get("/arena/", self.arena),
+            web.post("/_faults", self.set_faults),
+            web.get("/_stats", self.stats),
+        ])
+        return app
+
+
+def upstream_env(host: str, port: int) -> Dict[str, str]:
+    """서버가 에뮬레이터를 가리키게 하는 환경 변수"""
+    base = f"http://{host}:{port}"
+    return {
+        "ARXIV_API_BASE": f"{base}/arxiv",
+        "HF_API_BASE": f"{base}/hf",
+        "GITHUB_API_BASE": f"{base}/github",
+        "ARTIFICIAL_ANALYSIS_URL": f"{base}/aa/leaderboards/models",
+        "LMSYS_ARENA_URL": f"{base}/arena/",
+    }
+
+
+async def record(payload_dir: str):
+    """실제 업스트림 응답을 녹화 파일로 저장"""
+    out = Path(payload_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    headers = {"User-Agent": "Mozilla/5.0 (compatible; AI-Recommender-MCP)"}
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
+        for upstream, url in RECORD_URLS.items():
+            try:
+                async with session.get(url, headers=headers) as response:
+                    body = await response.read()
+                if response.status != 200:
+                    print(f"{upstream} error: {response.status}", file=sys.stderr)
+                    continue
+                (out / PAYLOAD_FILES[upstream]).write_bytes(body)
+                print(f"{upstream}: {len(body)} bytes -> {out / PAYLOAD_FILES[upstream]}")
+            except Exception as e:
+                print(f"Error recording {upstream}: {e}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="에뮬레이터 실행")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=9100)
+    serve.add_argument("--payload-dir", help="녹화 응답 디렉터리 (없는 파일은 합성 응답)")
+    serve.add_argument("--latency-ms", type=float, default=0)
+    serve.add_argument("--jitter-ms", type=float, default=0)
+    serve.add_argument("--error-rate", type=float, default=0, help="503 응답 비율")
+    serve.add_argument("--rate-limit-rate", type=float, default=0, help="429 응답 비율")
+    serve.add_argument("--retry-after", type=int, default=1)
+    serve.add_argument("--seed", type=int)
+
+    rec = sub.add_parser("record", help="실제 업스트림 응답 녹화")
+    rec.add_argument("--payload-dir", default="bench/payloads")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        asyncio.run(record(args.payload_dir))
+        return
+
+    emulator = UpstreamEmulator(args.payload_dir, args.latency_ms, args.jitter_ms, args.error_rate,
+                                args.rate_limit_rate, args.retry_after, args.seed)
+    for key, value in upstream_env(args.host, args.port).items():
+        print(f"{key}={value}")
+    sys.stdout.flush()
+    web.run_app(emulator.app(), host=args.host, port=args.port, print=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, Optional
 import os
+import asyncio
+from contextlib import asynccontextmanager
 
 # =========================
 # PYTHONPATH 보정 (필수)
@@ -12,7 +14,7 @@ sys.path.insert(0, str(BASE_DIR))
 # =========================
 # MCP
 # =========================
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Context
 
 from tools import (
     AINewsCollector,
@@ -28,69 +30,306 @@ from tools.api_integrations import (
 )
 
 from tools.realtime_collector import (
+    collector,
     get_realtime_rankings,
+    get_ranking_trend,
+    query_models,
+    rankings_ttl,
     recommend_model_for_task,
+    recommendation_ttl,
 )
+from tools.ai_news import aggregate_ttl, news_store
+from tools.model_search_index import model_search_index
+
+from tools.streaming import ChunkStreamer
+from tools.executors import executor_stats
+from tools.loop_monitor import loop_monitor
+from tools.hf_crawler import hf_crawler
+from tools.admission import admission
+from tools.catalog_pool import CatalogQueryPool
+from tools.profiling import profiler, stall_detector
+from tools.state_store import state_store
+from tools.refresh_policy import refresh_policy
+from tools.tracing import tracer
+from tools.cache_warmer import WarmSpec, cache_warmer
+from tools.feeds import Feed, advertise_subscriptions, feed_hub
+
+# 프로세스 단위 백그라운드 작업
+_background_tasks: Dict[str, asyncio.Task] = {}
+
+def ensure_background_task(name: str, factory):
+    """이름별로 한 번만 실행 (끝났거나 죽었으면 다시 시작)"""
+    task = _background_tasks.get(name)
+    if task is None or task.done():
+        _background_tasks[name] = asyncio.get_running_loop().create_task(factory())
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP):
+    """백그라운드 작업 시작 (세션마다 호출되므로 중복 시작하지 않음)"""
+    loop_monitor.start()
+    stall_detector.start()
+    profiler.start()
+    if hf_crawler.enabled:
+        ensure_background_task("hf_crawler", hf_crawler.run_forever)
+    if not STATELESS:
+        ensure_background_task("feed_hub", feed_hub.run_forever)
+    ensure_background_task("cache_warmer", cache_warmer.run_forever)
+    yield {}
+
+# MCP_STATELESS=1: 세션 상태 없이 요청마다 독립 처리 (라운드 로빈 뒤에 여러 인스턴스 배치)
+# 캐시 / 스냅샷은 state_store(STATE_STORE, 기본 sqlite)에 두어 인스턴스 간 공유
+STATELESS = os.getenv("MCP_STATELESS") == "1"
 
 # MCP 서버 초기화
-mcp = FastMCP("AI Recommender MCP")
+mcp = FastMCP("AI Recommender MCP", lifespan=server_lifespan, stateless_http=STATELESS)
 
 agent_catalog = AIAgentCatalog()
 
+# 카탈로그 조회는 불변 스냅샷을 가진 워커 풀에서 실행 (이벤트 루프를 막지 않음)
+catalog_pool = CatalogQueryPool(agent_catalog.snapshot())
+
 # =========================
 # MCP Tools
 # =========================
 
+# 결과를 캐시하고 자주 쓰이는 인자 조합을 미리 예열할 도구
+# (캐시 키 인자, 결과가 의존하는 캐시의 TTL, 결과가 의존하는 상태의 버전)
+WARM_TOOLS = {
+    # since / next_cursor 토큰은 뉴스 저장소에 항목이 추가되면 바뀜
+    "get_ai_news": WarmSpec(("category", "limit"), ttl=lambda args: aggregate_ttl(args["limit"]),
+                            version=lambda: news_store.version),
+    "search_model_for_task": WarmSpec(("task",), version=lambda: model_search_index.version),
+    "recommend_model": WarmSpec(("task",), ttl=lambda args: recommendation_ttl()),
+    "realtime_model_rankings": WarmSpec(("benchmark",), ttl=lambda args: rankings_ttl(args["benchmark"])),
+}
+
+def tool_guard(func):
+    """업스트림 / 워커 풀을 쓰는 도구 공통 래퍼
+    
+    - admission: 동시 실행 수 제한 (부하가 몰리면 대기열 → 최근 결과 → 재시도 가능 오류)
+    - cache_warmer: WARM_TOOLS 도구의 결과 캐시와 빈도 상위 인자 예열 (적중하면 수락 제어를 거치지 않음)
+    - profiler: 표본 / 느린 호출의 스택 샘플 저장 (PROFILE_* 설정 시)
+    - tracer: 캐시 / 업스트림 / 파싱 / 직렬화 단계별 span 트리 기록 (TRACE_* 설정 시)
+    """
+    guarded = cache_warmer.wrap(admission.guard(func), WARM_TOOLS.get(func.__name__))
+    return tracer.wrap(profiler.wrap(guarded))
+
 @mcp.tool()
-def list_ai_agents(category: str = "all", subcategory: Optional[str] = None) -> Dict[str, Any]:
-    """AI Agent 목록을 카테고리별로 조회합니다."""
-    return agent_catalog.list_agents(category, subcategory)
+@tool_guard
+async def list_ai_agents(
+    category: str = "all",
+    subcategory: Optional[str] = None,
+    fields: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """AI Agent 목록을 카테고리별로 조회합니다.
+    
+    - fields: 필요한 필드만 쉼표로 지정합니다. (예: "id,name,url")
+    - offset / limit 또는 이전 응답의 next_cursor로 페이지 단위 조회를 합니다.
+    """
+    return await catalog_pool.query("list_agents", category, subcategory, fields, offset, limit, cursor)
 
 @mcp.tool()
-def search_ai_agents(query: str) -> Dict[str, Any]:
-    """키워드로 AI Agent를 검색합니다."""
-    return agent_catalog.search_agents(query)
+@tool_guard
+async def search_ai_agents(
+    query: str,
+    fields: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> Dict[str, Any]:
+    """키워드로 AI Agent를 검색합니다.
+    
+    - fields: 필요한 필드만 쉼표로 지정합니다. (예: "id,name", relevance_score는 항상 포함)
+    - offset / limit 또는 이전 응답의 next_cursor로 페이지 단위 조회를 합니다.
+    """
+    return await catalog_pool.query("search_agents", query, None, fields, offset, limit, cursor)
 
 @mcp.tool()
-def recommend_ai_agent(task: str, experience_level: str = "intermediate", budget: str = "any") -> Dict[str, Any]:
-    """특정 작업에 맞는 AI Agent를 추천합니다."""
-    return agent_catalog.recommend_for_task(task, experience_level, budget)
+@tool_guard
+async def recommend_ai_agent(
+    task: str,
+    experience_level: str = "intermediate",
+    budget: str = "any",
+    fields: Optional[str] = None,
+    limit: int = 5,
+) -> Dict[str, Any]:
+    """특정 작업에 맞는 AI Agent를 추천합니다.
+    
+    fields를 지정하면 추천된 agent 정보는 해당 필드만 반환합니다. (예: "id,name,url")
+    """
+    return await catalog_pool.query("recommend_for_task", task, experience_level, budget, fields, limit)
 
 @mcp.tool()
-async def get_ai_news(category: str = "all", limit: int = 10):
-    """최신 AI 뉴스와 논문을 가져옵니다."""
-    return await get_cached_news(category, limit)
+@tool_guard
+async def get_ai_news(
+    category: str = "all",
+    limit: int = 10,
+    cursor: Optional[str] = None,
+    since: Optional[str] = None,
+    source: Optional[str] = None,
+    tag: Optional[str] = None,
+    fields: Optional[str] = None,
+    stream: bool = False,
+    ctx: Context = None,
+):
+    """최신 AI 뉴스와 논문을 가져옵니다.
+    
+    - cursor: 이전 응답의 next_cursor를 넘기면 더 과거 항목을 이어서 조회합니다.
+    - since: 이전 응답의 since 토큰을 넘기면 그 이후 추가된 항목만 반환합니다.
+    - source / tag: 소스("arXiv", "Hugging Face", "GitHub") 또는 태그로 필터링합니다.
+    - fields: 항목마다 필요한 필드만 쉼표로 지정합니다. (예: "title,url,timestamp")
+    - stream=True이면 소스별 결과를 도착하는 즉시 알림으로 보내고 마지막에 병합 결과를 반환합니다.
+    """
+    on_chunk = ChunkStreamer(ctx, total=3, logger="get_ai_news") if stream and ctx else None
+    return await get_cached_news(category, limit, on_chunk, cursor, since, source, tag, fields)
 
 @mcp.tool()
+@tool_guard
 async def get_trending_models(limit: int = 10):
     """트렌딩 AI 모델을 가져옵니다."""
     return await get_trending_ai_models(limit)
 
 @mcp.tool()
+@tool_guard
 async def search_model_for_task(task: str):
     """작업에 맞는 모델을 검색합니다."""
     return await search_models(task)
 
 @mcp.tool()
+@tool_guard
 async def latest_ai_research(max_results: int = 10):
     """최신 AI 연구 논문을 가져옵니다."""
     return await get_latest_ai_research(max_results)
 
 @mcp.tool()
-async def ai_overview():
-    """AI 생태계 종합 업데이트를 가져옵니다."""
-    return await get_all_updates()
+@tool_guard
+async def ai_overview(stream: bool = False, ctx: Context = None):
+    """AI 생태계 종합 업데이트를 가져옵니다.
+    
+    stream=True이면 소스별 결과를 도착하는 즉시 알림으로 보내고 마지막에 종합 결과를 반환합니다.
+    """
+    on_chunk = ChunkStreamer(ctx, total=3, logger="ai_overview") if stream and ctx else None
+    return await get_all_updates(on_chunk)
 
 @mcp.tool()
+@tool_guard
 async def realtime_model_rankings(benchmark: str = "artificial-analysis"):
     """실시간 AI 모델 순위를 가져옵니다."""
     return await get_realtime_rankings(benchmark)
 
 @mcp.tool()
+@tool_guard
+async def model_ranking_trend(model: Optional[str] = None, benchmark: str = "artificial-analysis", days: int = 90):
+    """모델 순위 지표(intelligence_index, speed, 가격, 순위)의 기간별 추이를 가져옵니다.
+    
+    model을 생략하면 기간 내 순위 변동이 큰 모델 목록을 반환합니다.
+    """
+    return await get_ranking_trend(model, benchmark, days)
+
+@mcp.tool()
+@tool_guard
+async def find_models(
+    min_context: Optional[str] = None,
+    max_price: Optional[float] = None,
+    min_speed: float = 0,
+    min_intelligence: float = 0,
+    maximize: str = "intelligence",
+    limit: int = 5,
+):
+    """조건에 맞는 LLM을 찾습니다. (예: min_context="400k", max_price=5, maximize="speed")
+    
+    maximize: intelligence | speed | context | price(낮을수록 좋음)
+    """
+    return await query_models(min_context or 0, max_price, min_speed, min_intelligence, maximize, limit)
+
+@mcp.tool()
+@tool_guard
 async def recommend_model(task: str):
     """작업에 최적화된 모델을 추천합니다."""
     return await recommend_model_for_task(task)
 
+# =========================
+# MCP Resources (구독 가능한 피드)
+# =========================
+
+# 피드 하나에 담는 항목 수
+FEED_SIZE = 20
+
+async def _news_feed():
+    return (await get_cached_news("all", FEED_SIZE))["items"]
+
+async def _trending_feed():
+    return await get_trending_ai_models(FEED_SIZE)
+
+async def _aa_rankings_feed():
+    return (await get_realtime_rankings("artificial-analysis"))["models"]
+
+async def _arena_rankings_feed():
+    return (await get_realtime_rankings("lmsys-arena"))["models"]
+
+FEEDS = [
+    Feed("airec://news/latest", "ai-news", "최신 AI 뉴스 / 논문 / 프로젝트 (새 항목이 수집되면 알림)",
+         _news_feed, "url", ("title", "url", "source", "type", "timestamp"), ("timestamp",)),
+    Feed("airec://models/trending", "trending-models", "트렌딩 AI 모델 (새 모델 / 순위 변동 시 알림)",
+         _trending_feed, "name", ("name", "author", "downloads", "pipeline_tag"), ranked=True),
+    Feed("airec://rankings/artificial-analysis", "rankings-artificial-analysis", "Artificial Analysis 모델 순위 (지표 / 순위 변동 시 알림)",
+         _aa_rankings_feed, "model", ("model", "creator", "intelligence_index"), ("intelligence_index", "speed", "price_per_1m"), ranked=True),
+    Feed("airec://rankings/lmsys-arena", "rankings-lmsys-arena", "LMSYS Chatbot Arena 순위 (Elo / 순위 변동 시 알림)",
+         _arena_rankings_feed, "model", ("model", "organization", "elo_rating"), ("elo_rating",), ranked=True),
+]
+
+def register_feed_resource(feed: Feed):
+    """피드를 읽기 전용 리소스로 등록"""
+    feed_hub.register(feed)
+    
+    @mcp.resource(feed.uri, name=feed.name, description=feed.description, mime_type="application/json")
+    async def read_feed() -> Dict[str, Any]:
+        return await feed_hub.read(feed.uri)
+
+for _feed in FEEDS:
+    register_feed_resource(_feed)
+
+# stateless 모드는 요청이 끝나면 세션도 끝나므로 구독을 받지 않음
+if not STATELESS:
+    advertise_subscriptions(mcp._mcp_server)
+    
+    @mcp._mcp_server.subscribe_resource()
+    async def subscribe_feed(uri):
+        feed_hub.subscribe(str(uri), mcp.get_context().session)
+    
+    @mcp._mcp_server.unsubscribe_resource()
+    async def unsubscribe_feed(uri):
+        feed_hub.unsubscribe(str(uri), mcp.get_context().session)
+
+# =========================
+# 운영 지표
+# =========================
+
+@mcp.custom_route("/stats", methods=["GET"])
+async def server_stats(request):
+    """이벤트 루프 지연 / 정지, 실행기 설정, 수락 제어, 캐시 예열, 프로파일링, 추적, 피드, 갱신 주기, 상태 저장소 통계"""
+    from starlette.responses import JSONResponse
+    
+    return JSONResponse({
+        "event_loop_lag": loop_monitor.stats(),
+        "executors": executor_stats(),
+        "hf_crawler": hf_crawler.status(),
+        "leaderboards": collector.ingest_stats(),
+        "admission": admission.stats(),
+        "cache_warming": cache_warmer.stats(),
+        "catalog": catalog_pool.stats(),
+        "profiling": profiler.stats(),
+        "loop_stalls": stall_detector.stats(),
+        "tracing": tracer.stats(),
+        "feeds": feed_hub.stats(),
+        "refresh": refresh_policy.stats(),
+        "stateless": STATELESS,
+        "state_store": state_store.stats(),
+    })
+
 def get_mcp_app():
     from starlette.applications import Starlette
     from starlette.routing import Route
@@ -120,6 +359,8 @@ def get_mcp_app():
                         {"name": "latest_ai_research", "description": "최신 AI 연구"},
                         {"name": "ai_overview", "description": "AI 생태계 업데이트"},
                         {"name": "realtime_model_rankings", "description": "실시간 모델 순위"},
+                        {"name": "model_ranking_trend", "description": "모델 순위 추이"},
+                        {"name": "find_models", "description": "조건 기반 모델 조회"},
                         {"name": "recommend_model", "description": "모델 추천"}
                     ]
                 }
@@ -161,5 +402,9 @@ if __name__ == "__main__":
         
         uvicorn.run = patched_run
         
+        # uvicorn.run을 거치지 않는 FastMCP 버전도 같은 주소로 실행되도록
+        mcp.settings.host = host
+        mcp.settings.port = port
+        
         # 이제 mcp.run() 호출하면 패치된 uvicorn 사용
         mcp.run(transport="streamable-http")
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+도구 호출 수락 제어 (부하 차단)
+
+요청이 몰릴 때 모든 호출을 받아들이면 각 호출이 업스트림 요청을 여러 개 띄우면서
+메모리와 대기 시간이 끝없이 늘어납니다.
+- 전역 / 도구별 동시 실행 수 제한
+- 제한에 걸린 요청은 크기가 정해진 대기열에서 마감 시간까지만 대기
+- 대기열이 가득 찼거나 마감 안에 실행될 수 없으면 바로 실패 (재시도 가능 오류)
+  단, 같은 인자로 성공한 결과가 ADMISSION_STALE_MAX_AGE 안에 있으면 그 결과를 대신 반환
+
+환경 변수
+- ADMISSION_GLOBAL_LIMIT: 전체 동시 실행 수 (기본 16)
+- ADMISSION_TOOL_LIMIT: 도구별 기본 동시 실행 수 (기본 4)
+- ADMISSION_TOOL_LIMITS: 도구별 개별 설정 (예: "ai_overview=2,get_ai_news=6")
+- ADMISSION_QUEUE_SIZE: 전체 대기열 크기 (기본 64)
+- ADMISSION_QUEUE_TIMEOUT: 대기 마감 시간(초, 기본 10)
+- ADMISSION_STALE_MAX_AGE: 부하 차단 시 대신 반환할 결과의 최대 나이(초, 기본 600)
+"""
+
+import asyncio
+import functools
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, Tuple
+
+
+class Overloaded(Exception):
+    """수락 거부 (잠시 후 재시도 가능)"""
+
+    def __init__(self, tool: str, reason: str, retry_after: float):
+        self.tool = tool
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Server busy ({reason}) for {tool}, retryable: retry after {retry_after:.0f}s")
+
+
+def parse_tool_limits(spec: str) -> Dict[str, int]:
+    """"tool=2,other=4" → {"tool": 2, "other": 4}"""
+    limits = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        name, _, value = part.partition("=")
+        try:
+            limits[name.strip()] = int(value)
+        except ValueError:
+            print(f"Invalid admission limit: {part}", file=sys.stderr)
+    return limits
+
+
+class _ToolState:
+    """도구별 세마포어와 통계"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        # 실행 시간 지수 이동 평균 (대기 예상 시간 계산용)
+        self.avg_service_s = 0.0
+        self.stats = {"admitted": 0, "queued": 0, "shed_queue_full": 0, "shed_deadline": 0, "shed_disabled": 0,
+                      "served_cached": 0}
+
+
+class AdmissionController:
+    """전역 / 도구별 동시 실행 제한과 마감 시간이 있는 대기열"""
+
+    def __init__(self, global_limit: Optional[int] = None, tool_limit: Optional[int] = None,
+                 tool_limits: Optional[Dict[str, int]] = None, queue_size: Optional[int] = None,
+                 queue_timeout: Optional[float] = None, cache_size: int = 256,
+                 stale_max_age: Optional[float] = None):
+        self.global_limit = global_limit if global_limit is not None else int(os.getenv("ADMISSION_GLOBAL_LIMIT", "16"))
+        self.tool_limit = tool_limit if tool_limit is not None else int(os.getenv("ADMISSION_TOOL_LIMIT", "4"))
+        self.tool_limits = tool_limits if tool_limits is not None else parse_tool_limits(os.getenv("ADMISSION_TOOL_LIMITS", ""))
+        self.queue_size = queue_size if queue_size is not None else int(os.getenv("ADMISSION_QUEUE_SIZE", "64"))
+        self.queue_timeout = queue_timeout if queue_timeout is not None else float(os.getenv("ADMISSION_QUEUE_TIMEOUT", "10"))
+        self.stale_max_age = stale_max_age if stale_max_age is not None else float(os.getenv("ADMISSION_STALE_MAX_AGE", "600"))
+
+        self.semaphore = asyncio.Semaphore(self.global_limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.tools: Dict[str, _ToolState] = {}
+
+        # (도구, 인자) → (저장 시각, 마지막 성공 결과) (부하 차단 시 대체 응답)
+        self.cache_size = cache_size
+        self._last_results: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def _tool(self, tool: str) -> _ToolState:
+        if tool not in self.tools:
+            self.tools[tool] = _ToolState(self.tool_limits.get(tool, self.tool_limit))
+        return self.tools[tool]
+
+    def expected_wait(self, state: _ToolState) -> float:
+        """지금 대기열에 들어가면 실행까지 걸릴 것으로 예상되는 시간(초)"""
+        tool_wait = (state.waiting + 1) / state.limit * state.avg_service_s
+        global_wait = (self.waiting + 1) / self.global_limit * state.avg_service_s
+        return max(tool_wait, global_wait)
+
+    async def _acquire(self, state: _ToolState):
+        # 도구 슬롯을 먼저 잡아, 도구 제한에 걸린 요청이 전역 슬롯을 차지하지 않도록
+        await state.semaphore.acquire()
+        try:
+            await self.semaphore.acquire()
+        except BaseException:
+            state.semaphore.release()
+            raise
+
+    @asynccontextmanager
+    async def slot(self, tool: str):
+        """실행 슬롯 확보 (대기열이 가득 찼거나 마감 안에 못 받으면 Overloaded)"""
+        state = self._tool(tool)
+
+        if state.limit <= 0 or self.global_limit <= 0:
+            # 동시 실행 수 0 = 해당 도구(또는 전체) 실행하지 않음
+            state.stats["shed_disabled"] += 1
+            raise Overloaded(tool, "disabled", self.queue_timeout)
+
+        if state.semaphore.locked() or self.semaphore.locked():
+            if self.waiting >= self.queue_size:
+                state.stats["shed_queue_full"] += 1
+                raise Overloaded(tool, "queue full", self.expected_wait(state) or 1)
+            if self.expected_wait(state) > self.queue_timeout:
+                state.stats["shed_deadline"] += 1
+                raise Overloaded(tool, "deadline", self.expected_wait(state))
+
+            state.stats["queued"] += 1
+            self.waiting += 1
+            state.waiting += 1
+            try:
+                await asyncio.wait_for(self._acquire(state), self.queue_timeout)
+            except asyncio.TimeoutError:
+                state.stats["shed_deadline"] += 1
+                raise Overloaded(tool, "deadline", self.expected_wait(state) or 1)
+            finally:
+                self.waiting -= 1
+                state.waiting -= 1
+        else:
+            await self._acquire(state)
+
+        state.stats["admitted"] += 1
+        self.in_flight += 1
+        state.in_flight += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            state.avg_service_s = elapsed if state.avg_service_s == 0 else 0.8 * state.avg_service_s + 0.2 * elapsed
+            self.in_flight -= 1
+            state.in_flight -= 1
+            self.semaphore.release()
+            state.semaphore.release()
+
+    # =========================
+    # 도구 래퍼
+    # =========================
+
+    @staticmethod
+    def _cache_key(tool: str, kwargs: Dict[str, Any]) -> str:
+        args = {k: v for k, v in kwargs.items() if k != "ctx"}
+        return tool + ":" + json.dumps(args, sort_keys=True, default=str)
+
+    def _remember(self, key: str, result: Any):
+        self._last_results[key] = (time.monotonic(), result)
+        self._last_results.move_to_end(key)
+        while len(self._last_results) > self.cache_size:
+            self._last_results.popitem(last=False)
+
+    def _recent_result(self, key: str) -> Optional[Any]:
+        """stale_max_age 안에 저장된 결과 (오래된 결과는 버림)"""
+        entry = self._last_results.get(key)
+        if entry is None:
+            return None
+        stored, result = entry
+        if time.monotonic() - stored > self.stale_max_age:
+            del self._last_results[key]
+            return None
+        return result
+
+    def guard(self, func):
+        """비동기 도구 함수에 수락 제어 적용 (시그니처는 그대로 유지)"""
+        tool = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = self._cache_key(tool, kwargs)
+            try:
+                async with self.slot(tool):
+                    result = await func(*args, **kwargs)
+            except Overloaded:
+                cached = self._recent_result(key)
+                if cached is None:
+                    raise
+                self._tool(tool).stats["served_cached"] += 1
+                return {**cached, "stale": True} if isinstance(cached, dict) else cached
+            self._remember(key, result)
+            return result
+
+        return wrapper
+
+    def stats(self) -> Dict[str, Any]:
+        totals: Dict[str, int] = {}
+        for state in self.tools.values():
+            for name, value in state.stats.items():
+                totals[name] = totals.get(name, 0) + value
+        return {
+            "global_limit": self.global_limit,
+            "queue_size": self.queue_size,
+            "queue_timeout_s": self.queue_timeout,
+            "stale_max_age_s": self.stale_max_age,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            **totals,
+            "tools": {
+                name: {
+                    "limit": state.limit,
+                    "in_flight": state.in_flight,
+                    "waiting": state.waiting,
+                    "avg_service_ms": round(state.avg_service_s * 1000, 1),
+                    **state.stats,
+                }
+                for name, state in self.tools.items()
+            },
+        }
+
+
+admission = AdmissionController()
@@ -1,13 +1,38 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple, Union
+import copy
+import heapq
 import json
 from pathlib import Path
 
+from .keyword_matcher import agent_task_matcher
+from .projection import page_meta, page_window, paginate, parse_fields, project
+
+class CatalogSnapshot(NamedTuple):
+    """워커에 넘기는 불변 카탈로그 스냅샷"""
+    version: int
+    agents: Tuple[Dict[str, Any], ...]
+    categories: Dict[str, Any]
+
 class AIAgentCatalog:
     """AI Agent 데이터베이스 및 추천 시스템"""
     
     def __init__(self):
         self.agents = self._load_agent_catalog()
         self.categories = self._load_categories()
+        self.version = 1
+    
+    def snapshot(self) -> CatalogSnapshot:
+        """현재 카탈로그의 불변 사본 (이후 원본이 바뀌어도 영향 없음)"""
+        return CatalogSnapshot(self.version, tuple(copy.deepcopy(self.agents)), copy.deepcopy(self.categories))
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: CatalogSnapshot) -> "AIAgentCatalog":
+        """스냅샷으로 조회 전용 카탈로그 생성 (워커용)"""
+        catalog = cls.__new__(cls)
+        catalog.agents = snapshot.agents
+        catalog.categories = snapshot.categories
+        catalog.version = snapshot.version
+        return catalog
     
     def _load_agent_catalog(self) -> List[Dict[str, Any]]:
         """Agent 카탈로그 로드 (실제로는 JSON 파일이나 DB에서)"""
@@ -306,8 +331,13 @@ class AIAgentCatalog:
             }
         }
     
-    def list_agents(self, category: str = "all", subcategory: str = None) -> Dict[str, Any]:
-        """Agent 목록 반환"""
+    def list_agents(self, category: str = "all", subcategory: str = None,
+                    fields: Union[str, Sequence[str], None] = None, offset: int = 0,
+                    limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Agent 목록 반환
+        
+        fields("id,name")를 주면 해당 필드만, offset / limit 또는 cursor로 페이지 단위로 반환합니다.
+        """
         filtered = self.agents
         
         if category != "all":
@@ -316,19 +346,26 @@ class AIAgentCatalog:
         if subcategory:
             filtered = [a for a in filtered if a["subcategory"] == subcategory]
         
+        agents, page = paginate(filtered, parse_fields(fields), offset, limit, cursor, self.version)
         return {
             "category": category,
             "subcategory": subcategory,
             "count": len(filtered),
-            "agents": filtered
+            **page,
+            "agents": agents
         }
     
-    def search_agents(self, query: str, filters: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Agent 검색"""
+    def search_agents(self, query: str, filters: Dict[str, Any] = None,
+                      fields: Union[str, Sequence[str], None] = None, offset: int = 0,
+                      limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+        """Agent 검색
+        
+        점수만 계산해 두고, 요청된 페이지의 항목만 (필요한 필드로) 만듭니다.
+        """
         query_lower = query.lower()
-        results = []
+        scored = []  # (점수, 순번) - 같은 점수면 카탈로그 순서 유지
         
-        for agent in self.agents:
+        for position, agent in enumerate(self.agents):
             score = 0
             
             # 이름 매칭
@@ -352,48 +389,33 @@ class AIAgentCatalog:
                     continue
             
             if score > 0:
-                results.append({
-                    **agent,
-                    "relevance_score": score
-                })
+                scored.append((-score, position))
         
-        # 관련도순 정렬
-        results.sort(key=lambda x: x["relevance_score"], reverse=True)
+        # 관련도순 정렬 (요청 페이지 끝까지만)
+        start, end = page_window(len(scored), offset, limit, cursor, self.version)
+        ranked = heapq.nsmallest(end, scored) if end < len(scored) else sorted(scored)
+        field_names = parse_fields(fields)
+        results = [
+            project(self.agents[position], field_names, {"relevance_score": -neg_score})
+            for neg_score, position in ranked[start:end]
+        ]
         
         return {
             "query": query,
             "filters": filters,
-            "count": len(results),
+            "count": len(scored),
+            **page_meta(len(scored), start, end, self.version),
             "results": results
         }
     
-    def recommend_for_task(self, task: str, experience_level: str, budget: str) -> Dict[str, Any]:
-        """작업에 맞는 Agent 추천"""
+    def recommend_for_task(self, task: str, experience_level: str, budget: str,
+                           fields: Union[str, Sequence[str], None] = None, limit: int = 5) -> Dict[str, Any]:
+        """작업에 맞는 Agent 추천 (fields를 주면 agent 정보는 해당 필드만)"""
         task_lower = task.lower()
         recommendations = []
         
-        # 키워드 기반 매칭
-        task_keywords = {
-            "게임": ["game-dev"],
-            "game": ["game-dev"],
-            "앱": ["app-dev"],
-            "app": ["app-dev"],
-            "웹": ["web-dev"],
-            "web": ["web-dev"],
-            "코딩": ["coding"],
-            "coding": ["coding"],
-            "연구": ["literature-review", "data-analysis"],
-            "research": ["literature-review", "data-analysis"],
-            "이미지": ["image-generation"],
-            "image": ["image-generation"],
-            "글": ["writing"],
-            "writing": ["writing"]
-        }
-        
-        relevant_subcategories = []
-        for keyword, subcats in task_keywords.items():
-            if keyword in task_lower:
-                relevant_subcategories.extend(subcats)
+        # 키워드 기반 매칭 (단일 패스)
+        relevant_subcategories = agent_task_matcher.classify(task_lower)
         
         for agent in self.agents:
             score = 0
@@ -431,10 +453,17 @@ class AIAgentCatalog:
         # 점수순 정렬
         recommendations.sort(key=lambda x: x["match_score"], reverse=True)
         
+        # 상위 limit개만, 요청된 필드로
+        field_names = parse_fields(fields)
+        top = [
+            {**rec, "agent": project(rec["agent"], field_names)}
+            for rec in recommendations[:limit]
+        ]
+        
         return {
             "task": task,
             "experience_level": experience_level,
             "budget": budget,
-            "recommendations": recommendations[:5],  # 상위 5개
+            "recommendations": top,
             "total_found": len(recommendations)
         }
\ No newline at end of file
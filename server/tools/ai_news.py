@@ -1,18 +1,59 @@
 import aiohttp
 import asyncio
-from typing import List, Dict, Any
+import heapq
+import sys
+from itertools import islice
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
 from datetime import datetime, timedelta
-import feedparser
-from bs4 import BeautifulSoup
+
+from .decoders import decode_arxiv_news, decode_github_news, decode_hf_news
+from .executors import run_decode
+from .news_store import NewsStore
+from .projection import parse_fields, project
+from .refresh_policy import refresh_policy
+from .state_store import state_store
+from .tracing import http_trace_config, span
+from .upstreams import ARXIV_QUERY_URL, GITHUB_SEARCH_REPOS_URL, HF_MODELS_URL
+
+# 부분 결과 전달 콜백 (스트리밍 모드)
+ChunkCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# 카테고리 → 항목 타입
+CATEGORY_TYPES = {
+    "research": ["research"],
+    "industry": ["model", "project"],
+    "products": ["model"]
+}
+
+# 소스 이름 → 갱신 주기 / 소스 캐시 키
+NEWS_SOURCES = {
+    "arXiv": "arxiv",
+    "Hugging Face": "huggingface",
+    "GitHub": "github_trending",
+}
+
+def per_source_limit(limit: int) -> int:
+    """집계 limit → 소스별로 가져올 항목 수"""
+    return limit // 3 + 1
+
+def refresh_key(source_key: str, per_source: int) -> str:
+    """소스 + 가져온 항목 수별 갱신 주기 키
+
+    항목 수가 다르면 내용 지문도 다르므로, 같은 소스라도 limit마다 따로 관측해야
+    limit이 번갈아 들어올 때 매번 변경으로 보고 주기가 최소로 줄어드는 일이 없습니다.
+    """
+    return f"{source_key}:{per_source}"
 
 class AINewsCollector:
     """AI 뉴스를 다양한 소스에서 수집하는 클래스"""
     
-    def __init__(self):
+    def __init__(self, store: Optional[NewsStore] = None):
+        # 수집한 항목을 색인해 둘 저장소 (선택)
+        self.store = store
         self.sources = {
-            "arxiv": "http://export.arxiv.org/api/query?search_query=cat:cs.AI+OR+cat:cs.LG+OR+cat:cs.CL&sortBy=submittedDate&sortOrder=descending&max_results=",
-            "huggingface": "https://huggingface.co/api/models",
-            "github_trending": "https://api.github.com/search/repositories?q=topic:artificial-intelligence+created:>{}",
+            "arxiv": f"{ARXIV_QUERY_URL}?search_query=cat:cs.AI+OR+cat:cs.LG+OR+cat:cs.CL&sortBy=submittedDate&sortOrder=descending&max_results=",
+            "huggingface": HF_MODELS_URL,
+            "github_trending": GITHUB_SEARCH_REPOS_URL + "?q=topic:artificial-intelligence+created:>{}",
         }
     
     async def fetch_arxiv_papers(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -20,26 +61,12 @@ class AINewsCollector:
         try:
             url = self.sources["arxiv"] + str(limit)
             
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
                 async with session.get(url) as response:
-                    content = await response.text()
-            
-            feed = feedparser.parse(content)
-            papers = []
-            
-            for entry in feed.entries:
-                papers.append({
-                    "title": entry.title,
-                    "authors": [author.name for author in entry.authors],
-                    "summary": entry.summary[:300] + "...",
-                    "published": entry.published,
-                    "url": entry.link,
-                    "categories": [tag.term for tag in entry.tags],
-                    "source": "arXiv",
-                    "type": "research"
-                })
+                    content = await response.read()
             
-            return papers
+            # 피드 파싱은 이벤트 루프 밖에서
+            return await run_decode(decode_arxiv_news, content)
         except Exception as e:
             print(f"Error fetching arXiv papers: {e}")
             return []
@@ -47,35 +74,21 @@ class AINewsCollector:
     async def fetch_huggingface_models(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Hugging Face에서 최신 모델 정보 가져오기"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
                 params = {
                     "sort": "lastModified",
                     "direction": -1,
                     "limit": limit,
-                    "full": True
+                    "full": "true"
                 }
                 async with session.get(self.sources["huggingface"], params=params) as response:
                     if response.status == 200:
-                        models = await response.json()
+                        raw = await response.read()
                     else:
                         return []
             
-            formatted_models = []
-            for model in models:
-                formatted_models.append({
-                    "title": f"New Model: {model.get('id', 'Unknown')}",
-                    "model_id": model.get('id'),
-                    "author": model.get('author', 'Unknown'),
-                    "downloads": model.get('downloads', 0),
-                    "likes": model.get('likes', 0),
-                    "tags": model.get('tags', []),
-                    "last_modified": model.get('lastModified'),
-                    "url": f"https://huggingface.co/{model.get('id')}",
-                    "source": "Hugging Face",
-                    "type": "model"
-                })
-            
-            return formatted_models
+            # full=True 응답은 크므로 JSON 디코딩도 이벤트 루프 밖에서
+            return await run_decode(decode_hf_news, raw)
         except Exception as e:
             print(f"Error fetching Hugging Face models: {e}")
             return []
@@ -86,90 +99,168 @@ class AINewsCollector:
             date_filter = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
             url = self.sources["github_trending"].format(date_filter)
             
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
                 headers = {"Accept": "application/vnd.github.v3+json"}
                 async with session.get(url, headers=headers) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        repos = data.get('items', [])[:limit]
+                        raw = await response.read()
                     else:
                         return []
             
-            projects = []
-            for repo in repos:
-                projects.append({
-                    "title": repo.get('full_name'),
-                    "description": repo.get('description', ''),
-                    "stars": repo.get('stargazers_count', 0),
-                    "language": repo.get('language', 'Unknown'),
-                    "url": repo.get('html_url'),
-                    "created_at": repo.get('created_at'),
-                    "topics": repo.get('topics', []),
-                    "source": "GitHub",
-                    "type": "project"
-                })
-            
-            return projects
+            return await run_decode(decode_github_news, raw, limit)
         except Exception as e:
             print(f"Error fetching GitHub trending: {e}")
             return []
     
-    async def get_ai_news_aggregated(self, category: str = "all", limit: int = 10) -> Dict[str, Any]:
-        """모든 소스에서 뉴스 수집 및 집계"""
+    async def iter_news_by_source(self, limit: int = 10) -> AsyncIterator[Tuple[str, List[Dict[str, Any]]]]:
+        """소스별 결과를 완료되는 순서대로 전달 (가장 빠른 소스가 먼저)"""
+        per_source = per_source_limit(limit)
+        fetchers = {
+            "arXiv": lambda: self.fetch_arxiv_papers(per_source),
+            "Hugging Face": lambda: self.fetch_huggingface_models(per_source),
+            "GitHub": lambda: self.fetch_github_trending(limit=per_source),
+        }
+        
+        async def tagged(source, fetch):
+            try:
+                return source, await self.fetch_source_cached(source, per_source, fetch)
+            except Exception as e:
+                print(f"Error fetching {source}: {e}", file=sys.stderr)
+                return source, []
         
-        # 병렬로 모든 소스에서 데이터 수집
-        results = await asyncio.gather(
-            self.fetch_arxiv_papers(limit // 3 + 1),
-            self.fetch_huggingface_models(limit // 3 + 1),
-            self.fetch_github_trending(limit=limit // 3 + 1),
-            return_exceptions=True
-        )
+        for next_done in asyncio.as_completed([tagged(s, c) for s, c in fetchers.items()]):
+            yield await next_done
+    
+    async def fetch_source_cached(self, source: str, per_source: int, fetch: Callable[[], Awaitable[List[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        """소스별 캐시 (TTL은 그 소스의 관측된 변경 빈도로 결정)"""
+        key = NEWS_SOURCES[source]
+        policy_key = refresh_key(key, per_source)
+        cache_key = f"news_source:{policy_key}"
+        items = await state_store.get(cache_key)
+        if items is not None:
+            refresh_policy.hit(policy_key)
+            return items
         
-        all_news = []
-        for result in results:
-            if isinstance(result, list):
-                all_news.extend(result)
+        with span("fetch", source=key):
+            items = await fetch()
+        ttl = refresh_policy.observe(policy_key, items, failed=not items)
+        await state_store.set(cache_key, items, ttl=ttl)
+        return items
+    
+    @staticmethod
+    def filter_category(items: List[Dict[str, Any]], category: str) -> List[Dict[str, Any]]:
+        """카테고리 필터링"""
+        if category == "all":
+            return items
+        allowed_types = CATEGORY_TYPES.get(category, [])
+        return [n for n in items if n.get("type") in allowed_types]
+    
+    def build_aggregate(self, source_results: Dict[str, List[Dict[str, Any]]], category: str = "all", limit: int = 10) -> Dict[str, Any]:
+        """소스별 결과를 하나의 타임라인으로 병합
         
-        # 카테고리 필터링
-        if category != "all":
-            category_map = {
-                "research": ["research"],
-                "industry": ["model", "project"],
-                "products": ["model"]
-            }
-            allowed_types = category_map.get(category, [])
-            all_news = [n for n in all_news if n.get("type") in allowed_types]
+        각 소스 목록은 수집 시 timestamp 내림차순으로 정렬되어 있으므로
+        전체 정렬 없이 k-way 병합으로 상위 limit개만 꺼냅니다.
+        """
+        filtered = [self.filter_category(items, category) for items in source_results.values()]
         
-        # 날짜순 정렬
-        all_news.sort(
-            key=lambda x: x.get("published") or x.get("last_modified") or x.get("created_at") or "",
-            reverse=True
-        )
+        # 날짜순 병합 (limit개에서 중단)
+        timeline = heapq.merge(*filtered, key=lambda x: x.get("timestamp", 0), reverse=True)
         
         return {
             "category": category,
-            "total_count": len(all_news),
-            "items": all_news[:limit],
+            "total_count": sum(len(items) for items in filtered),
+            "items": list(islice(timeline, max(0, limit))),
             "sources": ["arXiv", "Hugging Face", "GitHub"],
             "updated_at": datetime.now().isoformat()
         }
+    
+    async def get_ai_news_aggregated(self, category: str = "all", limit: int = 10, on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """모든 소스에서 뉴스 수집 및 집계
+        
+        on_chunk가 주어지면 각 소스의 결과를 도착하는 즉시 전달한 뒤
+        최종 병합 결과를 반환합니다.
+        """
+        source_results = {}
+        async for source, items in self.iter_news_by_source(limit):
+            source_results[source] = items
+            if self.store is not None:
+                self.store.add_many(items)
+            if on_chunk is not None:
+                await on_chunk({
+                    "source": source,
+                    "items": self.filter_category(items, category)[:limit],
+                })
+        
+        return self.build_aggregate(source_results, category, limit)
 
-# 캐싱을 위한 간단한 메모리 캐시
-_cache = {}
-_cache_ttl = 300  # 5분
+# 집계 결과 캐시 (state_store: 기본 메모리, stateless 모드에서는 인스턴스 간 공유)
+# 소스마다 갱신 주기가 다르므로 집계 결과는 가장 짧은 소스 주기까지만 보관하고,
+# 다시 만들 때 아직 유효한 소스는 소스별 캐시에서 가져옵니다.
+def _refresh_keys(limit: int) -> List[str]:
+    per_source = per_source_limit(limit)
+    return [refresh_key(key, per_source) for key in NEWS_SOURCES.values()]
 
-async def get_cached_news(category: str = "all", limit: int = 10) -> Dict[str, Any]:
-    """캐시된 뉴스 가져오기 (성능 최적화)"""
-    cache_key = f"news_{category}_{limit}"
+def aggregate_ttl(limit: int) -> float:
+    """집계 결과 캐시의 현재 TTL (가장 짧은 소스 주기)"""
+    return min(refresh_policy.ttl(key) for key in _refresh_keys(limit))
+
+# 캐시 키별로 로컬 저장소에 색인해 둔 집계 결과 (다른 인스턴스가 가져온 결과도 한 번만 색인)
+_indexed: Dict[str, Dict[str, Any]] = {}
+
+# 수집한 뉴스의 시간·소스·타입·태그 색인
+news_store = NewsStore()
+
+async def get_cached_news(category: str = "all", limit: int = 10, on_chunk: Optional[ChunkCallback] = None,
+                          cursor: Optional[str] = None, since: Optional[str] = None,
+                          source: Optional[str] = None, tag: Optional[str] = None,
+                          fields: Optional[str] = None) -> Dict[str, Any]:
+    """캐시된 뉴스 가져오기 (성능 최적화)
+    
+    캐시 미스일 때 on_chunk가 있으면 소스별 부분 결과를 먼저 스트리밍합니다.
+    cursor / source / tag가 주어지면 로컬 저장소에서 페이지를 조회하고,
+    since가 주어지면 해당 토큰 이후 추가된 항목만 반환합니다.
+    fields("title,url")가 주어지면 항목마다 해당 필드만 반환합니다.
+    """
+    field_names = parse_fields(fields)
+    cache_key = f"news:{category}:{limit}"
     
-    if cache_key in _cache:
-        cached_data, timestamp = _cache[cache_key]
-        if (datetime.now() - timestamp).seconds < _cache_ttl:
-            return cached_data
+    news_data = await state_store.get(cache_key)
     
-    # 캐시 미스 - 새로 가져오기
-    collector = AINewsCollector()
-    news_data = await collector.get_ai_news_aggregated(category, limit)
-    _cache[cache_key] = (news_data, datetime.now())
+    if news_data is None:
+        # 캐시 미스 - 새로 가져오기
+        collector = AINewsCollector(news_store)
+        news_data = await collector.get_ai_news_aggregated(category, limit, on_chunk)
+        # 캐시에는 저장소와 같은 레코드를 공유해 보관
+        news_data["items"] = [news_store.shared(item) for item in news_data["items"]]
+        _indexed[cache_key] = news_data
+        await state_store.set(cache_key, news_data, ttl=aggregate_ttl(limit))
+    else:
+        for key in _refresh_keys(limit):
+            refresh_policy.hit(key)
+        if _indexed.get(cache_key) is not news_data:
+            # 다른 인스턴스가 가져온 결과: cursor / since 조회를 위해 로컬 저장소에도 색인
+            news_store.add_many(news_data["items"])
+            news_data["items"] = [news_store.shared(item) for item in news_data["items"]]
+            _indexed[cache_key] = news_data
+    
+    types = None if category == "all" else CATEGORY_TYPES.get(category, [])
+    
+    if since:
+        return {
+            "category": category,
+            **news_store.changes_since(since, types, source, tag, limit, field_names),
+        }
+    
+    if cursor or source or tag:
+        return {
+            "category": category,
+            **news_store.page(types, source, tag, limit, cursor, field_names),
+        }
     
-    return news_data
\ No newline at end of file
+    items = news_data["items"]
+    return {
+        **news_data,
+        "items": [project(item, field_names) for item in items],
+        "next_cursor": news_store.cursor_for(items[-1]) if items and len(items) == limit else None,
+        "since": news_store.since_token(),
+    }
@@ -10,9 +10,22 @@
 
 import aiohttp
 import asyncio
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import os
+import sys
+
+from .ai_news import ChunkCallback
+from .decoders import decode_arxiv_papers, decode_github_repos, decode_hf_models
+from .executors import run_decode
+from .hf_crawler import hf_crawler
+from .keyword_matcher import model_task_type_matcher, MODEL_TASK_TYPE_PRIORITY
+from .model_search_index import model_search_index
+from .tracing import http_trace_config
+from .upstreams import ARXIV_QUERY_URL, GITHUB_SEARCH_REPOS_URL, HF_MODELS_URL
+
+# 크롤러 코퍼스 기반 로컬 검색 색인
+model_search_index.attach(hf_crawler)
 
 class AIDataAPI:
     """무료 API를 사용한 실시간 AI 데이터 수집"""
@@ -27,8 +40,8 @@ class AIDataAPI:
         API 문서: https://huggingface.co/docs/hub/api
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://huggingface.co/api/models"
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
+                url = HF_MODELS_URL
                 params = {
                     "sort": "downloads",
                     "direction": -1,
@@ -50,25 +63,12 @@ class AIDataAPI:
                 
                 async with session.get(url, params=params, headers=headers) as response:
                     if response.status == 200:
-                        models = await response.json()
-                        
-                        return [
-                            {
-                                "name": m["id"],
-                                "author": m.get("author", "Unknown"),
-                                "downloads": m.get("downloads", 0),
-                                "likes": m.get("likes", 0),
-                                "tags": m.get("tags", []),
-                                "pipeline_tag": m.get("pipeline_tag", ""),
-                                "created_at": m.get("createdAt", ""),
-                                "last_modified": m.get("lastModified", ""),
-                                "source": "Hugging Face"
-                            }
-                            for m in models
-                        ]
+                        raw = await response.read()
                     else:
                         print(f"HF API error: {response.status}")
                         return []
+            
+            return await run_decode(decode_hf_models, raw)
         except Exception as e:
             print(f"Error fetching Hugging Face: {e}")
             return []
@@ -79,11 +79,11 @@ class AIDataAPI:
         API 문서: https://docs.github.com/en/rest
         """
         try:
-            async with aiohttp.ClientSession() as session:
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
                 # 최근 N일간 생성된 AI 관련 프로젝트
                 date_filter = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
                 
-                url = "https://api.github.com/search/repositories"
+                url = GITHUB_SEARCH_REPOS_URL
                 params = {
                     "q": f"topic:artificial-intelligence+OR+topic:machine-learning+created:>{date_filter}",
                     "sort": "stars",
@@ -99,26 +99,12 @@ class AIDataAPI:
                 
                 async with session.get(url, params=params, headers=headers) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        repos = data.get("items", [])
-                        
-                        return [
-                            {
-                                "name": repo["full_name"],
-                                "description": repo.get("description", ""),
-                                "stars": repo["stargazers_count"],
-                                "language": repo.get("language", "Unknown"),
-                                "url": repo["html_url"],
-                                "topics": repo.get("topics", []),
-                                "created_at": repo["created_at"],
-                                "updated_at": repo["updated_at"],
-                                "source": "GitHub"
-                            }
-                            for repo in repos
-                        ]
+                        raw = await response.read()
                     else:
                         print(f"GitHub API error: {response.status}")
                         return []
+            
+            return await run_decode(decode_github_repos, raw)
         except Exception as e:
             print(f"Error fetching GitHub: {e}")
             return []
@@ -129,8 +115,8 @@ class AIDataAPI:
         API 문서: https://arxiv.org/help/api
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "http://export.arxiv.org/api/query"
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
+                url = ARXIV_QUERY_URL
                 params = {
                     "search_query": f"cat:{category}",
                     "sortBy": "submittedDate",
@@ -140,25 +126,13 @@ class AIDataAPI:
                 
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        import feedparser
-                        content = await response.text()
-                        feed = feedparser.parse(content)
-                        
-                        return [
-                            {
-                                "title": entry.title,
-                                "authors": [author.name for author in entry.authors],
-                                "summary": entry.summary[:500] + "...",
-                                "published": entry.published,
-                                "url": entry.link,
-                                "categories": [tag.term for tag in entry.tags],
-                                "source": "arXiv"
-                            }
-                            for entry in feed.entries
-                        ]
+                        content = await response.read()
                     else:
                         print(f"arXiv API error: {response.status}")
                         return []
+            
+            # 피드 파싱은 이벤트 루프 밖에서
+            return await run_decode(decode_arxiv_papers, content)
         except Exception as e:
             print(f"Error fetching arXiv: {e}")
             return []
@@ -169,15 +143,26 @@ class AIDataAPI:
         # 키워드 추출
         keywords = task_description.lower().split()
         
-        # 작업 유형 판단
+        # 작업 유형 판단 (단일 패스)
         task_type = "text-generation"  # 기본값
         
-        if any(kw in task_description.lower() for kw in ["이미지", "image", "그림"]):
-            task_type = "text-to-image"
-        elif any(kw in task_description.lower() for kw in ["번역", "translation"]):
-            task_type = "translation"
-        elif any(kw in task_description.lower() for kw in ["요약", "summary"]):
-            task_type = "summarization"
+        matched_types = model_task_type_matcher.classify(task_description)
+        for candidate in MODEL_TASK_TYPE_PRIORITY:
+            if candidate in matched_types:
+                task_type = candidate
+                break
+        
+        # 로컬 색인에 해당 작업 모델이 있으면 업스트림 호출 없이 검색
+        if model_search_index.by_pipeline.get(task_type):
+            models, total_found = model_search_index.search(task_type, keywords, k=5)
+            return {
+                "task": task_description,
+                "task_type": task_type,
+                "models": models,
+                "total_found": total_found,
+                "source": "local_index",
+                "timestamp": datetime.now().isoformat()
+            }
         
         # Hugging Face에서 관련 모델 검색
         models = await self.fetch_huggingface_models(task_type, limit=10)
@@ -226,23 +211,36 @@ class AIDataAPI:
             "timestamp": datetime.now().isoformat()
         }
     
-    async def get_comprehensive_ai_update(self) -> Dict[str, Any]:
-        """모든 소스에서 데이터를 가져와 종합"""
+    async def get_comprehensive_ai_update(self, on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
+        """모든 소스에서 데이터를 가져와 종합
         
-        # 병렬로 모든 API 호출
-        results = await asyncio.gather(
-            self.fetch_huggingface_models(limit=10),
-            self.fetch_github_trending_ai(days=7),
-            self.fetch_arxiv_papers(max_results=10),
-            return_exceptions=True
-        )
+        on_chunk가 주어지면 각 소스의 결과를 완료되는 순서대로 먼저 전달합니다.
+        """
+        fetchers = {
+            "trending_models": self.fetch_huggingface_models(limit=10),
+            "trending_projects": self.fetch_github_trending_ai(days=7),
+            "latest_papers": self.fetch_arxiv_papers(max_results=10),
+        }
+        
+        async def tagged(key, coro):
+            try:
+                return key, await coro
+            except Exception as e:
+                print(f"Error fetching {key}: {e}", file=sys.stderr)
+                return key, []
         
-        hf_models, gh_repos, arxiv_papers = results
+        # 병렬로 모든 API 호출, 먼저 끝난 소스부터 처리
+        results = {}
+        for next_done in asyncio.as_completed([tagged(k, c) for k, c in fetchers.items()]):
+            key, items = await next_done
+            results[key] = items if isinstance(items, list) else []
+            if on_chunk is not None:
+                await on_chunk({"section": key, "items": results[key]})
         
         return {
-            "trending_models": hf_models if isinstance(hf_models, list) else [],
-            "trending_projects": gh_repos if isinstance(gh_repos, list) else [],
-            "latest_papers": arxiv_papers if isinstance(arxiv_papers, list) else [],
+            "trending_models": results["trending_models"],
+            "trending_projects": results["trending_projects"],
+            "latest_papers": results["latest_papers"],
             "updated_at": datetime.now().isoformat(),
             "sources": ["Hugging Face", "GitHub", "arXiv"]
         }
@@ -263,6 +261,6 @@ async def get_latest_ai_research(max_results: int = 20) -> List[Dict]:
     """최신 AI 연구 논문"""
     return await api_client.fetch_arxiv_papers(max_results=max_results)
 
-async def get_all_updates() -> Dict[str, Any]:
+async def get_all_updates(on_chunk: Optional[ChunkCallback] = None) -> Dict[str, Any]:
     """종합 업데이트"""
-    return await api_client.get_comprehensive_ai_update()
\ No newline at end of file
+    return await api_client.get_comprehensive_ai_update(on_chunk)
\ No newline at end of file
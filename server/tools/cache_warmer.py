@@ -0,0 +1,329 @@
+"""
+사용량 기반 캐시 예열 (자주 쓰이는 도구 인자)
+
+get_ai_news(category, limit), search_model_for_task(task), recommend_model(task),
+realtime_model_rankings(benchmark)에는 서로 다른 인자 조합이 많이 들어오고,
+캐시가 만료된 뒤 첫 요청은 업스트림 왕복 시간을 그대로 기다립니다.
+
+- 인자 조합별 호출 빈도를 Space-Saving 스케치(heavy hitters)로 추적 (항목 수 WARM_SKETCH_SIZE로 제한)
+- 도구 결과를 인자 조합별로 WARM_TTL 동안 보관 (같은 조합의 동시 미스는 한 번만 실행)
+- 백그라운드 루프가 상위 WARM_TOP_K 조합 중 만료가 WARM_LEAD 안으로 다가온 항목을 미리 다시 실행
+- 주기마다 빈도를 WARM_DECAY배로 줄여 최근 사용량을 따라감
+
+통계의 saved_misses는 예열한 결과가 처음 적중한 횟수(예열이 없었다면 미스였을 요청)이고,
+hit_rate_without_warming은 그 요청들을 미스로 셌을 때의 적중률입니다.
+한 번도 적중하지 않고 교체된 예열은 unused_refreshes로 셉니다.
+
+지정한 인자 외의 인자(cursor, stream 등)가 기본값이 아니면 캐시를 거치지 않습니다.
+
+도구별 WarmSpec으로 결과가 의존하는 상태를 알려 주면
+- 보관 시간은 WARM_TTL과 그 상태의 현재 TTL(예: 소스별 갱신 주기) 중 짧은 쪽
+- 버전(예: 뉴스 저장소의 추가 순서 번호)이 바뀌면 보관한 결과를 쓰지 않음
+  (since / next_cursor 토큰이 새로 색인된 항목을 놓치지 않도록)
+비었거나 실패 / 저하된 결과(업스트림 전체 실패, 샘플 데이터 대체, 오류 응답)는 보관하지 않습니다.
+
+환경 변수
+- WARM_TOP_K: 예열할 상위 조합 수 (기본 10, 0이면 예열 끔)
+- WARM_TTL: 결과 보관 시간(초) (기본 60)
+- WARM_LEAD: 만료 몇 초 전부터 다시 실행할지 (기본 15, 최소 WARM_INTERVAL)
+- WARM_INTERVAL: 예열 루프 주기(초) (기본 10)
+- WARM_MIN_COUNT: 예열 대상이 되는 최소 빈도 (기본 2)
+- WARM_DECAY: 주기마다 빈도에 곱하는 값 (기본 0.95)
+- WARM_SKETCH_SIZE: 빈도를 추적하는 조합 수 (기본 256)
+- WARM_CACHE_SIZE: 보관하는 결과 수 (기본 512)
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class SpaceSaving:
+    """Space-Saving heavy hitters 스케치
+
+    capacity개의 카운터만 유지하고, 가득 찼을 때 새 키가 오면 가장 작은 카운터를 넘겨받습니다.
+    (count - error)는 실제 빈도의 하한, count는 상한입니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, float] = {}
+        self.errors: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def add(self, key: str, weight: float = 1.0) -> Optional[str]:
+        """빈도 추가, 밀려난 키가 있으면 반환"""
+        if key in self.counts:
+            self.counts[key] += weight
+            return None
+        if len(self.counts) < self.capacity:
+            self.counts[key] = weight
+            self.errors[key] = 0.0
+            return None
+        evicted = min(self.counts, key=self.counts.__getitem__)
+        floor = self.counts.pop(evicted)
+        self.errors.pop(evicted)
+        self.counts[key] = floor + weight
+        self.errors[key] = floor
+        return evicted
+
+    def top(self, k: int) -> List[Tuple[str, float, float]]:
+        """빈도 상위 k개 (키, 빈도, 오차)"""
+        keys = sorted(self.counts, key=self.counts.__getitem__, reverse=True)[:k]
+        return [(key, self.counts[key], self.errors[key]) for key in keys]
+
+    def decay(self, factor: float):
+        for key in self.counts:
+            self.counts[key] *= factor
+            self.errors[key] *= factor
+
+
+# 비어 있으면 실패로 보는 결과 목록 필드
+RESULT_LISTS = ("items", "models", "recommendations")
+
+
+def cacheable(result: Any) -> bool:
+    """보관할 결과인지 (비었거나 실패 / 부하 차단 / 저하된 결과는 보관하지 않음)"""
+    if not result:
+        return False
+    if isinstance(result, dict):
+        if result.get("stale") or result.get("degraded") or result.get("degraded_sources"):
+            return False
+        if result.get("success") is False or result.get("error"):
+            return False
+        if any(field in result and not result[field] for field in RESULT_LISTS):
+            return False
+    return True
+
+
+class WarmSpec:
+    """결과를 캐시할 도구 설정
+
+    - key_args: 캐시 키로 쓰는 인자
+    - ttl: 인자 dict → 결과가 의존하는 캐시의 현재 TTL(초)
+    - version: 결과가 의존하는 상태의 현재 버전 (보관할 때와 다르면 미스)
+    """
+
+    __slots__ = ("key_args", "ttl", "version")
+
+    def __init__(self, key_args: Sequence[str], ttl: Optional[Callable[[Dict[str, Any]], float]] = None,
+                 version: Optional[Callable[[], Any]] = None):
+        self.key_args = tuple(key_args)
+        self.ttl = ttl
+        self.version = version
+
+
+class _Entry:
+    """보관된 도구 결과"""
+
+    __slots__ = ("result", "expires", "version", "warmed", "hit")
+
+    def __init__(self, result: Any, ttl: float, version: Any, warmed: bool):
+        self.result = result
+        self.expires = time.monotonic() + ttl
+        self.version = version
+        # 예열로 채운 결과인지 / 저장 후 적중한 적이 있는지
+        self.warmed = warmed
+        self.hit = False
+
+
+class CacheWarmer:
+    """도구 결과 캐시 + 빈도 상위 인자 조합 예열"""
+
+    def __init__(self, top_k: Optional[int] = None, ttl: Optional[float] = None, lead: Optional[float] = None,
+                 interval: Optional[float] = None, min_count: Optional[float] = None,
+                 decay: Optional[float] = None, sketch_size: Optional[int] = None,
+                 cache_size: Optional[int] = None):
+        self.top_k = top_k if top_k is not None else int(os.getenv("WARM_TOP_K", "10"))
+        self.ttl = ttl or float(os.getenv("WARM_TTL", "60"))
+        self.interval = interval or float(os.getenv("WARM_INTERVAL", "10"))
+        self.lead = max(lead or float(os.getenv("WARM_LEAD", "15")), self.interval)
+        self.min_count = min_count or float(os.getenv("WARM_MIN_COUNT", "2"))
+        self.decay = decay or float(os.getenv("WARM_DECAY", "0.95"))
+        self.cache_size = cache_size or int(os.getenv("WARM_CACHE_SIZE", "512"))
+
+        self.sketch = SpaceSaving(sketch_size or int(os.getenv("WARM_SKETCH_SIZE", "256")))
+        self._cache: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # 스케치에 있는 키 → 다시 실행할 (함수, 인자, 설정)
+        self._calls: Dict[str, Tuple[Callable, Dict[str, Any], WarmSpec]] = {}
+        self.stats_counters = {"hits": 0, "misses": 0, "bypassed": 0, "saved_misses": 0,
+                               "not_cached": 0, "invalidated": 0,
+                               "refreshes": 0, "refresh_errors": 0, "unused_refreshes": 0, "cycles": 0}
+
+    # =========================
+    # 결과 캐시
+    # =========================
+
+    def _store(self, key: str, result: Any, ttl: float, version: Any, warmed: bool):
+        previous = self._cache.pop(key, None)
+        if previous is not None and previous.warmed and not previous.hit:
+            self.stats_counters["unused_refreshes"] += 1
+        self._cache[key] = _Entry(result, ttl, version, warmed)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _outdated(entry: _Entry, spec: WarmSpec) -> bool:
+        """보관한 뒤 의존하는 상태의 버전이 바뀌었는지"""
+        return spec.version is not None and entry.version != spec.version()
+
+    def _lookup(self, key: str, spec: WarmSpec) -> Optional[_Entry]:
+        entry = self._cache.get(key)
+        if entry is None or entry.expires <= time.monotonic():
+            return None
+        if self._outdated(entry, spec):
+            self.stats_counters["invalidated"] += 1
+            return None
+        self._cache.move_to_end(key)
+        return entry
+
+    def _save(self, key: str, result: Any, kwargs: Dict[str, Any], spec: WarmSpec, warmed: bool):
+        """보관할 결과면 (WARM_TTL과 의존하는 캐시의 TTL 중 짧은 쪽 동안) 보관"""
+        ttl = self.ttl if spec.ttl is None else min(self.ttl, spec.ttl(kwargs))
+        if ttl <= 0 or not cacheable(result):
+            self.stats_counters["not_cached"] += 1
+            # 예전 결과도 더는 최신이 아니므로 버림
+            self._cache.pop(key, None)
+            return
+        # 버전은 실행이 끝난 뒤의 상태 (실행 중 색인된 항목까지 반영된 토큰)
+        version = spec.version() if spec.version is not None else None
+        self._store(key, result, ttl, version, warmed)
+
+    async def _run(self, key: str, func: Callable, kwargs: Dict[str, Any], spec: WarmSpec, warmed: bool) -> Any:
+        """같은 키의 실행이 진행 중이면 그 결과를 기다림"""
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await func(**kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 기다리는 쪽이 없으면 "Future exception was never retrieved" 경고가 나므로 회수
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self._save(key, result, kwargs, spec, warmed)
+        future.set_result(result)
+        return result
+
+    # =========================
+    # 도구 래퍼
+    # =========================
+
+    def wrap(self, func, spec: Optional[WarmSpec] = None):
+        """spec.key_args로 결과를 캐시하고 빈도를 기록 (spec이 없으면 원래 함수 그대로)"""
+        if spec is None or not spec.key_args:
+            return func
+        key_args = spec.key_args
+        tool = func.__name__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            if any(value != signature.parameters[name].default for name, value in arguments.items()
+                   if name not in key_args and name != "ctx"):
+                self.stats_counters["bypassed"] += 1
+                return await func(*args, **kwargs)
+
+            key = tool + ":" + json.dumps({name: arguments[name] for name in key_args}, sort_keys=True, default=str)
+            evicted = self.sketch.add(key)
+            if evicted is not None:
+                self._calls.pop(evicted, None)
+            # 예열 실행은 세션 밖이므로 ctx는 넘기지 않음
+            self._calls[key] = (func, {**arguments, "ctx": None} if "ctx" in arguments else arguments, spec)
+
+            entry = self._lookup(key, spec)
+            if entry is not None:
+                self.stats_counters["hits"] += 1
+                if entry.warmed and not entry.hit:
+                    self.stats_counters["saved_misses"] += 1
+                entry.hit = True
+                return entry.result
+
+            self.stats_counters["misses"] += 1
+            return await self._run(key, func, arguments, spec, warmed=False)
+
+        return wrapper
+
+    # =========================
+    # 예열
+    # =========================
+
+    def candidates(self) -> List[str]:
+        """예열 대상 키 (빈도 상위 중 결과가 없거나 곧 만료되는 조합)"""
+        now = time.monotonic()
+        keys = []
+        for key, count, _ in self.sketch.top(self.top_k):
+            if count < self.min_count or key not in self._calls or key in self._inflight:
+                continue
+            entry = self._cache.get(key)
+            if entry is None or entry.expires - now <= self.lead or self._outdated(entry, self._calls[key][2]):
+                keys.append(key)
+        return keys
+
+    async def warm_once(self) -> int:
+        """상위 조합을 미리 다시 실행, 예열한 개수 반환"""
+        self.stats_counters["cycles"] += 1
+        keys = self.candidates()
+
+        async def refresh(key: str):
+            func, kwargs, spec = self._calls[key]
+            try:
+                await self._run(key, func, kwargs, spec, warmed=True)
+                self.stats_counters["refreshes"] += 1
+            except Exception as e:
+                self.stats_counters["refresh_errors"] += 1
+                print(f"Error warming {key}: {e}", file=sys.stderr)
+
+        await asyncio.gather(*(refresh(key) for key in keys))
+        self.sketch.decay(self.decay)
+        return len(keys)
+
+    async def run_forever(self):
+        """주기적으로 예열 (WARM_TOP_K=0이면 바로 종료)"""
+        if self.top_k <= 0:
+            return
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.warm_once()
+
+    def stats(self) -> Dict[str, Any]:
+        counters = self.stats_counters
+        total = counters["hits"] + counters["misses"]
+        return {
+            "top_k": self.top_k,
+            "ttl_s": self.ttl,
+            "lead_s": self.lead,
+            "interval_s": self.interval,
+            **counters,
+            "hit_rate": round(counters["hits"] / total, 3) if total else None,
+            "hit_rate_without_warming": round((counters["hits"] - counters["saved_misses"]) / total, 3) if total else None,
+            "cached": len(self._cache),
+            "tracked": len(self.sketch),
+            "top": [
+                {"key": key, "count": round(count, 2), "error": round(error, 2)}
+                for key, count, error in self.sketch.top(self.top_k)
+            ],
+        }
+
+
+cache_warmer = CacheWarmer()
@@ -0,0 +1,155 @@
+"""
+업스트림 응답 디코딩 및 레코드 정규화
+
+feedparser 파싱과 큰 JSON 디코딩은 CPU를 오래 점유하므로
+각 fetcher는 응답 본문(bytes/str)만 받아 오고, 디코딩과 정규화는
+이 모듈의 함수로 실행기(run_decode)에서 처리합니다.
+프로세스 풀에서도 실행될 수 있도록 모두 모듈 최상위 함수입니다.
+"""
+
+import json
+from typing import Any, Dict, List, Union
+
+import feedparser
+
+from .timeutils import to_epoch
+
+Payload = Union[bytes, str]
+
+
+# =========================
+# arXiv (Atom 피드)
+# =========================
+
+def _arxiv_entries(content: Payload, summary_chars: int) -> List[Dict[str, Any]]:
+    feed = feedparser.parse(content)
+    return [
+        {
+            "title": entry.title,
+            "authors": [author.name for author in entry.get("authors", [])],
+            "summary": entry.summary[:summary_chars] + "...",
+            "published": entry.published,
+            "timestamp": to_epoch(entry.get("published_parsed") or entry.published),
+            "url": entry.link,
+            "categories": [tag.term for tag in entry.get("tags", [])],
+            "source": "arXiv",
+        }
+        for entry in feed.entries
+    ]
+
+
+def decode_arxiv_news(content: Payload) -> List[Dict[str, Any]]:
+    """뉴스 타임라인용 arXiv 논문 (최신순)"""
+    papers = [{**paper, "type": "research"} for paper in _arxiv_entries(content, 300)]
+    papers.sort(key=lambda x: x["timestamp"], reverse=True)
+    return papers
+
+
+def decode_arxiv_papers(content: Payload) -> List[Dict[str, Any]]:
+    """연구 논문 목록용 arXiv 논문"""
+    return _arxiv_entries(content, 500)
+
+
+# =========================
+# Hugging Face (/api/models)
+# =========================
+
+def decode_hf_news(raw: Payload) -> List[Dict[str, Any]]:
+    """뉴스 타임라인용 HF 모델 (최신순)"""
+    models = json.loads(raw)
+    formatted_models = [
+        {
+            "title": f"New Model: {model.get('id', 'Unknown')}",
+            "model_id": model.get('id'),
+            "author": model.get('author', 'Unknown'),
+            "downloads": model.get('downloads', 0),
+            "likes": model.get('likes', 0),
+            "tags": model.get('tags', []),
+            "last_modified": model.get('lastModified'),
+            "timestamp": to_epoch(model.get('lastModified')),
+            "url": f"https://huggingface.co/{model.get('id')}",
+            "source": "Hugging Face",
+            "type": "model"
+        }
+        for model in models
+    ]
+    formatted_models.sort(key=lambda x: x["timestamp"], reverse=True)
+    return formatted_models
+
+
+def decode_hf_models(raw: Payload) -> List[Dict[str, Any]]:
+    """모델 검색용 HF 모델"""
+    return [
+        {
+            "name": m["id"],
+            "author": m.get("author", "Unknown"),
+            "downloads": m.get("downloads", 0),
+            "likes": m.get("likes", 0),
+            "tags": m.get("tags", []),
+            "pipeline_tag": m.get("pipeline_tag", ""),
+            "created_at": m.get("createdAt", ""),
+            "last_modified": m.get("lastModified", ""),
+            "source": "Hugging Face"
+        }
+        for m in json.loads(raw)
+    ]
+
+
+def decode_hf_trending(raw: Payload) -> List[Dict[str, Any]]:
+    """트렌딩 순위용 HF 모델"""
+    return [
+        {
+            "name": m.get("id"),
+            "author": m.get("author"),
+            "downloads": m.get("downloads", 0),
+            "likes": m.get("likes", 0),
+            "tags": m.get("tags", []),
+            "created_at": m.get("createdAt"),
+            "last_modified": m.get("lastModified")
+        }
+        for m in json.loads(raw)
+    ]
+
+
+# =========================
+# GitHub (/search/repositories)
+# =========================
+
+def decode_github_news(raw: Payload, limit: int) -> List[Dict[str, Any]]:
+    """뉴스 타임라인용 GitHub 저장소 (최신순)"""
+    repos = json.loads(raw).get('items', [])[:limit]
+    projects = [
+        {
+            "title": repo.get('full_name'),
+            "description": repo.get('description', ''),
+            "stars": repo.get('stargazers_count', 0),
+            "language": repo.get('language', 'Unknown'),
+            "url": repo.get('html_url'),
+            "created_at": repo.get('created_at'),
+            "timestamp": to_epoch(repo.get('created_at')),
+            "topics": repo.get('topics', []),
+            "source": "GitHub",
+            "type": "project"
+        }
+        for repo in repos
+    ]
+    projects.sort(key=lambda x: x["timestamp"], reverse=True)
+    return projects
+
+
+def decode_github_repos(raw: Payload) -> List[Dict[str, Any]]:
+    """트렌딩 프로젝트용 GitHub 저장소"""
+    return [
+        {
+            "name": repo["full_name"],
+            "description": repo.get("description", ""),
+            "stars": repo["stargazers_count"],
+            "language": repo.get("language", "Unknown"),
+            "url": repo["html_url"],
+            "topics": repo.get("topics", []),
+            "created_at": repo["created_at"],
+            "updated_at": repo["updated_at"],
+            "source": "GitHub"
+        }
+        for repo in json.loads(raw).get("items", [])
+    ]
@@ -0,0 +1,211 @@
+"""
+구독 가능한 피드 (MCP 리소스 + 변경 알림)
+
+뉴스 / 트렌딩 모델 / 모델 순위를 MCP 리소스로 노출합니다.
+클라이언트가 resources/subscribe로 구독하면, 백그라운드 수집 루프가 피드를 새로 읽어
+이전 버전과 달라졌을 때만 notifications/resources/updated를 보냅니다.
+알림의 _meta에는 바뀐 부분만 담은 diff가 들어 있어 전체를 다시 읽지 않아도 됩니다.
+
+    {"version": 7, "previous_version": 6,
+     "added": [{"key": ..., ...요약 필드}], "removed": ["key", ...],
+     "changed": [{"key": ..., "fields": {"rank": [3, 2]}}], "truncated": false}
+
+업스트림 호출 수는 클라이언트 수 × 폴링 주기가 아니라 수집 주기에만 비례합니다.
+구독자가 없는 피드는 수집하지 않습니다.
+
+환경 변수
+- FEED_REFRESH_INTERVAL: 수집 주기(초) (기본 300)
+- FEED_DIFF_LIMIT: 알림 하나에 담는 항목 수 상한 (기본 20, 넘으면 truncated)
+"""
+
+import asyncio
+import os
+import sys
+import time
+import weakref
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from mcp import types
+
+Item = Dict[str, Any]
+
+
+def diff_items(previous: Dict[str, Item], current: Dict[str, Item], summary_fields: Tuple[str, ...],
+               watch_fields: Tuple[str, ...], limit: int) -> Dict[str, Any]:
+    """두 버전의 항목(key → 항목) 비교: 추가 / 삭제 / 감시 필드 변경"""
+    added = [
+        {"key": key, **{f: item.get(f) for f in summary_fields if f in item}}
+        for key, item in current.items() if key not in previous
+    ]
+    removed = [key for key in previous if key not in current]
+    changed = []
+    for key, item in current.items():
+        old = previous.get(key)
+        if old is None:
+            continue
+        fields = {f: [old.get(f), item.get(f)] for f in watch_fields if old.get(f) != item.get(f)}
+        if fields:
+            changed.append({"key": key, "fields": fields})
+
+    truncated = max(len(added), len(removed), len(changed)) > limit
+    return {
+        "added": added[:limit],
+        "removed": removed[:limit],
+        "changed": changed[:limit],
+        "truncated": truncated,
+    }
+
+
+class Feed:
+    """구독 단위 피드 (가장 최근 버전만 보관)"""
+
+    def __init__(self, uri: str, name: str, description: str, fetch: Callable[[], Awaitable[List[Item]]],
+                 key_field: str, summary_fields: Tuple[str, ...], watch_fields: Tuple[str, ...] = (),
+                 ranked: bool = False):
+        self.uri = uri
+        self.name = name
+        self.description = description
+        self.fetch = fetch
+        self.key_field = key_field
+        self.summary_fields = summary_fields
+        # ranked이면 목록 순서를 rank 필드로 붙여 순위 변동도 감시
+        self.ranked = ranked
+        self.watch_fields = watch_fields + (("rank",) if ranked and "rank" not in watch_fields else ())
+
+        self.version = 0
+        self.updated_at: Optional[str] = None
+        self.checked_at = 0.0
+        self.items: Dict[str, Item] = {}
+        self.lock = asyncio.Lock()
+
+    def key(self, item: Item) -> str:
+        return str(item.get(self.key_field) or item.get("url") or item.get("title"))
+
+    def payload(self) -> Dict[str, Any]:
+        return {
+            "uri": self.uri,
+            "version": self.version,
+            "updated_at": self.updated_at,
+            "count": len(self.items),
+            "items": list(self.items.values()),
+        }
+
+
+class FeedHub:
+    """피드 등록 / 구독자 관리 / 주기적 수집과 변경 알림"""
+
+    def __init__(self, interval: Optional[float] = None, diff_limit: Optional[int] = None):
+        self.interval = interval or float(os.getenv("FEED_REFRESH_INTERVAL", "300"))
+        self.diff_limit = diff_limit or int(os.getenv("FEED_DIFF_LIMIT", "20"))
+        self.feeds: Dict[str, Feed] = {}
+        # 세션이 끊기면 자동으로 빠지도록 약한 참조로 보관
+        self.subscribers: Dict[str, "weakref.WeakSet"] = {}
+        self.stats_counters = {"refreshes": 0, "changes": 0, "notifications": 0, "failed_notifications": 0}
+
+    def register(self, feed: Feed) -> Feed:
+        self.feeds[feed.uri] = feed
+        self.subscribers[feed.uri] = weakref.WeakSet()
+        return feed
+
+    def subscribe(self, uri: str, session: Any):
+        if uri not in self.feeds:
+            raise ValueError(f"Unknown resource: {uri}")
+        self.subscribers[uri].add(session)
+
+    def unsubscribe(self, uri: str, session: Any):
+        if uri in self.subscribers:
+            self.subscribers[uri].discard(session)
+
+    async def refresh(self, uri: str) -> Optional[Dict[str, Any]]:
+        """피드를 새로 읽고 바뀌었으면 버전을 올리고 구독자에게 알림 (diff 반환)"""
+        feed = self.feeds[uri]
+        async with feed.lock:
+            self.stats_counters["refreshes"] += 1
+            feed.checked_at = time.monotonic()
+            try:
+                rows = await feed.fetch()
+            except Exception as e:
+                print(f"Error refreshing feed {uri}: {e}", file=sys.stderr)
+                return None
+            if not rows:
+                # 업스트림 실패로 빈 목록이면 이전 버전 유지
+                return None
+
+            current: Dict[str, Item] = {}
+            for position, row in enumerate(rows, start=1):
+                item = {**row, "rank": row.get("rank") or position} if feed.ranked else row
+                current.setdefault(feed.key(item), item)
+
+            diff = diff_items(feed.items, current, feed.summary_fields, feed.watch_fields, self.diff_limit)
+            first = feed.version == 0
+            feed.items = current
+            if not first and not (diff["added"] or diff["removed"] or diff["changed"]):
+                return None
+
+            feed.version += 1
+            feed.updated_at = datetime.now().isoformat()
+            if first:
+                return None
+            self.stats_counters["changes"] += 1
+            diff = {"version": feed.version, "previous_version": feed.version - 1, **diff}
+
+        await self._notify(uri, diff)
+        return diff
+
+    async def read(self, uri: str) -> Dict[str, Any]:
+        """리소스 읽기 (처음이거나 수집 주기가 지났으면 먼저 새로 읽음)"""
+        feed = self.feeds[uri]
+        if feed.version == 0 or time.monotonic() - feed.checked_at >= self.interval:
+            await self.refresh(uri)
+        return feed.payload()
+
+    async def _notify(self, uri: str, diff: Dict[str, Any]):
+        notification = types.ServerNotification(
+            types.ResourceUpdatedNotification(
+                params=types.ResourceUpdatedNotificationParams(uri=uri, _meta={"diff": diff}),
+            )
+        )
+        for session in list(self.subscribers.get(uri, ())):
+            try:
+                await session.send_notification(notification)
+                self.stats_counters["notifications"] += 1
+            except Exception as e:
+                # 끊긴 세션은 구독 해제
+                self.stats_counters["failed_notifications"] += 1
+                self.unsubscribe(uri, session)
+                print(f"Error notifying subscriber of {uri}: {e}", file=sys.stderr)
+
+    async def run_forever(self):
+        """구독자가 있는 피드만 주기적으로 수집"""
+        while True:
+            for uri, feed in self.feeds.items():
+                if self.subscribers[uri] and time.monotonic() - feed.checked_at >= self.interval:
+                    await self.refresh(uri)
+            await asyncio.sleep(min(self.interval, 5))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "interval_s": self.interval,
+            **self.stats_counters,
+            "feeds": {
+                uri: {"version": feed.version, "items": len(feed.items), "subscribers": len(self.subscribers[uri])}
+                for uri, feed in self.feeds.items()
+            },
+        }
+
+
+def advertise_subscriptions(server):
+    """resources.subscribe capability 광고 (저수준 서버가 항상 False로 보내는 버전 대응)"""
+    get_capabilities = server.get_capabilities
+
+    def wrapper(*args, **kwargs):
+        capabilities = get_capabilities(*args, **kwargs)
+        if capabilities.resources is not None:
+            capabilities.resources.subscribe = True
+        return capabilities
+
+    server.get_capabilities = wrapper
+
+
+feed_hub = FeedHub()
@@ -0,0 +1,317 @@
+"""
+Hugging Face 모델 카탈로그 크롤러
+
+/api/models 목록을 cursor 기반 페이지네이션(Link: rel="next")으로 끝까지 훑어
+로컬 메타데이터 코퍼스를 만듭니다.
+- pipeline_tag별 파티션을 동시에 훑되 전체 동시 요청 수는 세마포어로 제한
+- 페이지마다 체크포인트를 저장해 재시작 후 이어서 진행
+- lastModified가 바뀐 모델만 상세 정보(/api/models/{id})를 다시 가져옴
+- 전체 크롤이 끝난 뒤에는 lastModified 내림차순 목록에서 이미 본 시점에 닿으면 중단(증분 크롤)
+
+저장된 체크포인트 / 코퍼스는 첫 크롤 때 불러오며(모듈 import 시 읽지 않음),
+불러온 코퍼스도 리스너로 전달합니다.
+
+환경 변수
+- HF_CRAWL_ENABLED=1: 서버 시작 시 백그라운드 크롤 실행 (기본 꺼짐)
+- HF_API_BASE: API 기본 URL (로컬 스텁 서버 테스트용, 기본 https://huggingface.co)
+- HF_CRAWL_DIR: 체크포인트 / 코퍼스 저장 위치 (기본 .cache/hf_crawl)
+- HF_CRAWL_CONCURRENCY: 동시 요청 수 (기본 4)
+- HF_CRAWL_MAX_MODELS: 파티션별 최대 모델 수 (기본 20000)
+- HF_CRAWL_INTERVAL: 크롤 주기(초, 기본 3600)
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import aiohttp
+
+from .records import ModelRecord
+from .tracing import http_trace_config
+from .upstreams import HF_API_BASE
+
+# 목록 API에서 함께 받을 필드
+LIST_EXPAND = ["author", "downloads", "likes", "tags", "pipeline_tag", "createdAt", "lastModified", "library_name"]
+
+# 기본 파티션 (pipeline_tag 필터, "all"이면 필터 없음)
+DEFAULT_PARTITIONS = [
+    "text-generation",
+    "text-to-image",
+    "translation",
+    "summarization",
+    "text-classification",
+    "feature-extraction",
+    "automatic-speech-recognition",
+    "image-classification",
+]
+
+PAGE_SIZE = 1000
+
+
+def normalize_model(listing: Dict[str, Any], detail: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """목록 / 상세 응답 → 코퍼스 레코드"""
+    card = (detail or {}).get("cardData") or {}
+    languages = card.get("language") or []
+    if isinstance(languages, str):
+        languages = [languages]
+    return {
+        "id": listing["id"],
+        "author": listing.get("author") or listing["id"].split("/")[0],
+        "pipeline_tag": listing.get("pipeline_tag") or "",
+        "tags": listing.get("tags", []),
+        "downloads": listing.get("downloads", 0),
+        "likes": listing.get("likes", 0),
+        "library_name": listing.get("library_name") or "",
+        "created_at": listing.get("createdAt") or "",
+        "last_modified": listing.get("lastModified") or "",
+        "license": card.get("license") or "",
+        "languages": languages,
+    }
+
+
+class HFCatalogCrawler:
+    """재시작 가능한 HF 모델 목록 크롤러"""
+
+    def __init__(self, base_url: Optional[str] = None, data_dir: Optional[str] = None,
+                 partitions: Optional[List[str]] = None, concurrency: Optional[int] = None,
+                 max_models: Optional[int] = None, token: Optional[str] = None,
+                 enabled: Optional[bool] = None):
+        self.base_url = (base_url or HF_API_BASE).rstrip("/")
+        self.data_dir = Path(data_dir or os.getenv("HF_CRAWL_DIR", ".cache/hf_crawl"))
+        self.partitions = partitions or DEFAULT_PARTITIONS
+        self.concurrency = concurrency or int(os.getenv("HF_CRAWL_CONCURRENCY", "4"))
+        self.max_models = max_models or int(os.getenv("HF_CRAWL_MAX_MODELS", "20000"))
+        self.token = token if token is not None else os.getenv("HUGGINGFACE_TOKEN", "")
+        self.enabled = enabled if enabled is not None else os.getenv("HF_CRAWL_ENABLED") == "1"
+
+        self.corpus: Dict[str, ModelRecord] = {}
+        self.state: Dict[str, Any] = {"cycle": 0, "high_water": "", "partitions": {}}
+        self.stats = {"pages": 0, "listed": 0, "detail_fetches": 0, "unchanged": 0, "errors": 0}
+
+        # 코퍼스가 바뀔 때 호출되는 콜백 (예: 검색 색인 갱신)
+        self.listeners: List[Callable[[List[ModelRecord]], None]] = []
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._log_lines = 0
+        self.loaded = False
+
+    # =========================
+    # 체크포인트 / 코퍼스 저장
+    # =========================
+
+    @property
+    def _state_path(self) -> Path:
+        return self.data_dir / "checkpoint.json"
+
+    @property
+    def _corpus_path(self) -> Path:
+        return self.data_dir / "corpus.jsonl"
+
+    async def load(self):
+        """저장된 체크포인트 / 코퍼스를 한 번 불러와 리스너에 전달 (파일 읽기는 루프 밖에서)"""
+        if self.loaded:
+            return
+        await asyncio.get_running_loop().run_in_executor(None, self._load)
+        self.loaded = True
+        records = list(self.corpus.values())
+        if records:
+            for listener in self.listeners:
+                listener(records)
+
+    def _load(self):
+        if self._state_path.exists():
+            try:
+                self.state = json.loads(self._state_path.read_text(encoding="utf-8"))
+            except ValueError:
+                print("HF crawler checkpoint is corrupt, starting over", file=sys.stderr)
+
+        if self._corpus_path.exists():
+            with open(self._corpus_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = ModelRecord.from_dict(json.loads(line))
+                    except (ValueError, TypeError):
+                        continue  # 중단 중 잘린 마지막 줄
+                    self.corpus[record["id"]] = record
+                    self._log_lines += 1
+
+    def _save_state(self):
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._state_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.state), encoding="utf-8")
+        os.replace(tmp, self._state_path)
+
+    def _append_corpus(self, records: List[ModelRecord]):
+        if not records:
+            return
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._corpus_path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+        self._log_lines += len(records)
+
+    def compact(self):
+        """중복 레코드가 쌓인 코퍼스 로그를 최신 레코드만 남기도록 재작성"""
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self._corpus_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for record in self.corpus.values():
+                f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+        os.replace(tmp, self._corpus_path)
+        self._log_lines = len(self.corpus)
+
+    # =========================
+    # HTTP
+    # =========================
+
+    async def _get(self, session: aiohttp.ClientSession, url: str, params=None, retries: int = 3):
+        """세마포어로 동시성을 제한한 GET (429 / 5xx는 재시도) → (json, next_url)"""
+        for attempt in range(retries + 1):
+            async with self._semaphore:
+                async with session.get(url, params=params) as response:
+                    if response.status == 200:
+                        data = await response.json(content_type=None)
+                        next_link = response.links.get("next")
+                        return data, str(next_link["url"]) if next_link else None
+                    if response.status == 404:
+                        return None, None
+                    retry_after = response.headers.get("Retry-After")
+                    status = response.status
+            if status != 429 and status < 500:
+                raise RuntimeError(f"HF API error {status}: {url}")
+            if attempt < retries:
+                await asyncio.sleep(float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt)
+        raise RuntimeError(f"HF API error {status} after {retries} retries: {url}")
+
+    # =========================
+    # 크롤
+    # =========================
+
+    def _first_page(self, partition: str):
+        params = [("sort", "lastModified"), ("direction", "-1"), ("limit", str(PAGE_SIZE))]
+        params += [("expand[]", field) for field in LIST_EXPAND]
+        if partition != "all":
+            params.append(("pipeline_tag", partition))
+        return f"{self.base_url}/api/models", params
+
+    async def _fetch_detail(self, session: aiohttp.ClientSession, listing: Dict[str, Any]) -> ModelRecord:
+        try:
+            detail, _ = await self._get(session, f"{self.base_url}/api/models/{listing['id']}")
+        except Exception as e:
+            print(f"Error fetching HF model {listing['id']}: {e}", file=sys.stderr)
+            self.stats["errors"] += 1
+            detail = None
+        self.stats["detail_fetches"] += 1
+
+        # 페이지 도중 중단돼도 이미 받은 상세 정보는 남도록 바로 기록
+        fields = normalize_model(listing, detail)
+        if detail is None:
+            # 다음 크롤에서 다시 시도하도록 변경 시각을 비워 둠
+            fields["last_modified"] = ""
+        record = ModelRecord.from_dict(fields)
+        self.corpus[record["id"]] = record
+        self._append_corpus([record])
+        return record
+
+    async def _crawl_partition(self, session: aiohttp.ClientSession, partition: str):
+        progress = self.state["partitions"].setdefault(partition, {"next": None, "done": False, "seen": 0})
+        if progress["done"]:
+            return
+
+        high_water = self.state.get("high_water", "")
+        while progress["seen"] < self.max_models:
+            if progress["next"]:
+                page, next_url = await self._get(session, progress["next"])
+            else:
+                url, params = self._first_page(partition)
+                page, next_url = await self._get(session, url, params)
+            page = page or []
+            self.stats["pages"] += 1
+            self.stats["listed"] += len(page)
+
+            # lastModified가 바뀐 모델만 상세 조회
+            changed = [
+                m for m in page
+                if m.get("id") and self.corpus.get(m["id"], {}).get("last_modified") != (m.get("lastModified") or "")
+            ]
+            self.stats["unchanged"] += len(page) - len(changed)
+            records = await asyncio.gather(*(self._fetch_detail(session, m) for m in changed))
+
+            for listener in self.listeners:
+                listener(records)
+
+            progress["seen"] += len(page)
+            progress["next"] = next_url
+            # 증분 크롤: 최신순 목록에서 이미 본 시점보다 오래된 항목에 닿으면 끝
+            reached_known = bool(high_water) and bool(page) and (page[-1].get("lastModified") or "") < high_water
+            if not next_url or not page or reached_known:
+                progress["done"] = True
+            self._save_state()
+            if progress["done"]:
+                return
+
+        progress["done"] = True
+        self._save_state()
+
+    async def crawl(self) -> Dict[str, Any]:
+        """파티션을 동시에 훑어 한 사이클 완료 (중단 시 다음 호출에서 이어서)"""
+        await self.load()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        started = time.perf_counter()
+
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        async with aiohttp.ClientSession(headers=headers, trace_configs=[http_trace_config]) as session:
+            results = await asyncio.gather(
+                *(self._crawl_partition(session, p) for p in self.partitions),
+                return_exceptions=True,
+            )
+        for partition, result in zip(self.partitions, results):
+            if isinstance(result, Exception):
+                print(f"Error crawling HF partition {partition}: {result}", file=sys.stderr)
+                self.stats["errors"] += 1
+
+        partitions = self.state["partitions"]
+        if all(partitions.get(p, {}).get("done") for p in self.partitions):
+            # 사이클 완료: 다음 사이클은 증분 크롤
+            self.state["high_water"] = max(
+                (r["last_modified"] for r in self.corpus.values()), default=""
+            )
+            self.state["cycle"] = self.state.get("cycle", 0) + 1
+            self.state["partitions"] = {}
+            self._save_state()
+
+        if self._log_lines > 2 * max(len(self.corpus), 1000):
+            self.compact()
+
+        return {**self.status(), "elapsed_s": round(time.perf_counter() - started, 2)}
+
+    async def run_forever(self, interval: Optional[float] = None):
+        """주기적으로 크롤 (백그라운드 작업용)"""
+        interval = interval or float(os.getenv("HF_CRAWL_INTERVAL", "3600"))
+        while True:
+            try:
+                await self.crawl()
+            except Exception as e:
+                print(f"Error in HF crawler: {e}", file=sys.stderr)
+            await asyncio.sleep(interval)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "loaded": self.loaded,
+            "models": len(self.corpus),
+            "cycle": self.state.get("cycle", 0),
+            "high_water": self.state.get("high_water", ""),
+            "in_progress": {
+                p: {"seen": v.get("seen", 0), "done": v.get("done", False)}
+                for p, v in self.state.get("partitions", {}).items()
+            },
+            **self.stats,
+        }
+
+
+hf_crawler = HFCatalogCrawler()
@@ -0,0 +1,140 @@
+"""
+작업 설명 분류용 다중 키워드 매처
+
+키워드 → 의도(intent) 테이블로 Aho-Corasick 오토마톤을 한 번 만들어 두고,
+작업 문자열을 한 번만 훑어서 매칭된 모든 의도를 돌려줍니다.
+키워드가 수백 개로 늘어나도 분류 비용은 입력 길이에만 비례합니다.
+"""
+
+from typing import Dict, Iterable, List, Tuple
+from collections import deque
+
+
+class KeywordMatcher:
+    """Aho-Corasick 기반 키워드 → 의도 분류기"""
+
+    def __init__(self, table: Dict[str, Iterable[str]]):
+        # 노드별 전이 / 실패 링크 / 출력(키워드 인덱스) 목록
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        self.keywords: List[str] = []
+        self.intents: List[Tuple[str, ...]] = []
+
+        for keyword, intents in table.items():
+            self._add(keyword.lower(), tuple(intents))
+        self._build()
+
+    def _add(self, keyword: str, intents: Tuple[str, ...]):
+        if not keyword:
+            return
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(len(self.keywords))
+        self.keywords.append(keyword)
+        self.intents.append(intents)
+
+    def _build(self):
+        """BFS로 실패 링크를 계산하고 출력 목록을 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _scan(self, text: str) -> List[int]:
+        """텍스트를 한 번 훑어 매칭된 키워드 인덱스를 등장 순서대로 반환"""
+        matched: Dict[int, None] = {}
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in text.lower():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for idx in out[node]:
+                matched[idx] = None
+        return list(matched)
+
+    def find(self, text: str) -> List[str]:
+        """텍스트에 등장한 키워드 목록 (중복 제거)"""
+        return [self.keywords[idx] for idx in self._scan(text)]
+
+    def classify(self, text: str) -> List[str]:
+        """텍스트에서 매칭된 모든 의도를 반환 (첫 등장 순서, 중복 제거)"""
+        intents: Dict[str, None] = {}
+        for idx in self._scan(text):
+            for intent in self.intents[idx]:
+                intents[intent] = None
+        return list(intents)
+
+
+# =========================
+# 키워드 → 의도 테이블
+# =========================
+
+# AI Agent 추천: 작업 키워드 → 카탈로그 서브카테고리
+AGENT_TASK_KEYWORDS: Dict[str, List[str]] = {
+    "게임": ["game-dev"],
+    "game": ["game-dev"],
+    "앱": ["app-dev"],
+    "app": ["app-dev"],
+    "웹": ["web-dev"],
+    "web": ["web-dev"],
+    "코딩": ["coding"],
+    "coding": ["coding"],
+    "연구": ["literature-review", "data-analysis"],
+    "research": ["literature-review", "data-analysis"],
+    "이미지": ["image-generation"],
+    "image": ["image-generation"],
+    "글": ["writing"],
+    "writing": ["writing"],
+}
+
+# Hugging Face 모델 검색: 작업 키워드 → pipeline 유형
+MODEL_TASK_TYPE_KEYWORDS: Dict[str, List[str]] = {
+    "이미지": ["text-to-image"],
+    "image": ["text-to-image"],
+    "그림": ["text-to-image"],
+    "번역": ["translation"],
+    "translation": ["translation"],
+    "요약": ["summarization"],
+    "summary": ["summarization"],
+}
+
+# 여러 유형이 매칭될 때의 우선순위
+MODEL_TASK_TYPE_PRIORITY = ["text-to-image", "translation", "summarization"]
+
+# LLM 추천: 작업 키워드 → 요구 능력
+MODEL_REQUIREMENT_KEYWORDS: Dict[str, List[str]] = {
+    "고전 문헌": ["reasoning", "long-context", "multilingual"],
+    "논문": ["reasoning", "long-context", "technical"],
+    "paper": ["reasoning", "long-context", "technical"],
+    "코딩": ["code", "technical"],
+    "coding": ["code", "technical"],
+    "창작": ["creative"],
+    "번역": ["translation", "multilingual"],
+    "요약": ["summarization"],
+    "실시간": ["low-latency"],
+    "realtime": ["low-latency"],
+    "채팅": ["low-latency"],
+    "chat": ["low-latency"],
+}
+
+agent_task_matcher = KeywordMatcher(AGENT_TASK_KEYWORDS)
+model_task_type_matcher = KeywordMatcher(MODEL_TASK_TYPE_KEYWORDS)
+model_requirement_matcher = KeywordMatcher(MODEL_REQUIREMENT_KEYWORDS)
@@ -0,0 +1,246 @@
+"""
+리더보드 페이지 파싱
+
+Artificial Analysis / LMSYS Arena 페이지(HTML 또는 JSON)에서 모델 순위 표를 추출합니다.
+이 모듈의 파싱 함수는 디코딩 실행기(run_decode)에서 실행되며, DECODE_EXECUTOR=process일 때도
+쓸 수 있도록 모듈 최상위 함수이고 입력(문자열)과 출력(dict)이 모두 pickle 가능합니다.
+
+표는 다음 위치에서 찾습니다.
+1. HTML <table>
+2. Gradio 앱 설정(window.gradio_config)의 dataframe 값 {"headers": [...], "data": [[...]]}
+3. JSON 본문 또는 Next.js __NEXT_DATA__ 안의 dict 목록
+"""
+
+import json
+import re
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+Table = Tuple[List[str], List[List[Any]]]
+
+# 필드 → 헤더에 포함될 수 있는 문자열 (소문자)
+ARTIFICIAL_ANALYSIS_COLUMNS = {
+    "model": ["model", "name"],
+    "creator": ["creator", "organization", "provider", "developer"],
+    "intelligence_index": ["intelligence", "quality"],
+    "speed": ["speed", "tokens/s", "output tokens"],
+    "price_per_1m": ["price", "usd/1m", "cost"],
+    "context_window": ["context"],
+}
+
+LMSYS_ARENA_COLUMNS = {
+    "model": ["model", "name"],
+    "rank": ["rank"],
+    "elo_rating": ["arena score", "arena elo", "elo", "score", "rating"],
+    "organization": ["organization", "creator", "provider"],
+}
+
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def parse_number(value: Any) -> Optional[float]:
+    """'$4.50', '1,285', '136 t/s' 같은 셀 값을 숫자로 변환"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None:
+        return None
+    match = _NUMBER_RE.search(str(value).replace(",", ""))
+    return float(match.group()) if match else None
+
+
+def compact_number(value: Optional[float]) -> Optional[float]:
+    """정수값이면 int로 (73.0 → 73)"""
+    if value is not None and float(value).is_integer():
+        return int(value)
+    return value
+
+
+def clean_text(value: Any) -> str:
+    """셀 값의 HTML 태그 / 마크다운 링크 제거"""
+    text = str(value or "")
+    if "<" in text:
+        text = BeautifulSoup(text, "lxml").get_text(" ")
+    text = re.sub(r"\[([^\]]+)\]\([^)]*\)", r"\1", text)
+    return " ".join(text.split())
+
+
+def _walk_json(node: Any, tables: List[Table]):
+    """JSON 트리에서 표 형태(dataframe / dict 목록)를 수집"""
+    if isinstance(node, dict):
+        headers, data = node.get("headers"), node.get("data")
+        if isinstance(headers, list) and isinstance(data, list) and data and isinstance(data[0], list):
+            tables.append(([str(h) for h in headers], data))
+        for value in node.values():
+            _walk_json(value, tables)
+    elif isinstance(node, list):
+        if len(node) >= 2 and all(isinstance(row, dict) for row in node):
+            headers = list(node[0].keys())
+            tables.append((headers, [[row.get(h) for h in headers] for row in node]))
+        for value in node:
+            _walk_json(value, tables)
+
+
+def _json_after(marker: str, text: str) -> Optional[Any]:
+    """'marker = {...}' 형태로 삽입된 JSON 객체 추출"""
+    start = text.find(marker)
+    if start < 0:
+        return None
+    start = text.find("{", start)
+    try:
+        value, _ = json.JSONDecoder().raw_decode(text, start)
+        return value
+    except ValueError:
+        return None
+
+
+def extract_tables(content: str) -> List[Table]:
+    """페이지 본문에서 후보 표를 모두 추출"""
+    tables: List[Table] = []
+
+    stripped = content.lstrip()
+    if stripped.startswith("{") or stripped.startswith("["):
+        try:
+            _walk_json(json.loads(stripped), tables)
+            return tables
+        except ValueError:
+            pass
+
+    soup = BeautifulSoup(content, "lxml")
+
+    for table in soup.find_all("table"):
+        rows = table.find_all("tr")
+        if len(rows) < 2:
+            continue
+        headers = [cell.get_text(" ", strip=True) for cell in rows[0].find_all(["th", "td"])]
+        body = [
+            [cell.get_text(" ", strip=True) for cell in row.find_all(["td", "th"])]
+            for row in rows[1:]
+        ]
+        tables.append((headers, [row for row in body if row]))
+
+    next_data = soup.find("script", id="__NEXT_DATA__")
+    if next_data and next_data.string:
+        try:
+            _walk_json(json.loads(next_data.string), tables)
+        except ValueError:
+            pass
+
+    for script in soup.find_all("script"):
+        if script.string and "gradio_config" in script.string:
+            config = _json_after("gradio_config", script.string)
+            if config is not None:
+                _walk_json(config, tables)
+
+    return tables
+
+
+def _map_columns(headers: List[str], columns: Dict[str, List[str]]) -> Dict[str, int]:
+    """헤더 → 필드 인덱스 매핑 (정확히 같은 헤더 우선, 그다음 앞쪽 별칭을 포함하는 헤더)"""
+    lowered = [clean_text(h).lower().replace("_", " ") for h in headers]
+    mapping: Dict[str, int] = {}
+    # JSON 키(name / model_creator)처럼 별칭을 포함하는 다른 열이 있어도 정확한 열을 먼저 차지
+    for field, aliases in columns.items():
+        for alias in aliases:
+            if alias in lowered and lowered.index(alias) not in mapping.values():
+                mapping[field] = lowered.index(alias)
+                break
+    for field, aliases in columns.items():
+        if field in mapping:
+            continue
+        for alias in aliases:
+            for idx, header in enumerate(lowered):
+                if alias in header and idx not in mapping.values():
+                    mapping[field] = idx
+                    break
+            if field in mapping:
+                break
+    return mapping
+
+
+def _best_table(tables: List[Table], columns: Dict[str, List[str]]) -> Tuple[Optional[Table], Dict[str, int]]:
+    """model 열이 있고 가장 많은 필드가 매칭되는 표 선택"""
+    best, best_mapping = None, {}
+    for table in tables:
+        mapping = _map_columns(table[0], columns)
+        if "model" in mapping and len(mapping) > len(best_mapping):
+            best, best_mapping = table, mapping
+    return best, best_mapping
+
+
+def _timed(parse, content: str) -> Dict[str, Any]:
+    """파싱 결과와 소요 시간(ms), 입력 크기를 함께 반환"""
+    started = time.perf_counter()
+    rows = parse(content)
+    return {
+        "rows": rows,
+        "parse_ms": round((time.perf_counter() - started) * 1000, 2),
+        "bytes": len(content),
+    }
+
+
+def _parse_artificial_analysis(content: str) -> List[Dict[str, Any]]:
+    table, mapping = _best_table(extract_tables(content), ARTIFICIAL_ANALYSIS_COLUMNS)
+    if table is None:
+        return []
+
+    rows = []
+    for cells in table[1]:
+        def cell(field):
+            idx = mapping.get(field)
+            return cells[idx] if idx is not None and idx < len(cells) else None
+
+        model = clean_text(cell("model"))
+        intelligence = parse_number(cell("intelligence_index"))
+        if not model or intelligence is None:
+            continue
+        rows.append({
+            "model": model,
+            "creator": clean_text(cell("creator")) or "Unknown",
+            "intelligence_index": compact_number(intelligence),
+            "speed": compact_number(parse_number(cell("speed")) or 0),
+            "price_per_1m": parse_number(cell("price_per_1m")),
+            "context_window": clean_text(cell("context_window")).lower(),
+        })
+    return rows
+
+
+def _parse_lmsys_arena(content: str) -> List[Dict[str, Any]]:
+    table, mapping = _best_table(extract_tables(content), LMSYS_ARENA_COLUMNS)
+    if table is None:
+        return []
+
+    rows = []
+    for position, cells in enumerate(table[1], start=1):
+        def cell(field):
+            idx = mapping.get(field)
+            return cells[idx] if idx is not None and idx < len(cells) else None
+
+        model = clean_text(cell("model"))
+        if not model:
+            continue
+        elo = parse_number(cell("elo_rating"))
+        rank = parse_number(cell("rank"))
+        rows.append({
+            "model": model,
+            "elo_rating": int(elo) if elo is not None else None,
+            "rank": int(rank) if rank is not None else position,
+            "organization": clean_text(cell("organization")) or "Unknown",
+            "arena_score": int(elo) if elo is not None else None,
+        })
+    return rows
+
+
+# =========================
+# 실행기 진입점
+# =========================
+
+def parse_artificial_analysis(content: str) -> Dict[str, Any]:
+    """Artificial Analysis 페이지 파싱 (rows / parse_ms / bytes)"""
+    return _timed(_parse_artificial_analysis, content)
+
+
+def parse_lmsys_arena(content: str) -> Dict[str, Any]:
+    """LMSYS Arena 페이지 파싱 (rows / parse_ms / bytes)"""
+    return _timed(_parse_lmsys_arena, content)
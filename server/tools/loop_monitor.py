@@ -0,0 +1,67 @@
+"""
+이벤트 루프 지연(lag) 측정
+
+일정 간격으로 잠들었다 깨어나면서 예정 시각보다 얼마나 늦게 깨어났는지 기록합니다.
+루프를 막는 동기 작업(피드 파싱, 큰 JSON 디코딩 등)이 있으면 지연이 커집니다.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 샘플러"""
+
+    def __init__(self, interval: float = 0.05, window: int = 2000):
+        self.interval = interval
+        self.samples = deque(maxlen=window)  # 최근 지연(ms)
+        self.max_lag_ms = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            lag_ms = max(0.0, (time.perf_counter() - expected) * 1000)
+            self.samples.append(lag_ms)
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def reset(self):
+        self.samples.clear()
+        self.max_lag_ms = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """최근 구간의 지연 통계 (ms)"""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"samples": 0}
+
+        def pct(p):
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))], 2)
+
+        return {
+            "samples": len(ordered),
+            "interval_ms": self.interval * 1000,
+            "p50_ms": pct(0.50),
+            "p95_ms": pct(0.95),
+            "p99_ms": pct(0.99),
+            "max_ms": round(self.max_lag_ms, 2),
+        }
+
+
+loop_monitor = LoopLagMonitor()
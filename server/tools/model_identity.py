@@ -0,0 +1,110 @@
+"""
+소스 간 모델 식별 색인
+
+리더보드와 HF는 같은 모델을 서로 다른 이름으로 부릅니다.
+    "Claude Opus 4.5" / "claude-opus-4-5-20251101" / "anthropic/claude-opus-4.5"
+이름을 정규화한 키로 소스별 행을 한 번 묶어 두면, 추천 시에는
+문자열 비교 없이 dict 조회 한 번으로 다른 소스의 지표를 가져올 수 있습니다.
+색인은 소스 데이터가 새로 수집될 때마다 한 번만 만듭니다.
+
+"(high)" / "(low)" 같은 추론 강도 / 변형 표기는 서로 다른 모델로 구분합니다.
+변형 행이 없는 소스는 변형 표기가 없는 기본 모델의 행으로 대신합니다.
+    "GPT-5 (high)" → AA의 "GPT-5 (high)" + 아레나의 "gpt-5"
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z]+|\d+")
+_PAREN_RE = re.compile(r"\((.*?)\)|\[(.*?)\]")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# 모델 정체성과 무관한 이름 토큰
+NOISE_TOKENS = frozenset({"preview", "latest", "exp", "experimental", "hf"})
+
+# 괄호 안의 스냅샷 날짜 표기 ("(Nov '24)")
+MONTH_TOKENS = frozenset({"jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "sept",
+                          "oct", "nov", "dec"})
+
+IdentityKey = Tuple[str, ...]
+
+
+def _identity_keys(name: Any) -> Tuple[IdentityKey, IdentityKey]:
+    """모델 이름 → (변형 표기를 포함한 키, 기본 모델 키)"""
+    text = str(name or "").lower()
+    # 괄호 안은 영문 변형 표기만 남김 ("(high)", "(Reasoning)"; 날짜 / 숫자는 버림)
+    qualifiers = [
+        token
+        for group in _PAREN_RE.findall(text)
+        for token in _TOKEN_RE.findall(" ".join(group))
+        if not token.isdigit() and token not in NOISE_TOKENS and token not in MONTH_TOKENS
+    ]
+    text = _PAREN_RE.sub(" ", text)
+    text = _DATE_RE.sub(" ", text.rsplit("/", 1)[-1])
+    words, numbers = [], []
+    for token in _TOKEN_RE.findall(text):
+        if token in NOISE_TOKENS or (token.isdigit() and len(token) == 8):
+            continue
+        (numbers if token.isdigit() else words).append(token)
+    base = tuple(sorted(words)) + tuple(numbers)
+    if not base:
+        return (), ()
+    return tuple(sorted(words + qualifiers)) + tuple(numbers), base
+
+
+def identity_key(name: Any) -> IdentityKey:
+    """모델 이름 → 정규화 키
+
+    조직 접두어("org/"), 날짜 접미사와 잡음 토큰을 버리고
+    영문 토큰은 정렬, 숫자 토큰(버전)은 순서를 유지해 이어 붙인 튜플입니다.
+    구분자와 어순 차이("Claude 4 Sonnet" / "claude-sonnet-4")는 같은 키가 되고,
+    괄호 변형 표기는 영문 토큰으로 남습니다. ("GPT-5 (high)" = "gpt-5-high" ≠ "GPT-5 (low)")
+    """
+    return _identity_keys(name)[0]
+
+
+def base_identity_key(name: Any) -> IdentityKey:
+    """괄호 변형 표기를 뺀 기본 모델 키 ("GPT-5 (high)" → "GPT-5"의 키)"""
+    return _identity_keys(name)[1]
+
+
+class ModelIdentityIndex:
+    """정규화 키 → 소스별 행"""
+
+    def __init__(self, sources: Dict[str, List[Dict[str, Any]]], name_fields: Optional[Dict[str, str]] = None):
+        """sources: 소스 이름 → 행 목록, name_fields: 소스별 모델 이름 필드 (기본 "model")"""
+        name_fields = name_fields or {}
+        self.entities: Dict[IdentityKey, Dict[str, Dict[str, Any]]] = {}
+        # 변형 키 → 기본 모델 키
+        self.bases: Dict[IdentityKey, IdentityKey] = {}
+        for source, rows in sources.items():
+            field = name_fields.get(source, "model")
+            for row in rows:
+                key, base = _identity_keys(row.get(field))
+                if key:
+                    # 같은 키가 여러 번 나오면 먼저 나온(상위) 행 유지
+                    self.entities.setdefault(key, {}).setdefault(source, row)
+                    if base != key:
+                        self.bases[key] = base
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def _resolve(self, key: IdentityKey, base: IdentityKey) -> Dict[str, Dict[str, Any]]:
+        entity = self.entities.get(key, {})
+        fallback = self.entities.get(base) if base != key else None
+        if not fallback:
+            return entity
+        # 변형 행이 없는 소스만 기본 모델 행으로 채움
+        return {**fallback, **entity}
+
+    def lookup(self, name: Any) -> Dict[str, Dict[str, Any]]:
+        """모델 이름 → {소스: 행} (없으면 빈 dict)"""
+        return self._resolve(*_identity_keys(name))
+
+    def joined(self, *sources: str) -> int:
+        """주어진 소스 모두에 있는 모델 수 (기본 모델 행으로 채운 소스 포함)"""
+        return sum(
+            1 for key in self.entities
+            if all(s in self._resolve(key, self.bases.get(key, key)) for s in sources)
+        )
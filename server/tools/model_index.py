@@ -0,0 +1,167 @@
+"""
+모델 순위 수치 색인
+
+리더보드 스냅샷이 바뀔 때 한 번만 컴파일해 두는 열 지향 색인입니다.
+- 숫자 열: 문맥 길이(토큰), 가격, 속도, 지능 지수
+- 차원별 정렬 색인: 임계값 조건을 bisect로 범위 조회
+- 파레토 프론티어: 어떤 조건에서든 한 차원을 최대화하는 최적 모델은 프론티어 위에 있음
+
+"문맥 ≥ 400k, 가격 < $5, 속도 최대" 같은 조건 조회를 요청마다 전체 모델을
+다시 파싱하지 않고 처리합니다.
+"""
+
+import bisect
+import math
+import re
+from array import array
+from typing import Any, Dict, List, Optional, Set
+
+_CONTEXT_RE = re.compile(r"([\d.,]+)\s*([km]?)", re.IGNORECASE)
+
+# 차원 → 큰 값이 좋은지 여부
+DIMENSIONS = {
+    "context": True,
+    "price": False,
+    "speed": True,
+    "intelligence": True,
+}
+
+
+def parse_context_tokens(value: Any) -> int:
+    """'1m', '400k', '128K tokens', 200000 → 토큰 수 (해석 불가하면 0)"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    match = _CONTEXT_RE.search(str(value or ""))
+    if not match:
+        return 0
+    try:
+        number = float(match.group(1).replace(",", ""))
+    except ValueError:
+        return 0
+    unit = match.group(2).lower()
+    return int(number * {"k": 1_000, "m": 1_000_000}.get(unit, 1))
+
+
+class ModelIndex:
+    """리더보드 행의 수치 열 / 정렬 색인 / 파레토 프론티어"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.columns = {
+            "context": array("d", (parse_context_tokens(r.get("context_window")) for r in rows)),
+            # 가격이 없으면 조건에서 항상 탈락하도록 무한대
+            "price": array("d", (math.inf if r.get("price_per_1m") is None else r["price_per_1m"] for r in rows)),
+            "speed": array("d", (r.get("speed") or 0 for r in rows)),
+            "intelligence": array("d", (r.get("intelligence_index") or 0 for r in rows)),
+        }
+
+        # 차원별 오름차순 정렬 색인 (행 번호 / 값)
+        self.order: Dict[str, List[int]] = {}
+        self.sorted_values: Dict[str, List[float]] = {}
+        for dim, column in self.columns.items():
+            order = sorted(range(len(rows)), key=column.__getitem__)
+            self.order[dim] = order
+            self.sorted_values[dim] = [column[i] for i in order]
+
+        self.frontier = self._pareto_frontier()
+        self._frontier_set = frozenset(self.frontier)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _dominates(self, a: int, b: int) -> bool:
+        better = False
+        for dim, higher in DIMENSIONS.items():
+            va, vb = self.columns[dim][a], self.columns[dim][b]
+            if va == vb:
+                continue
+            if (va > vb) != higher:
+                return False
+            better = True
+        return better
+
+    def _pareto_frontier(self) -> List[int]:
+        """어떤 모델에도 지배되지 않는 모델 목록 (지능 지수 내림차순 스캔)"""
+        frontier: List[int] = []
+        for i in reversed(self.order["intelligence"]):
+            if not any(self._dominates(j, i) for j in frontier):
+                frontier = [j for j in frontier if not self._dominates(i, j)]
+                frontier.append(i)
+        return frontier
+
+    # =========================
+    # 조회
+    # =========================
+
+    def at_least(self, dim: str, threshold: float, strict: bool = False) -> range:
+        """dim 값이 threshold 이상(strict면 초과)인 정렬 색인 구간"""
+        values = self.sorted_values[dim]
+        start = (bisect.bisect_right if strict else bisect.bisect_left)(values, threshold)
+        return range(start, len(values))
+
+    def at_most(self, dim: str, threshold: float, strict: bool = False) -> range:
+        """dim 값이 threshold 이하(strict면 미만)인 정렬 색인 구간"""
+        values = self.sorted_values[dim]
+        end = (bisect.bisect_left if strict else bisect.bisect_right)(values, threshold)
+        return range(0, end)
+
+    def ids(self, dim: str, positions: range) -> Set[int]:
+        """정렬 색인 구간 → 행 번호 집합"""
+        order = self.order[dim]
+        return {order[p] for p in positions}
+
+    def _matches(self, i: int, min_context: float, max_price: float, min_speed: float, min_intelligence: float) -> bool:
+        c = self.columns
+        return (
+            c["context"][i] >= min_context
+            and c["price"][i] <= max_price
+            and c["speed"][i] >= min_speed
+            and c["intelligence"][i] >= min_intelligence
+        )
+
+    def query(self, min_context: float = 0, max_price: Optional[float] = None, min_speed: float = 0,
+              min_intelligence: float = 0, maximize: str = "intelligence", limit: int = 5) -> List[Dict[str, Any]]:
+        """조건을 만족하는 모델 중 maximize 차원 기준 상위 limit개"""
+        if maximize not in DIMENSIONS:
+            raise ValueError(f"Unknown dimension: {maximize}")
+        if limit <= 0:
+            return []
+        max_price = math.inf if max_price is None else max_price
+        args = (min_context, max_price, min_speed, min_intelligence)
+
+        # 최적 1개는 프론티어만 보면 충분
+        if limit == 1:
+            candidates = [i for i in self.frontier if self._matches(i, *args)]
+            best = self._rank(candidates, maximize)[:1]
+            return [self.describe(i) for i in best]
+
+        # maximize 순서로 훑다가 limit개를 채우면 중단
+        order = self.order[maximize]
+        walk = reversed(order) if DIMENSIONS[maximize] else iter(order)
+        results = []
+        for i in walk:
+            if self._matches(i, *args):
+                results.append(self.describe(i))
+                if len(results) >= limit:
+                    break
+        return results
+
+    def _rank(self, ids: List[int], dim: str) -> List[int]:
+        column = self.columns[dim]
+        return sorted(ids, key=column.__getitem__, reverse=DIMENSIONS[dim])
+
+    def describe(self, i: int) -> Dict[str, Any]:
+        """행 번호 → 응답용 모델 정보"""
+        row = self.rows[i]
+        return {
+            "model": row.get("model"),
+            "creator": row.get("creator"),
+            "specs": {
+                "intelligence": row.get("intelligence_index"),
+                "speed": row.get("speed"),
+                "price": row.get("price_per_1m"),
+                "context": row.get("context_window"),
+                "context_tokens": int(self.columns["context"][i]),
+            },
+            "pareto_optimal": i in self._frontier_set,
+        }
@@ -0,0 +1,192 @@
+"""
+HF 모델 메타데이터 검색 색인
+
+크롤러 코퍼스(hf_crawler)를 pipeline_tag / 태그별 포스팅 목록으로 색인합니다.
+다운로드 점수와 최근성 점수는 미리 계산해 두므로
+작업 검색은 업스트림 호출 없이 포스팅 교집합 + top-k로 끝납니다.
+최근성은 수정 시각(epoch)을 저장해 두고 조회 시각 기준으로 판단합니다.
+(RECENT_SECONDS가 지난 문서는 만료 힙에서 꺼내 점수를 다시 계산)
+"""
+
+import heapq
+import re
+import time
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from .records import ModelRecord
+from .timeutils import to_epoch
+
+# search_models_by_task와 같은 점수 기준
+POPULAR_DOWNLOADS = 100000
+RECENT_SECONDS = 30 * 86400
+
+_TAG_SPLIT_RE = re.compile(r"[-_/:.\s]+")
+
+
+def tag_terms(tag: str) -> Set[str]:
+    """태그 → 검색어 (태그 전체 + 구분자로 나눈 토큰)"""
+    lowered = str(tag).lower()
+    return {lowered, *filter(None, _TAG_SPLIT_RE.split(lowered))}
+
+
+class ModelSearchIndex:
+    """pipeline_tag / 태그 포스팅 목록과 사전 계산 점수"""
+
+    def __init__(self):
+        self.docs: List[ModelRecord] = []
+        self.doc_ids: Dict[str, int] = {}
+
+        # pipeline_tag → 문서, pipeline_tag → 태그 검색어 → 문서
+        self.by_pipeline: Dict[str, Set[int]] = {}
+        self.by_term: Dict[str, Dict[str, Set[int]]] = {}
+
+        # 문서별 사전 계산 점수 / 이유 (인기도 + 최근성)
+        self.static_score: List[int] = []
+        self.static_reasons: List[Tuple[str, ...]] = []
+        # 문서별 수정 시각과 최근성 점수 만료 힙 (만료 시각, 문서)
+        self.modified: List[float] = []
+        self._recent_expiry: List[Tuple[float, int]] = []
+
+        # pipeline_tag별 (점수, 다운로드) 내림차순 목록과 점수 > 0 문서 수 (필요할 때 재정렬)
+        self._ranked: Dict[str, List[int]] = {}
+        self._scored: Dict[str, int] = {}
+        self._dirty: Set[str] = set()
+        # add()마다 증가 (검색 결과 캐시 무효화용)
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def attach(self, crawler):
+        """크롤러가 코퍼스를 불러오거나 페이지를 받을 때마다 색인되도록 등록"""
+        if crawler.loaded:
+            self.add(crawler.corpus.values())
+        crawler.listeners.append(self.add)
+
+    def add(self, records: Iterable[ModelRecord]):
+        """코퍼스 레코드 추가 / 갱신 (크롤러 리스너)"""
+        now = time.time()
+        self.version += 1
+        for record in records:
+            doc = self.doc_ids.get(record["id"])
+            if doc is None:
+                doc = len(self.docs)
+                self.doc_ids[record["id"]] = doc
+                self.docs.append(record)
+                self.static_score.append(0)
+                self.static_reasons.append(())
+                self.modified.append(0.0)
+            else:
+                self._unindex(doc)
+                self.docs[doc] = record
+
+            pipeline = record.get("pipeline_tag") or ""
+            self.by_pipeline.setdefault(pipeline, set()).add(doc)
+            terms = self.by_term.setdefault(pipeline, {})
+            for tag in record.get("tags", []):
+                for term in tag_terms(tag):
+                    terms.setdefault(term, set()).add(doc)
+
+            self.modified[doc] = to_epoch(record.get("last_modified")) or 0.0
+            if self._rescore(doc, now):
+                heapq.heappush(self._recent_expiry, (self.modified[doc] + RECENT_SECONDS, doc))
+            self._dirty.add(pipeline)
+
+    def _rescore(self, doc: int, now: float) -> bool:
+        """문서의 인기도 + 최근성 점수 계산 (최근 업데이트 문서면 True)"""
+        score, reasons = 0, []
+        if self.docs[doc].get("downloads", 0) > POPULAR_DOWNLOADS:
+            score += 20
+            reasons.append("높은 사용률")
+        recent = bool(self.modified[doc]) and now - self.modified[doc] < RECENT_SECONDS
+        if recent:
+            score += 10
+            reasons.append("최근 업데이트")
+        self.static_score[doc] = score
+        self.static_reasons[doc] = tuple(reasons)
+        return recent
+
+    def _expire_recent(self, now: float):
+        """최근성 기간이 지난 문서의 점수에서 최근성 제외"""
+        expiry = self._recent_expiry
+        while expiry and expiry[0][0] <= now:
+            expires, doc = heapq.heappop(expiry)
+            # 다시 추가되며 수정 시각이 바뀐 문서의 예전 항목은 무시
+            if self.modified[doc] + RECENT_SECONDS != expires:
+                continue
+            self._rescore(doc, now)
+            self._dirty.add(self.docs[doc].get("pipeline_tag") or "")
+
+    def _unindex(self, doc: int):
+        record = self.docs[doc]
+        pipeline = record.get("pipeline_tag") or ""
+        self.by_pipeline.get(pipeline, set()).discard(doc)
+        terms = self.by_term.get(pipeline, {})
+        for tag in record.get("tags", []):
+            for term in tag_terms(tag):
+                terms.get(term, set()).discard(doc)
+        self._dirty.add(pipeline)
+
+    def _ranked_for(self, pipeline: str) -> List[int]:
+        if pipeline in self._dirty or pipeline not in self._ranked:
+            docs = self.by_pipeline.get(pipeline, set())
+            self._ranked[pipeline] = sorted(
+                docs,
+                key=lambda d: (self.static_score[d], self.docs[d].get("downloads", 0)),
+                reverse=True,
+            )
+            self._scored[pipeline] = sum(1 for d in docs if self.static_score[d] > 0)
+            self._dirty.discard(pipeline)
+        return self._ranked[pipeline]
+
+    def search(self, task_type: str, keywords: List[str], k: int = 5) -> Tuple[List[Dict[str, Any]], int]:
+        """pipeline_tag 안에서 키워드 태그 매칭 + 사전 점수로 상위 k개 (결과, 전체 매칭 수)"""
+        self._expire_recent(time.time())
+        terms = self.by_term.get(task_type, {})
+
+        # 키워드별 포스팅 → 키워드 매칭 점수
+        keyword_hits: Dict[int, List[str]] = {}
+        for keyword in dict.fromkeys(keywords):
+            for doc in terms.get(keyword, ()):
+                keyword_hits.setdefault(doc, []).append(keyword)
+
+        def score(doc: int) -> int:
+            return self.static_score[doc] + 10 * len(keyword_hits.get(doc, ()))
+
+        # 키워드 매칭 문서는 정확히 채점, 나머지는 사전 정렬 목록의 앞부분만 보면 충분
+        ranked = self._ranked_for(task_type)
+        pool = set(keyword_hits)
+        for doc in ranked:
+            if len(pool) >= len(keyword_hits) + k or self.static_score[doc] == 0:
+                break
+            pool.add(doc)
+
+        top = heapq.nlargest(
+            k,
+            (doc for doc in pool if score(doc) > 0),
+            key=lambda d: (score(d), self.docs[d].get("downloads", 0)),
+        )
+
+        total = self._scored[task_type] + sum(1 for d in keyword_hits if self.static_score[d] == 0)
+
+        results = []
+        for doc in top:
+            record = self.docs[doc]
+            reasons = [f"'{kw}' 태그 매칭" for kw in keyword_hits.get(doc, ())]
+            results.append({
+                "name": record["id"],
+                "author": record.get("author", "Unknown"),
+                "downloads": record.get("downloads", 0),
+                "likes": record.get("likes", 0),
+                "tags": list(record.get("tags", ())),
+                "pipeline_tag": record.get("pipeline_tag", ""),
+                "created_at": record.get("created_at", ""),
+                "last_modified": record.get("last_modified", ""),
+                "source": "Hugging Face",
+                "relevance_score": score(doc),
+                "reasons": reasons + list(self.static_reasons[doc]),
+            })
+        return results, total
+
+
+model_search_index = ModelSearchIndex()
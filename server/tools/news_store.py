@@ -0,0 +1,223 @@
+"""
+인메모리 뉴스 저장소
+
+수집한 뉴스 항목을 시간 / 소스 / 타입 / 태그로 색인해 두고,
+- cursor: 과거 방향 페이지 탐색 (업스트림 재호출 없음)
+- since: 클라이언트의 마지막 호출 이후 추가된 항목만 반환 (폴링용 델타)
+을 지원합니다. 두 토큰 모두 클라이언트에게는 불투명한 문자열입니다.
+항목은 NewsItem 레코드로 보관하고 응답할 때만 dict로 변환합니다.
+"""
+
+import bisect
+import heapq
+import secrets
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .projection import Fields, decode_token as _decode_token, encode_token as _encode_token, project
+from .records import NewsItem
+
+
+def item_key(item: Dict[str, Any]) -> str:
+    """항목 식별 키 (URL 우선)"""
+    return item.get("url") or f"{item.get('source')}:{item.get('title')}"
+
+
+def item_tags(item: Dict[str, Any]) -> List[str]:
+    """소스별 태그 필드 (arXiv categories / HF tags / GitHub topics)"""
+    return item.get("tags") or item.get("categories") or item.get("topics") or []
+
+
+class NewsStore:
+    """시간·소스·타입·태그 색인을 가진 뉴스 저장소"""
+
+    def __init__(self, max_items: int = 5000):
+        self.max_items = max_items
+        # 프로세스별 식별자: 재시작 / 다른 인스턴스의 since 토큰 구분용
+        self.store_id = secrets.token_hex(4)
+
+        self._seq = 0
+        self._items: Dict[str, NewsItem] = {}
+        self._entry: Dict[str, Tuple[int, int]] = {}  # key -> (timestamp, seq)
+
+        # 시간 색인: (timestamp, seq, key) 오름차순
+        self._timeline: List[Tuple[int, int, str]] = []
+        # 추가 순서 색인: (seq, key) 오름차순
+        self._added: List[Tuple[int, str]] = []
+
+        self._by_source: Dict[str, Set[str]] = {}
+        self._by_type: Dict[str, Set[str]] = {}
+        self._by_tag: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def version(self) -> int:
+        """항목이 추가될 때마다 바뀌는 버전 (since / cursor 토큰이 바뀌는 시점)"""
+        return self._seq
+
+    # =========================
+    # 수집
+    # =========================
+
+    def add_many(self, items: Iterable[Dict[str, Any]]) -> int:
+        """항목 추가 (내용이 바뀐 항목은 새 항목으로 취급), 추가된 개수 반환"""
+        added = 0
+        for item in items:
+            key = item_key(item)
+            timestamp = item.get("timestamp", 0)
+
+            if key in self._entry:
+                if self._entry[key][0] == timestamp:
+                    continue
+                self._remove(key)
+
+            self._seq += 1
+            item = self._items[key] = self.record(item)
+            self._entry[key] = (timestamp, self._seq)
+            bisect.insort(self._timeline, (timestamp, self._seq, key))
+            self._added.append((self._seq, key))
+
+            self._by_source.setdefault(item.get("source", ""), set()).add(key)
+            self._by_type.setdefault(item.get("type", ""), set()).add(key)
+            for tag in item_tags(item):
+                self._by_tag.setdefault(str(tag).lower(), set()).add(key)
+            added += 1
+
+        self._evict()
+        return added
+
+    @staticmethod
+    def record(item: Dict[str, Any]) -> NewsItem:
+        """dict 항목 → 저장용 레코드"""
+        return item if isinstance(item, NewsItem) else NewsItem.from_dict(item)
+
+    def shared(self, item: Dict[str, Any]) -> NewsItem:
+        """저장소에 같은 항목이 있으면 그 레코드를 공유, 없으면 새 레코드"""
+        stored = self._items.get(item_key(item))
+        if stored is not None and stored.get("timestamp", 0) == item.get("timestamp", 0):
+            return stored
+        return self.record(item)
+
+    def _remove(self, key: str):
+        item = self._items.pop(key)
+        timestamp, seq = self._entry.pop(key)
+
+        pos = bisect.bisect_left(self._timeline, (timestamp, seq, key))
+        del self._timeline[pos]
+        pos = bisect.bisect_left(self._added, seq, key=lambda e: e[0])
+        del self._added[pos]
+
+        self._by_source.get(item.get("source", ""), set()).discard(key)
+        self._by_type.get(item.get("type", ""), set()).discard(key)
+        for tag in item_tags(item):
+            self._by_tag.get(str(tag).lower(), set()).discard(key)
+
+    def _evict(self):
+        """용량 초과 시 가장 오래된 항목부터 제거"""
+        while len(self._items) > self.max_items:
+            self._remove(self._timeline[0][2])
+
+    # =========================
+    # 조회
+    # =========================
+
+    def _candidates(self, types: Optional[List[str]], source: Optional[str], tag: Optional[str]) -> Optional[Set[str]]:
+        """필터 색인 교집합 (필터가 없으면 None)"""
+        sets = []
+        if types is not None:
+            sets.append(set().union(*(self._by_type.get(t, set()) for t in types)))
+        if source:
+            sets.append(self._by_source.get(source, set()))
+        if tag:
+            sets.append(self._by_tag.get(tag.lower(), set()))
+        if not sets:
+            return None
+        sets.sort(key=len)
+        return set(sets[0]).intersection(*sets[1:])
+
+    def since_token(self, seq: Optional[int] = None) -> str:
+        """since 토큰 (기본값: 현재 시점)"""
+        watermark = self._timeline[-1][0] if self._timeline else 0
+        return _encode_token({"s": self.store_id, "q": self._seq if seq is None else seq, "t": watermark})
+
+    def cursor_for(self, item: Dict[str, Any]) -> Optional[str]:
+        """주어진 항목 다음(더 과거)부터 이어 보는 cursor"""
+        entry = self._entry.get(item_key(item))
+        if entry is None:
+            return None
+        return _encode_token({"t": entry[0], "q": entry[1]})
+
+    def page(self, types: Optional[List[str]] = None, source: Optional[str] = None, tag: Optional[str] = None,
+             limit: int = 10, cursor: Optional[str] = None, fields: Fields = None) -> Dict[str, Any]:
+        """최신순 페이지 조회 (cursor가 있으면 그 이전 항목부터, fields가 있으면 해당 필드만)"""
+        bound = (float("inf"), 0)
+        if cursor:
+            data = _decode_token(cursor)
+            bound = (data["t"], data["q"])
+
+        candidates = self._candidates(types, source, tag)
+        if candidates is None:
+            # 시간 색인을 경계부터 거꾸로 훑기
+            end = bisect.bisect_left(self._timeline, bound)
+            entries = self._timeline[max(0, end - limit - 1):end][::-1]
+        else:
+            entries = heapq.nlargest(
+                limit + 1,
+                (
+                    (ts, seq, key)
+                    for key in candidates
+                    for ts, seq in (self._entry[key],)
+                    if (ts, seq) < bound
+                ),
+            )
+
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        next_cursor = None
+        if has_more and entries:
+            ts, seq, _ = entries[-1]
+            next_cursor = _encode_token({"t": ts, "q": seq})
+
+        return {
+            "items": [project(self._items[key], fields) for _, _, key in entries],
+            "next_cursor": next_cursor,
+            "since": self.since_token(),
+        }
+
+    def changes_since(self, since: str, types: Optional[List[str]] = None, source: Optional[str] = None,
+                      tag: Optional[str] = None, limit: int = 100, fields: Fields = None) -> Dict[str, Any]:
+        """since 토큰 이후 추가된 항목 (추가된 순서)
+        
+        limit을 넘으면 잘린 지점까지의 토큰을 돌려주므로
+        돌려받은 토큰으로 다시 호출해 나머지를 이어 받을 수 있습니다.
+        """
+        data = _decode_token(since)
+        candidates = self._candidates(types, source, tag)
+
+        if data.get("s") == self.store_id:
+            start = bisect.bisect_right(self._added, data["q"], key=lambda e: e[0])
+            entries = [
+                (seq, key) for seq, key in self._added[start:]
+                if candidates is None or key in candidates
+            ]
+            truncated = len(entries) > limit
+            entries = entries[:limit]
+            token = self.since_token(entries[-1][0] if truncated else None)
+            keys = [key for _, key in entries]
+        else:
+            # 재시작 / 다른 인스턴스가 발급한 토큰: 시간 워터마크 이후 항목으로 대체
+            start = bisect.bisect_right(self._timeline, (data.get("t", 0), float("inf"), ""))
+            keys = [
+                key for _, _, key in self._timeline[start:]
+                if candidates is None or key in candidates
+            ]
+            truncated = len(keys) > limit
+            keys = keys[-limit:] if limit else []
+            token = self.since_token()
+
+        return {
+            "items": [project(self._items[key], fields) for key in keys],
+            "truncated": truncated,
+            "since": token,
+        }
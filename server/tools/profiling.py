@@ -0,0 +1,230 @@
+"""
+도구 호출 샘플링 프로파일러와 이벤트 루프 정지 감지기
+
+느린 도구 호출의 시간이 업스트림 대기, feedparser 파싱, 카탈로그 스캔, 직렬화 중
+어디에 쓰였는지 보기 위한 선택 기능입니다. (환경 변수로 켜야 동작)
+
+샘플링 프로파일러
+- 백그라운드 스레드가 일정 간격으로 모든 스레드의 스택을 떠서 최근 구간을 링 버퍼에 보관
+- 호출 중 PROFILE_SAMPLE_RATE 비율, 또는 PROFILE_SLOW_MS 이상 걸린 호출이 끝나면
+  그 호출 구간의 샘플을 collapsed stack 형식(flamegraph.pl / speedscope / inferno용)으로 저장
+- 이벤트 루프가 업스트림 응답을 기다리는 시간은 selector 대기 스택으로 나타남
+- 같은 구간에 동시에 실행된 다른 호출의 샘플도 함께 들어감 (프로세스 전체 관점)
+
+정지 감지기
+- 루프가 주기적으로 심장박동을 남기고, 감시 스레드가 LOOP_STALL_MS 이상 박동이 없으면
+  그 순간 루프 스레드가 실행 중이던 스택을 stderr에 기록
+
+환경 변수
+- PROFILE_SAMPLE_RATE: 프로파일을 남길 호출 비율 0~1 (기본 0)
+- PROFILE_SLOW_MS: 이 시간 이상 걸린 호출은 항상 프로파일 저장 (기본 0 = 끔)
+- PROFILE_DIR: 프로파일 저장 위치 (기본 .cache/profiles)
+- PROFILE_INTERVAL_MS: 샘플링 간격 (기본 5)
+- LOOP_STALL_MS: 루프 정지 감지 임계값 (기본 0 = 끔)
+"""
+
+import asyncio
+import functools
+import os
+import queue
+import random
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple
+
+
+# 샘플에서 제외할 진단용 스레드
+_OWN_THREADS = frozenset({"profiler", "loop-stall-detector"})
+
+
+def collapse_stack(frame) -> str:
+    """프레임 → "root;...;leaf" (함수 이름과 정의 위치)"""
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class SamplingProfiler:
+    """스택 샘플 링 버퍼 + 느린 / 표본 호출의 collapsed stack 저장"""
+
+    def __init__(self, sample_rate: Optional[float] = None, slow_ms: Optional[float] = None,
+                 profile_dir: Optional[str] = None, interval_ms: Optional[float] = None,
+                 buffer_size: int = 50000):
+        self.sample_rate = sample_rate if sample_rate is not None else float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+        self.slow_ms = slow_ms if slow_ms is not None else float(os.getenv("PROFILE_SLOW_MS", "0"))
+        self.profile_dir = Path(profile_dir or os.getenv("PROFILE_DIR", ".cache/profiles"))
+        self.interval = (interval_ms or float(os.getenv("PROFILE_INTERVAL_MS", "5"))) / 1000
+
+        # (시각, "스레드 이름;스택")
+        self._samples: Deque[Tuple[float, str]] = deque(maxlen=buffer_size)
+        self._dumps: "queue.SimpleQueue[Tuple[str, float, float]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.stats_counters = {"calls": 0, "profiled": 0, "slow": 0, "sampled": 0}
+        self.recent: Deque[str] = deque(maxlen=20)
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or self.slow_ms > 0
+
+    def start(self):
+        """샘플러 스레드 시작 (켜져 있을 때만, 중복 시작하지 않음)"""
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _sample(self):
+        now = time.perf_counter()
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            name = names.get(ident, ident)
+            if name not in _OWN_THREADS:
+                self._samples.append((now, f"{name};{collapse_stack(frame)}"))
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._sample()
+            while not self._dumps.empty():
+                self._write(*self._dumps.get())
+            time.sleep(self.interval)
+
+    def _write(self, name: str, start: float, end: float):
+        stacks = Counter(stack for ts, stack in list(self._samples) if start <= ts <= end)
+        if not stacks:
+            return
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            path = self.profile_dir / name
+            with open(path, "w", encoding="utf-8") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            self.recent.append(str(path))
+        except OSError as e:
+            print(f"Error writing profile: {e}", file=sys.stderr)
+
+    def _finish(self, tool: str, started: float, sampled: bool):
+        """호출 종료 처리 (직렬화까지 포함되도록 루프의 다음 차례에 실행)"""
+        ended = time.perf_counter()
+        elapsed_ms = (ended - started) * 1000
+        slow = self.slow_ms > 0 and elapsed_ms >= self.slow_ms
+        if not (sampled or slow):
+            return
+        self.stats_counters["profiled"] += 1
+        self.stats_counters["slow" if slow else "sampled"] += 1
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{tool}-{elapsed_ms:.0f}ms.folded"
+        self._dumps.put((name, started, ended))
+
+    def wrap(self, func):
+        """비동기 도구 함수 프로파일링 (꺼져 있으면 원래 함수 그대로)"""
+        if not self.enabled:
+            return func
+        tool = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            self.start()
+            self.stats_counters["calls"] += 1
+            sampled = random.random() < self.sample_rate
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                # 결과 직렬화는 이 코루틴이 반환된 직후 같은 차례에 일어나므로 다음 차례에 마감
+                asyncio.get_running_loop().call_soon(self._finish, tool, started, sampled)
+
+        return wrapper
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "slow_ms": self.slow_ms,
+            "profile_dir": str(self.profile_dir),
+            **self.stats_counters,
+            "recent_profiles": list(self.recent),
+        }
+
+
+class LoopStallDetector:
+    """이벤트 루프가 임계값 이상 멈추면 루프 스레드의 스택을 기록"""
+
+    def __init__(self, threshold_ms: Optional[float] = None):
+        self.threshold_ms = threshold_ms if threshold_ms is not None else float(os.getenv("LOOP_STALL_MS", "0"))
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._last_beat = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.stalls = 0
+        self.recent: Deque[Dict[str, Any]] = deque(maxlen=5)
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold_ms > 0
+
+    def start(self):
+        """현재 루프 감시 시작 (중복 시작하지 않음)"""
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._stop.clear()
+        self._beat()
+        self._thread = threading.Thread(target=self._watch, name="loop-stall-detector", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _beat(self):
+        self._last_beat = time.monotonic()
+        if not self._stop.is_set():
+            self._loop.call_later(self.threshold_ms / 4000, self._beat)
+
+    def _watch(self):
+        reported = False
+        check = self.threshold_ms / 4000
+        while not self._stop.wait(check):
+            stalled_ms = (time.monotonic() - self._last_beat) * 1000
+            if stalled_ms < self.threshold_ms:
+                reported = False
+                continue
+            if reported:
+                continue
+            # 한 번 멈출 때마다 한 번만 기록
+            reported = True
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "(unavailable)"
+            self.stalls += 1
+            self.recent.append({"at": time.strftime("%Y-%m-%dT%H:%M:%S"), "stalled_ms": round(stalled_ms), "stack": stack})
+            print(f"Event loop stalled for {stalled_ms:.0f}ms, loop thread stack:\n{stack}", file=sys.stderr)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "threshold_ms": self.threshold_ms,
+            "stalls": self.stalls,
+            "recent": list(self.recent),
+        }
+
+
+profiler = SamplingProfiler()
+stall_detector = LoopStallDetector()
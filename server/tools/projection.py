@@ -0,0 +1,96 @@
+"""
+응답 필드 선택(projection)과 페이지 나누기
+
+대부분의 호출자는 id / name / 점수 정도만 필요합니다.
+요청된 필드만 골라 새 dict를 만들고(전체 레코드를 복사하지 않음),
+offset / limit 또는 불투명 cursor로 결과를 나눠 돌려줍니다.
+"""
+
+import base64
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+_MISSING = object()
+
+Fields = Optional[Tuple[str, ...]]
+
+
+def encode_token(data: Dict[str, Any]) -> str:
+    """dict → 불투명 토큰 (base64url JSON)"""
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_token(token: str) -> Dict[str, Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError(f"Invalid token: {token!r}")
+
+
+def parse_fields(fields: Union[str, Sequence[str], None]) -> Fields:
+    """"id,name" 또는 ["id", "name"] → ("id", "name") (없으면 None = 전체 필드)"""
+    if not fields:
+        return None
+    if isinstance(fields, str):
+        fields = fields.split(",")
+    parsed = tuple(dict.fromkeys(f.strip() for f in fields if f.strip()))
+    return parsed or None
+
+
+def project(record: Any, fields: Fields, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """레코드에서 요청된 필드만 골라 dict 생성
+
+    fields가 None이면 전체 필드입니다. extra(점수 등 계산값)는 항상 포함합니다.
+    record는 dict이거나 get() / to_dict()를 가진 레코드(tools.records)입니다.
+    """
+    if fields is None:
+        if not extra and isinstance(record, dict):
+            return record  # 전체 필드 요청이면 복사하지 않고 그대로
+        result = record.to_dict() if hasattr(record, "to_dict") else dict(record)
+    else:
+        result = {}
+        for name in fields:
+            value = record.get(name, _MISSING)
+            if value is not _MISSING:
+                result[name] = list(value) if isinstance(value, tuple) else value
+    if extra:
+        result.update(extra)
+    return result
+
+
+def page_window(total: int, offset: int = 0, limit: Optional[int] = None, cursor: Optional[str] = None,
+                version: Any = None) -> Tuple[int, int]:
+    """offset / limit / cursor → [start, end) 구간
+
+    cursor는 offset보다 우선하며, 다른 버전(스냅샷)에서 발급된 cursor는 거부합니다.
+    """
+    start = max(0, offset or 0)
+    if cursor:
+        data = decode_token(cursor)
+        if data.get("v") != version:
+            raise ValueError("Cursor was issued for a different snapshot; start again without cursor")
+        start = data.get("o", 0)
+    end = total if limit is None else min(total, start + max(0, limit))
+    return start, max(start, end)
+
+
+def page_meta(total: int, start: int, end: int, version: Any = None) -> Dict[str, Any]:
+    """페이지 응답 메타데이터 (다음 페이지가 있으면 next_cursor)
+
+    빈 페이지(limit=0)는 같은 위치를 가리키는 cursor를 만들지 않습니다. (따라가면 끝나지 않음)
+    """
+    return {
+        "offset": start,
+        "returned": end - start,
+        "next_cursor": encode_token({"o": end, "v": version}) if start < end < total else None,
+    }
+
+
+def paginate(items: Sequence[Any], fields: Fields = None, offset: int = 0, limit: Optional[int] = None,
+             cursor: Optional[str] = None, version: Any = None) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """전체 목록 → (요청 페이지의 투영 결과, 페이지 메타데이터)"""
+    start, end = page_window(len(items), offset, limit, cursor, version)
+    page = [project(item, fields) for item in items[start:end]]
+    return page, page_meta(len(items), start, end, version)
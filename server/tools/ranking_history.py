@@ -0,0 +1,255 @@
+"""
+실시간 모델 순위의 시계열 이력
+
+리더보드 스냅샷이 바뀔 때마다 append-only로 기록합니다.
+- 벤치마크별 스냅샷 시각은 array('q') 한 줄
+- 모델별로 (스냅샷 인덱스, 지표별 값) 열을 따로 두고 값은 정수로 스케일해 델타 인코딩
+- 일정 간격마다 절대값 체크포인트를 두어, 구간 조회 시 처음부터 재생하지 않고
+  가장 가까운 체크포인트에서부터만 복원합니다.
+
+RANKING_HISTORY_PATH가 설정되면 스냅샷을 JSONL로 덧붙여 저장하고 시작 시 다시 읽습니다.
+"""
+
+import bisect
+import json
+import os
+import sys
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 결측값 (가격 등은 음수가 될 수 없음)
+MISSING = -1
+
+# 체크포인트 간격 (델타 복원 최대 길이)
+CHECKPOINT_EVERY = 32
+
+# 벤치마크별 기록 지표와 정수 스케일
+BENCHMARK_METRICS = {
+    "artificial_analysis": {
+        "intelligence_index": 100,
+        "speed": 100,
+        "price_per_1m": 10000,
+        "rank": 1,
+    },
+    "lmsys_arena": {
+        "elo_rating": 1,
+        "rank": 1,
+    },
+}
+
+
+def model_key(name: str) -> str:
+    """모델 이름 조회 키"""
+    return " ".join(str(name).lower().split())
+
+
+class MetricColumn:
+    """델타 인코딩된 정수 열 + 절대값 체크포인트"""
+
+    __slots__ = ("deltas", "checkpoints", "last")
+
+    def __init__(self):
+        self.deltas = array("q")
+        self.checkpoints = array("q")  # CHECKPOINT_EVERY 번째마다의 절대값
+        self.last = 0
+
+    def append(self, value: int):
+        if len(self.deltas) % CHECKPOINT_EVERY == 0:
+            self.checkpoints.append(value)
+        self.deltas.append(value - self.last)
+        self.last = value
+
+    def decode(self, start: int, end: int) -> List[int]:
+        """[start, end) 구간 복원"""
+        if start >= end:
+            return []
+        block = start // CHECKPOINT_EVERY
+        pos = block * CHECKPOINT_EVERY
+        value = self.checkpoints[block]
+        values = []
+        if pos >= start:
+            values.append(value)
+        for i in range(pos + 1, end):
+            value += self.deltas[i]
+            if i >= start:
+                values.append(value)
+        return values
+
+
+class ModelSeries:
+    """한 모델의 스냅샷 인덱스와 지표 열"""
+
+    __slots__ = ("name", "snapshots", "columns")
+
+    def __init__(self, name: str, metrics: Iterable[str]):
+        self.name = name
+        self.snapshots = array("l")
+        self.columns = {metric: MetricColumn() for metric in metrics}
+
+
+class BenchmarkHistory:
+    """벤치마크 하나의 스냅샷 이력"""
+
+    def __init__(self, benchmark: str):
+        self.benchmark = benchmark
+        self.metrics = BENCHMARK_METRICS[benchmark]
+        self.times = array("q")
+        self.models: Dict[str, ModelSeries] = {}
+
+    def append(self, rows: List[Dict[str, Any]], timestamp: int):
+        """스냅샷 한 개 추가 (시간 역순 입력은 무시)"""
+        if self.times and timestamp < self.times[-1]:
+            return
+        index = len(self.times)
+        self.times.append(timestamp)
+
+        rows = self._ranked(rows)
+        for row in rows:
+            key = model_key(row["model"])
+            series = self.models.get(key)
+            if series is None:
+                series = self.models[key] = ModelSeries(row["model"], self.metrics)
+            series.snapshots.append(index)
+            for metric, scale in self.metrics.items():
+                value = row.get(metric)
+                series.columns[metric].append(MISSING if value is None else round(value * scale))
+
+    def _ranked(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """rank가 없는 벤치마크는 주 지표 내림차순으로 순위 부여"""
+        if all(row.get("rank") is not None for row in rows):
+            return rows
+        primary = next(iter(self.metrics))
+        ordered = sorted(rows, key=lambda r: r.get(primary) or 0, reverse=True)
+        return [{**row, "rank": rank} for rank, row in enumerate(ordered, start=1)]
+
+    def _window(self, start: int, end: int) -> Tuple[int, int]:
+        return bisect.bisect_left(self.times, start), bisect.bisect_right(self.times, end)
+
+    def series(self, name: str, start: int, end: int) -> Optional[Dict[str, Any]]:
+        """모델의 [start, end] 구간 값 (스케일 복원)"""
+        series = self.models.get(model_key(name))
+        if series is None:
+            return None
+
+        lo, hi = self._window(start, end)
+        i = bisect.bisect_left(series.snapshots, lo)
+        j = bisect.bisect_left(series.snapshots, hi)
+
+        points = {"timestamps": [self.times[s] for s in series.snapshots[i:j]]}
+        for metric, scale in self.metrics.items():
+            points[metric] = [
+                None if v == MISSING else (v / scale if scale != 1 else v)
+                for v in series.columns[metric].decode(i, j)
+            ]
+        return {"model": series.name, **points}
+
+    def _value_at(self, series: ModelSeries, metric: str, snapshot: int) -> Optional[int]:
+        """snapshot 인덱스 시점(또는 그 직전)의 값"""
+        pos = bisect.bisect_right(series.snapshots, snapshot) - 1
+        if pos < 0:
+            return None
+        value = series.columns[metric].decode(pos, pos + 1)[0]
+        return None if value == MISSING else value
+
+    def rank_changes(self, start: int, end: int, top: int = 20) -> List[Dict[str, Any]]:
+        """구간 시작과 끝의 순위 비교 (변동 큰 순)"""
+        lo, hi = self._window(start, end)
+        if hi <= lo:
+            return []
+        first, last = lo, hi - 1
+
+        changes = []
+        for series in self.models.values():
+            # 구간 끝 스냅샷에 있는 모델만
+            pos = bisect.bisect_right(series.snapshots, last) - 1
+            if pos < 0 or series.snapshots[pos] != last:
+                continue
+            rank_then = self._value_at(series, "rank", first)
+            rank_now = self._value_at(series, "rank", last)
+            changes.append({
+                "model": series.name,
+                "rank_then": rank_then,
+                "rank_now": rank_now,
+                "change": None if rank_then is None else rank_then - rank_now,
+            })
+
+        changes.sort(key=lambda c: (c["change"] is None, -abs(c["change"] or 0), c["rank_now"]))
+        return changes[:top]
+
+
+class RankingHistory:
+    """벤치마크별 이력 모음 (선택적 JSONL 영속화)"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.benchmarks: Dict[str, BenchmarkHistory] = {}
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def _get(self, benchmark: str) -> BenchmarkHistory:
+        if benchmark not in self.benchmarks:
+            self.benchmarks[benchmark] = BenchmarkHistory(benchmark)
+        return self.benchmarks[benchmark]
+
+    def _load(self, path: str):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self._get(record["benchmark"]).append(record["rows"], record["timestamp"])
+                except (ValueError, KeyError):
+                    continue
+
+    def append(self, benchmark: str, rows: List[Dict[str, Any]], timestamp: Optional[int] = None):
+        if benchmark not in BENCHMARK_METRICS:
+            return
+        timestamp = int(timestamp or time.time())
+        metrics = BENCHMARK_METRICS[benchmark]
+        compact_rows = [
+            {"model": row["model"], **{m: row.get(m) for m in metrics if row.get(m) is not None}}
+            for row in rows if row.get("model")
+        ]
+        self._get(benchmark).append(compact_rows, timestamp)
+
+        if self.path:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps({"benchmark": benchmark, "timestamp": timestamp, "rows": compact_rows}) + "\n")
+            except OSError as e:
+                print(f"Error writing ranking history: {e}", file=sys.stderr)
+
+    def trend(self, benchmark: str, model: Optional[str] = None, days: int = 90) -> Dict[str, Any]:
+        """모델 추이 또는 (model 없으면) 구간 순위 변동"""
+        end = int(time.time())
+        start = end - days * 86400
+        history = self.benchmarks.get(benchmark)
+        base = {"benchmark": benchmark, "days": days, "snapshots": 0}
+        if history is None:
+            return {**base, "rank_changes": []} if model is None else {**base, "model": model, "found": False}
+
+        lo, hi = history._window(start, end)
+        base["snapshots"] = hi - lo
+
+        if model is None:
+            return {**base, "rank_changes": history.rank_changes(start, end)}
+
+        series = history.series(model, start, end)
+        if series is None:
+            return {**base, "model": model, "found": False}
+
+        summary = {}
+        for metric in history.metrics:
+            values = [v for v in series[metric] if v is not None]
+            if values:
+                summary[metric] = {
+                    "first": values[0],
+                    "last": values[-1],
+                    "change": round(values[-1] - values[0], 4),
+                    "min": min(values),
+                    "max": max(values),
+                }
+        return {**base, "found": True, "summary": summary, "series": series}
+
+
+ranking_history = RankingHistory(os.getenv("RANKING_HISTORY_PATH") or None)
@@ -1,9 +1,73 @@
 import aiohttp
-from bs4 import BeautifulSoup
 import json
-from typing import List, Dict, Any
+import hashlib
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import asyncio
+import sys
+
+from .decoders import decode_hf_trending
+from .executors import run_decode
+from .keyword_matcher import model_requirement_matcher
+from .leaderboards import parse_artificial_analysis, parse_lmsys_arena
+from .model_identity import ModelIdentityIndex
+from .model_index import DIMENSIONS, ModelIndex, parse_context_tokens
+from .ranking_history import ranking_history
+from .refresh_policy import refresh_policy
+from .state_store import state_store
+from .tracing import http_trace_config, span
+from .upstreams import ARTIFICIAL_ANALYSIS_URL, HF_MODELS_URL, LMSYS_ARENA_URL
+
+# 페이지를 가져오거나 파싱하지 못했을 때 사용하는 예시 데이터
+SAMPLE_ARTIFICIAL_ANALYSIS = [
+    {
+        "model": "Gemini 3 Pro Preview (high)",
+        "creator": "Google",
+        "intelligence_index": 73,
+        "speed": 136,
+        "price_per_1m": 4.50,
+        "context_window": "1m",
+    },
+    {
+        "model": "GPT-5.2 (xhigh)",
+        "creator": "OpenAI",
+        "intelligence_index": 73,
+        "speed": 114,
+        "price_per_1m": 4.81,
+        "context_window": "400k",
+    },
+    {
+        "model": "Claude Opus 4.5",
+        "creator": "Anthropic",
+        "intelligence_index": 71,
+        "speed": 95,
+        "price_per_1m": 15.00,
+        "context_window": "200k",
+    },
+]
+
+SAMPLE_LMSYS_ARENA = [
+    {
+        "model": "GPT-4.5-turbo",
+        "elo_rating": 1285,
+        "rank": 1,
+        "organization": "OpenAI",
+        "arena_score": 1285
+    },
+    {
+        "model": "Claude 4 Sonnet",
+        "elo_rating": 1278,
+        "rank": 2,
+        "organization": "Anthropic",
+        "arena_score": 1278
+    },
+]
+
+# 캐시 키 → 그 데이터를 만든 리더보드 스냅샷 소스
+CACHE_SNAPSHOT_SOURCES = {
+    "aa_rankings": "artificial_analysis",
+    "lmsys_rankings": "lmsys_arena",
+}
 
 class RealtimeAIDataCollector:
     """실시간 AI 모델 및 도구 정보 수집"""
@@ -11,8 +75,8 @@ class RealtimeAIDataCollector:
     def __init__(self):
         self.sources = {
             # LLM 리더보드
-            "artificial_analysis": "https://artificialanalysis.ai/leaderboards/models",
-            "lmsys_arena": "https://chat.lmsys.org/",
+            "artificial_analysis": ARTIFICIAL_ANALYSIS_URL,
+            "lmsys_arena": LMSYS_ARENA_URL,
             "open_llm": "https://huggingface.co/spaces/open-llm-leaderboard/open_llm_leaderboard",
             
             # AI 도구 정보
@@ -25,85 +89,149 @@ class RealtimeAIDataCollector:
             "paperswithcode": "https://paperswithcode.com/latest",
         }
         
-        # 캐시 설정 (5분)
-        self.cache = {}
-        self.cache_duration = 300
+        # 캐시는 state_store에 보관, 키별 TTL은 refresh_policy가 변경 빈도로 결정
+        
+        # 소스별 최신 리더보드 스냅샷
+        self.snapshots: Dict[str, Dict[str, Any]] = {}
+        
+        # Artificial Analysis 스냅샷의 수치 색인 / 파레토 프론티어
+        self.model_index: Optional[ModelIndex] = None
+        
+        # AA / Arena / HF 트렌딩 모델 식별 색인과 그 색인을 만든 원본 목록
+        self.identity_index: Optional[ModelIdentityIndex] = None
+        self._identity_sources: tuple = ()
+        
+        # 리더보드별 수집 결과 (live / 샘플 데이터 대체 횟수, 마지막 실패 원인)
+        self.ingest_counters: Dict[str, Dict[str, Any]] = {}
     
-    async def fetch_artificial_analysis(self) -> List[Dict[str, Any]]:
-        """Artificial Analysis에서 LLM 순위 가져오기"""
+    async def _ingest_leaderboard(self, source: str, parse_func, fallback_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """리더보드 페이지를 가져와 디코딩 실행기(run_decode)에서 파싱하고 스냅샷으로 저장"""
+        rows, parse_ms, origin, error = [], None, "live", None
         try:
-            async with aiohttp.ClientSession() as session:
-                # 실제로는 API가 있다면 API 사용, 없으면 스크래핑
-                # 여기서는 예시 데이터 반환
-                
-                # 실제 구현시:
-                # async with session.get(self.sources["artificial_analysis"]) as response:
-                #     html = await response.text()
-                #     soup = BeautifulSoup(html, 'html.parser')
-                #     # 파싱 로직
-                
-                return [
-                    {
-                        "model": "Gemini 3 Pro Preview (high)",
-                        "creator": "Google",
-                        "intelligence_index": 73,
-                        "speed": 136,
-                        "price_per_1m": 4.50,
-                        "context_window": "1m",
-                        "last_updated": datetime.now().isoformat()
-                    },
-                    {
-                        "model": "GPT-5.2 (xhigh)",
-                        "creator": "OpenAI",
-                        "intelligence_index": 73,
-                        "speed": 114,
-                        "price_per_1m": 4.81,
-                        "context_window": "400k",
-                        "last_updated": datetime.now().isoformat()
-                    },
-                    {
-                        "model": "Claude Opus 4.5",
-                        "creator": "Anthropic",
-                        "intelligence_index": 71,
-                        "speed": 95,
-                        "price_per_1m": 15.00,
-                        "context_window": "200k",
-                        "last_updated": datetime.now().isoformat()
-                    }
-                ]
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
+                headers = {"User-Agent": "Mozilla/5.0 (compatible; AI-Recommender-MCP)"}
+                async with session.get(self.sources[source], headers=headers) as response:
+                    if response.status == 200:
+                        content = await response.text()
+                    else:
+                        error = f"HTTP {response.status}"
+                        content = ""
+            
+            if content:
+                # CPU를 많이 쓰는 HTML 파싱은 이벤트 루프 밖에서
+                parsed = await run_decode(parse_func, content)
+                rows, parse_ms = parsed["rows"], parsed["parse_ms"]
+                if not rows:
+                    error = "no leaderboard table found"
         except Exception as e:
-            print(f"Error fetching Artificial Analysis: {e}")
-            return []
+            error = repr(e)
+        
+        counters = self.ingest_counters.setdefault(source, {"live": 0, "fallback": 0, "last_error": None})
+        if rows:
+            counters["live"] += 1
+        else:
+            # 실제 데이터처럼 보이지 않도록 스냅샷 origin / 응답의 degraded로 표시하고 횟수를 셈
+            print(f"Error ingesting {source}: {error}, serving sample data", file=sys.stderr)
+            counters["fallback"] += 1
+            counters["last_error"] = error
+            rows, origin = [dict(row) for row in fallback_rows], "fallback"
+        
+        # 다른 인스턴스가 먼저 올린 버전을 이어서 매김
+        await self.sync_snapshot(source)
+        snapshot = self._store_snapshot(source, rows, origin, parse_ms)
+        await state_store.set(f"snapshot:{source}", snapshot)
+        return snapshot["rows"]
+    
+    def _store_snapshot(self, source: str, rows: List[Dict[str, Any]], origin: str, parse_ms) -> Dict[str, Any]:
+        """순위 데이터를 버전이 붙은 스냅샷으로 저장 (내용이 바뀔 때만 버전 증가)"""
+        digest = hashlib.sha1(json.dumps(rows, sort_keys=True).encode()).hexdigest()
+        previous = self.snapshots.get(source)
+        
+        if previous is None:
+            version = 1
+        elif previous["digest"] == digest:
+            version = previous["version"]
+        else:
+            version = previous["version"] + 1
+        
+        fetched_at = datetime.now().isoformat()
+        snapshot = {
+            "source": source,
+            "version": version,
+            "digest": digest,
+            "origin": origin,
+            "fetched_at": fetched_at,
+            "parse_ms": parse_ms,
+            "count": len(rows),
+            "rows": rows,
+        }
+        self._apply_snapshot(snapshot, previous)
+        return snapshot
+    
+    def _apply_snapshot(self, snapshot: Dict[str, Any], previous: Optional[Dict[str, Any]]):
+        """스냅샷을 현재 버전으로 두고 이력 / 수치 색인 갱신"""
+        source, rows = snapshot["source"], snapshot["rows"]
+        self.snapshots[source] = snapshot
+        
+        changed = previous is None or previous["digest"] != snapshot["digest"]
+        
+        # 실제로 수집한 데이터가 바뀌었을 때만 이력에 기록
+        if snapshot["origin"] == "live" and changed:
+            ranking_history.append(source, rows)
+        
+        # 추천용 수치 색인은 스냅샷이 바뀔 때 한 번만 컴파일
+        if source == "artificial_analysis" and (changed or self.model_index is None):
+            self.model_index = ModelIndex(rows)
+    
+    async def sync_snapshot(self, source: str):
+        """공유 저장소에 다른 인스턴스가 올린 스냅샷이 있으면 가져와 적용"""
+        shared = await state_store.get(f"snapshot:{source}")
+        local = self.snapshots.get(source)
+        if shared is None or shared is local:
+            return
+        if local is None or (shared["version"], shared["fetched_at"]) > (local["version"], local["fetched_at"]):
+            self._apply_snapshot(shared, local)
+    
+    def degraded_sources(self) -> List[str]:
+        """현재 스냅샷이 샘플 데이터인 리더보드"""
+        return [source for source, snapshot in self.snapshots.items() if snapshot["origin"] != "live"]
+    
+    def ingest_stats(self) -> Dict[str, Any]:
+        return {
+            source: {**counters, "origin": self.snapshots.get(source, {}).get("origin")}
+            for source, counters in self.ingest_counters.items()
+        }
+    
+    def snapshot_info(self, source: str) -> Dict[str, Any]:
+        """스냅샷 메타데이터 (행 데이터 제외)"""
+        snapshot = self.snapshots.get(source)
+        if snapshot is None:
+            return {}
+        return {k: v for k, v in snapshot.items() if k not in ("rows", "digest")}
+    
+    async def fetch_artificial_analysis(self) -> List[Dict[str, Any]]:
+        """Artificial Analysis에서 LLM 순위 가져오기"""
+        rows = await self._ingest_leaderboard(
+            "artificial_analysis",
+            parse_artificial_analysis,
+            SAMPLE_ARTIFICIAL_ANALYSIS,
+        )
+        fetched_at = self.snapshots["artificial_analysis"]["fetched_at"]
+        return [{**row, "last_updated": fetched_at} for row in rows]
     
     async def fetch_lmsys_arena(self) -> List[Dict[str, Any]]:
         """LMSYS Chatbot Arena 리더보드 가져오기"""
-        try:
-            # 실제로는 LMSYS API나 스크래핑 사용
-            return [
-                {
-                    "model": "GPT-4.5-turbo",
-                    "elo_rating": 1285,
-                    "rank": 1,
-                    "organization": "OpenAI",
-                    "arena_score": 1285
-                },
-                {
-                    "model": "Claude 4 Sonnet",
-                    "elo_rating": 1278,
-                    "rank": 2,
-                    "organization": "Anthropic",
-                    "arena_score": 1278
-                }
-            ]
-        except Exception as e:
-            print(f"Error fetching LMSYS Arena: {e}")
-            return []
+        return await self._ingest_leaderboard(
+            "lmsys_arena",
+            parse_lmsys_arena,
+            SAMPLE_LMSYS_ARENA,
+        )
     
     async def fetch_huggingface_trending(self) -> List[Dict[str, Any]]:
         """Hugging Face 트렌딩 모델"""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = "https://huggingface.co/api/models"
+            async with aiohttp.ClientSession(trace_configs=[http_trace_config]) as session:
+                url = HF_MODELS_URL
                 params = {
                     "sort": "trending",
                     "direction": -1,
@@ -111,129 +239,234 @@ class RealtimeAIDataCollector:
                 }
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
-                        models = await response.json()
-                        return [
-                            {
-                                "name": m.get("id"),
-                                "author": m.get("author"),
-                                "downloads": m.get("downloads", 0),
-                                "likes": m.get("likes", 0),
-                                "tags": m.get("tags", []),
-                                "created_at": m.get("createdAt"),
-                                "last_modified": m.get("lastModified")
-                            }
-                            for m in models
-                        ]
+                        raw = await response.read()
+                        return await run_decode(decode_hf_trending, raw)
             return []
         except Exception as e:
             print(f"Error fetching Hugging Face: {e}")
             return []
     
+    def identity_for(self, aa_data: List[Dict[str, Any]], arena_data: List[Dict[str, Any]],
+                     hf_data: List[Dict[str, Any]]) -> ModelIdentityIndex:
+        """소스 간 모델 식별 색인 (캐시된 목록이 새로 수집됐을 때만 다시 생성)"""
+        sources = (aa_data, arena_data, hf_data)
+        if self.identity_index is None or any(a is not b for a, b in zip(sources, self._identity_sources)):
+            self.identity_index = ModelIdentityIndex(
+                {"artificial_analysis": aa_data, "lmsys_arena": arena_data, "huggingface": hf_data},
+                name_fields={"huggingface": "name"},
+            )
+            self._identity_sources = sources
+        return self.identity_index
+    
     async def search_best_model_for_task(self, task: str) -> Dict[str, Any]:
         """특정 작업에 최적화된 모델 검색"""
         
-        task_mappings = {
-            "고전 문헌": ["reasoning", "long-context", "multilingual"],
-            "논문 분석": ["reasoning", "technical", "long-context"],
-            "코딩": ["code", "programming", "technical"],
-            "창작": ["creative", "generation"],
-            "번역": ["translation", "multilingual"],
-            "요약": ["summarization", "compression"],
-        }
+        # 작업 설명에서 요구 능력 추출 (단일 패스)
+        requirements = model_requirement_matcher.classify(task)
         
-        # 실시간 데이터 가져오기
-        aa_data = await self.fetch_artificial_analysis()
-        arena_data = await self.fetch_lmsys_arena()
+        # 세 소스를 캐시를 거쳐 동시에 가져오기 (스냅샷이 바뀌면 색인도 다시 컴파일됨)
+        aa_data, arena_data, hf_data = await asyncio.gather(
+            self.get_cached_or_fetch("aa_rankings", self.fetch_artificial_analysis),
+            self.get_cached_or_fetch("lmsys_rankings", self.fetch_lmsys_arena),
+            self.get_cached_or_fetch("hf_trending", self.fetch_huggingface_trending),
+        )
+        index = self.model_index
+        identity = self.identity_for(aa_data, arena_data, hf_data)
         
-        # 작업에 맞는 모델 필터링 및 추천
-        recommendations = []
+        # AA 행 → 다른 소스의 같은 모델 (색인 조회 한 번)
+        joined = [identity.lookup(row["model"]) for row in index.rows]
+        elos = [e["lmsys_arena"].get("elo_rating") for e in joined if "lmsys_arena" in e]
+        top_elo = max((e for e in elos if e is not None), default=None)
         
-        for model in aa_data:
-            score = 0
-            reasons = []
-            
-            # Intelligence 점수가 높으면 복잡한 작업에 적합
-            if "고전 문헌" in task or "논문" in task:
-                if model["intelligence_index"] >= 70:
-                    score += 30
-                    reasons.append("높은 추론 능력")
-                if "1m" in model["context_window"] or "400k" in model["context_window"]:
-                    score += 25
-                    reasons.append("긴 문맥 처리 가능")
-            
-            # 속도가 중요한 작업
-            if "실시간" in task or "채팅" in task:
-                if model["speed"] > 100:
-                    score += 20
-                    reasons.append("빠른 응답 속도")
-            
-            # 가격 고려
-            if model["price_per_1m"] < 5.0:
-                score += 10
-                reasons.append("경제적")
-            
-            if score > 20:
+        # 조건별로 정렬 색인에서 해당 구간만 꺼내 점수 누적
+        scores: Dict[int, int] = {}
+        reasons: Dict[int, List[str]] = {}
+        
+        def award(ids, points, reason):
+            for i in ids:
+                scores[i] = scores.get(i, 0) + points
+                reasons.setdefault(i, []).append(reason)
+        
+        # Intelligence 점수가 높으면 복잡한 작업에 적합
+        if "reasoning" in requirements:
+            award(index.ids("intelligence", index.at_least("intelligence", 70)), 30, "높은 추론 능력")
+        if "long-context" in requirements:
+            award(index.ids("context", index.at_least("context", 400_000)), 25, "긴 문맥 처리 가능")
+        
+        # 속도가 중요한 작업
+        if "low-latency" in requirements:
+            award(index.ids("speed", index.at_least("speed", 100, strict=True)), 20, "빠른 응답 속도")
+        
+        # 가격 고려
+        award(index.ids("price", index.at_most("price", 5.0, strict=True)), 10, "경제적")
+        
+        # 사용자 선호도 (Arena Elo 최상위권) / 공개 가중치 트렌딩
+        for i, entity in enumerate(joined):
+            elo = entity.get("lmsys_arena", {}).get("elo_rating")
+            if top_elo is not None and elo is not None and elo >= top_elo - 30:
+                award([i], 15, f"Arena 상위권 (Elo {elo})")
+            if "huggingface" in entity:
+                award([i], 5, "Hugging Face 트렌딩")
+        
+        recommendations = []
+        for i in sorted(scores):
+            if scores[i] > 20:
+                model = index.rows[i]
+                arena = joined[i].get("lmsys_arena", {})
                 recommendations.append({
                     "model": model["model"],
                     "creator": model["creator"],
-                    "score": score,
-                    "reasons": reasons,
+                    "score": scores[i],
+                    "reasons": reasons[i],
                     "specs": {
                         "intelligence": model["intelligence_index"],
                         "speed": model["speed"],
                         "price": model["price_per_1m"],
-                        "context": model["context_window"]
+                        "context": model["context_window"],
+                        "elo": arena.get("elo_rating"),
+                        "arena_rank": arena.get("rank"),
                     }
                 })
         
-        # 점수순 정렬
-        recommendations.sort(key=lambda x: x["score"], reverse=True)
+        # 점수순, 동점이면 Elo → 속도 → 가격순
+        recommendations.sort(key=lambda x: (
+            x["score"],
+            x["specs"]["elo"] or 0,
+            x["specs"]["speed"] or 0,
+            -(x["specs"]["price"] if x["specs"]["price"] is not None else float("inf")),
+        ), reverse=True)
         
         return {
             "task": task,
+            "requirements": requirements,
             "recommendations": recommendations[:5],
-            "data_updated": datetime.now().isoformat(),
-            "sources": ["Artificial Analysis", "LMSYS Arena"]
+            "data_updated": self.snapshots["artificial_analysis"]["fetched_at"],
+            "sources": ["Artificial Analysis", "LMSYS Arena", "Hugging Face Trending"],
+            "degraded_sources": self.degraded_sources(),
+            "joined": {
+                "models": len(identity),
+                "with_arena": identity.joined("artificial_analysis", "lmsys_arena"),
+                "with_huggingface": identity.joined("artificial_analysis", "huggingface"),
+            },
         }
     
     async def get_cached_or_fetch(self, key: str, fetch_func):
         """캐시된 데이터가 있으면 반환, 없으면 새로 가져오기"""
-        now = datetime.now().timestamp()
-        
-        if key in self.cache:
-            data, timestamp = self.cache[key]
-            if now - timestamp < self.cache_duration:
-                return data
+        data = await state_store.get(f"collector:{key}")
+        source = CACHE_SNAPSHOT_SOURCES.get(key)
+        if data is not None:
+            refresh_policy.hit(key)
+            # 다른 인스턴스가 가져온 데이터라면 그 스냅샷(버전 / 수치 색인)도 맞춤
+            if source is not None:
+                await self.sync_snapshot(source)
+            return data
         
         # 캐시 미스 - 새로 가져오기
-        data = await fetch_func()
-        self.cache[key] = (data, now)
+        with span("fetch", source=key):
+            data = await fetch_func()
+        if source is not None:
+            # 리더보드는 스냅샷 지문으로 비교, 샘플 데이터로 대체됐으면 실패로 취급
+            snapshot = self.snapshots[source]
+            ttl = refresh_policy.observe(key, data, failed=snapshot["origin"] != "live", fingerprint=snapshot["digest"])
+        else:
+            ttl = refresh_policy.observe(key, data, failed=not data)
+        await state_store.set(f"collector:{key}", data, ttl=ttl)
         return data
 
 # 글로벌 인스턴스
 collector = RealtimeAIDataCollector()
 
+# 벤치마크 이름 → 순위 캐시 키
+RANKING_CACHE_KEYS = {
+    "artificial-analysis": "aa_rankings",
+    "lmsys-arena": "lmsys_rankings",
+}
+
+# 추천이 함께 읽는 캐시 키
+RECOMMENDATION_CACHE_KEYS = ("aa_rankings", "lmsys_rankings", "hf_trending")
+
+def rankings_ttl(benchmark: str) -> float:
+    """순위 캐시의 현재 갱신 주기"""
+    cache_key = RANKING_CACHE_KEYS.get(benchmark)
+    return refresh_policy.ttl(cache_key) if cache_key else refresh_policy.base
+
+def recommendation_ttl() -> float:
+    """추천이 읽는 캐시 중 가장 짧은 갱신 주기"""
+    return min(refresh_policy.ttl(key) for key in RECOMMENDATION_CACHE_KEYS)
+
 async def get_realtime_rankings(benchmark: str = "artificial-analysis") -> Dict[str, Any]:
     """실시간 AI 순위 가져오기"""
     
+    snapshot = {}
     if benchmark == "artificial-analysis":
         data = await collector.get_cached_or_fetch(
-            "aa_rankings",
+            RANKING_CACHE_KEYS[benchmark],
             collector.fetch_artificial_analysis
         )
+        snapshot = collector.snapshot_info("artificial_analysis")
     elif benchmark == "lmsys-arena":
         data = await collector.get_cached_or_fetch(
-            "lmsys_rankings",
+            RANKING_CACHE_KEYS[benchmark],
             collector.fetch_lmsys_arena
         )
+        snapshot = collector.snapshot_info("lmsys_arena")
     else:
         data = []
     
+    interval = rankings_ttl(benchmark)
+    
     return {
         "benchmark": benchmark,
         "models": data,
-        "updated_at": datetime.now().isoformat(),
-        "cache_info": "Data refreshed every 5 minutes"
+        "snapshot": snapshot,
+        "updated_at": snapshot.get("fetched_at") or datetime.now().isoformat(),
+        "degraded": snapshot.get("origin") == "fallback",
+        "cache_info": f"Data refreshed adaptively (currently every {interval:.0f}s)"
+    }
+
+# 도구에서 쓰는 벤치마크 이름 → 스냅샷 소스 키
+BENCHMARK_SOURCES = {
+    "artificial-analysis": "artificial_analysis",
+    "lmsys-arena": "lmsys_arena",
+}
+
+async def get_ranking_trend(model: str = None, benchmark: str = "artificial-analysis", days: int = 90) -> Dict[str, Any]:
+    """모델 지표 추이 또는 기간 내 순위 변동 (스냅샷 이력 기반)"""
+    source = BENCHMARK_SOURCES.get(benchmark)
+    if source is None:
+        return {"benchmark": benchmark, "error": f"Unknown benchmark: {benchmark}"}
+    
+    # 이력이 비어 있으면 현재 스냅샷부터 기록
+    if source not in collector.snapshots:
+        await get_realtime_rankings(benchmark)
+    
+    return {**ranking_history.trend(source, model, days), "benchmark": benchmark}
+
+async def query_models(min_context: Any = 0, max_price: Optional[float] = None, min_speed: float = 0,
+                       min_intelligence: float = 0, maximize: str = "intelligence", limit: int = 5) -> Dict[str, Any]:
+    """조건 기반 모델 조회 (예: 문맥 ≥ 400k, 가격 ≤ $5, 속도 최대)"""
+    if maximize not in DIMENSIONS:
+        return {
+            "success": False,
+            "error": f"Unknown maximize dimension: {maximize} (choose from {', '.join(DIMENSIONS)})",
+            "maximize": maximize,
+        }
+    await collector.get_cached_or_fetch("aa_rankings", collector.fetch_artificial_analysis)
+    index = collector.model_index
+    
+    return {
+        "constraints": {
+            "min_context_tokens": parse_context_tokens(min_context),
+            "max_price": max_price,
+            "min_speed": min_speed,
+            "min_intelligence": min_intelligence,
+        },
+        "maximize": maximize,
+        "models": index.query(parse_context_tokens(min_context), max_price, min_speed, min_intelligence, maximize, limit),
+        "pareto_frontier": [index.rows[i]["model"] for i in index.frontier],
+        "total_models": len(index),
+        "snapshot": collector.snapshot_info("artificial_analysis"),
+        "degraded": "artificial_analysis" in collector.degraded_sources(),
     }
 
 async def recommend_model_for_task(task: str) -> Dict[str, Any]:
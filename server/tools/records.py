@@ -0,0 +1,122 @@
+"""
+저장용 압축 레코드 타입
+
+캐시 / 저장소에 오래 머무는 항목을 dict 대신 __slots__ 객체로 보관합니다.
+- 키 문자열을 항목마다 반복 저장하지 않음 (dict 해시 테이블 없음)
+- source / type / author 같은 범주형 문자열은 sys.intern으로 한 벌만 유지
+- 태그 목록은 intern된 문자열의 튜플
+
+저장 경로에서만 사용하고, 응답으로 내보낼 때 to_dict()로 변환합니다.
+조회 코드가 그대로 동작하도록 get() / [] / keys()는 dict와 같게 지원합니다.
+FIELDS에 없는 키(업스트림에 새로 생긴 필드 등)는 버리지 않고 extra dict에 따로 보관합니다.
+"""
+
+import sys
+from typing import Any, Dict, FrozenSet, Iterator, Tuple
+
+# 값이 없는 필드 (None과 구분해 응답에서 생략)
+_UNSET = object()
+
+
+def intern_value(value: Any) -> Any:
+    """문자열이면 intern, 아니면 그대로"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def intern_tuple(values: Any) -> Tuple[Any, ...]:
+    """목록 → intern된 문자열 튜플"""
+    return tuple(intern_value(v) for v in values or ())
+
+
+class Record:
+    """__slots__ 기반 레코드 공통 동작"""
+
+    # FIELDS에 없는 키 (없으면 None)
+    __slots__ = ("extra",)
+
+    # 하위 클래스에서 정의: 필드 순서 / intern할 범주형 필드 / 튜플로 저장할 목록 필드
+    FIELDS: Tuple[str, ...] = ()
+    INTERNED: FrozenSet[str] = frozenset()
+    SEQUENCES: FrozenSet[str] = frozenset()
+
+    def __init__(self, **fields: Any):
+        for name in self.FIELDS:
+            value = fields.pop(name, _UNSET)
+            if value is not _UNSET:
+                if name in self.SEQUENCES:
+                    value = intern_tuple(value)
+                elif name in self.INTERNED:
+                    value = intern_value(value)
+            setattr(self, name, value)
+        self.extra = fields or None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """응답용 dict (값이 없는 필드는 생략, 튜플은 list)"""
+        result = {}
+        for name in self.FIELDS:
+            value = getattr(self, name)
+            if value is not _UNSET:
+                result[name] = list(value) if name in self.SEQUENCES else value
+        if self.extra:
+            result.update(self.extra)
+        return result
+
+    # dict 호환 조회
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self.FIELDS:
+            value = getattr(self, name)
+        else:
+            value = self.extra.get(name, _UNSET) if self.extra else _UNSET
+        return default if value is _UNSET else value
+
+    def __getitem__(self, name: str) -> Any:
+        value = self.get(name, _UNSET)
+        if value is _UNSET:
+            raise KeyError(name)
+        return value
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name, _UNSET) is not _UNSET
+
+    def keys(self) -> Iterator[str]:
+        yield from (name for name in self.FIELDS if getattr(self, name) is not _UNSET)
+        if self.extra:
+            yield from self.extra
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class NewsItem(Record):
+    """뉴스 타임라인 항목 (arXiv 논문 / HF 모델 / GitHub 프로젝트)"""
+
+    FIELDS = (
+        "title", "type", "source", "url", "timestamp",
+        # arXiv
+        "authors", "summary", "published", "categories",
+        # Hugging Face
+        "model_id", "author", "downloads", "likes", "tags", "last_modified",
+        # GitHub
+        "description", "stars", "language", "created_at", "topics",
+    )
+    INTERNED = frozenset({"type", "source", "author", "language"})
+    SEQUENCES = frozenset({"authors", "categories", "tags", "topics"})
+
+    __slots__ = FIELDS
+
+
+class ModelRecord(Record):
+    """HF 카탈로그 코퍼스 레코드"""
+
+    FIELDS = (
+        "id", "author", "pipeline_tag", "tags", "downloads", "likes",
+        "library_name", "created_at", "last_modified", "license", "languages",
+    )
+    INTERNED = frozenset({"author", "pipeline_tag", "library_name", "license"})
+    SEQUENCES = frozenset({"tags", "languages"})
+
+    __slots__ = FIELDS
@@ -0,0 +1,139 @@
+"""
+소스별 적응형 갱신 주기
+
+업스트림마다 내용이 바뀌는 속도가 다릅니다. (arXiv 하루 단위, HF 트렌딩 몇 시간, 리더보드 일주일)
+모든 소스에 같은 5분 TTL을 쓰면 대부분의 호출이 이미 가진 데이터를 다시 받아 오므로,
+가져올 때마다 내용 지문을 직전 것과 비교해 소스별 캐시 TTL을 조정합니다.
+
+- 그대로면 주기 × REFRESH_GROWTH (최대 REFRESH_MAX_INTERVAL)
+- 바뀌었으면 주기 × REFRESH_SHRINK (최소 REFRESH_MIN_INTERVAL)
+- 업스트림 실패(빈 결과 / 샘플 데이터)는 지문에 반영하지 않고 최소 주기 뒤 재시도
+
+다운로드 / 좋아요 / 스타 수처럼 매번 조금씩 달라지는 카운터는 지문에서 제외합니다.
+
+절약한 호출 수: 고정 주기(REFRESH_BASE_INTERVAL)였다면 캐시가 만료되어 업스트림을 다시 불렀을
+캐시 적중을 기준 주기 구간마다 한 번씩 셉니다. 반대로 기준 주기보다 일찍 다시 가져온 호출은
+extra_calls로 따로 셉니다.
+
+환경 변수
+- REFRESH_BASE_INTERVAL: 시작 주기이자 절약량 비교 기준(초) (기본 300)
+- REFRESH_MIN_INTERVAL / REFRESH_MAX_INTERVAL: 주기 범위(초) (기본 60 / 21600)
+- REFRESH_GROWTH / REFRESH_SHRINK: 주기 증감 배수 (기본 1.5 / 0.5)
+- REFRESH_ADAPTIVE=0: 조정 없이 기준 주기로 고정
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+# 내용 변경으로 보지 않는 필드 (카운터 / 수집 시각)
+VOLATILE_FIELDS = frozenset({"downloads", "likes", "stars", "last_updated", "fetched_at", "updated_at"})
+
+
+def content_fingerprint(rows: Iterable[Any], ignore: FrozenSet[str] = VOLATILE_FIELDS) -> str:
+    """항목 목록의 내용 지문 (순서 포함, 변동 필드 제외)"""
+    digest = hashlib.sha1()
+    for row in rows:
+        content = {k: row.get(k) for k in row.keys() if k not in ignore}
+        digest.update(json.dumps(content, sort_keys=True, default=str).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+class SourceRefresh:
+    """소스 하나의 갱신 주기와 관측 기록"""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.fingerprint: Optional[str] = None
+        self.last_fetch: Optional[float] = None
+        # 고정 주기였다면 다음 업스트림 호출이 일어났을 시각
+        self.baseline_due: Optional[float] = None
+        self.counters = {"fetches": 0, "changes": 0, "unchanged": 0, "failures": 0,
+                         "saved_calls": 0, "extra_calls": 0}
+
+
+class RefreshPolicy:
+    """관측한 변경 빈도로 소스별 캐시 TTL 결정"""
+
+    def __init__(self, base: Optional[float] = None, min_interval: Optional[float] = None,
+                 max_interval: Optional[float] = None, growth: Optional[float] = None,
+                 shrink: Optional[float] = None, adaptive: Optional[bool] = None):
+        self.base = base or float(os.getenv("REFRESH_BASE_INTERVAL", "300"))
+        self.min_interval = min_interval or float(os.getenv("REFRESH_MIN_INTERVAL", "60"))
+        self.max_interval = max_interval or float(os.getenv("REFRESH_MAX_INTERVAL", "21600"))
+        self.growth = growth or float(os.getenv("REFRESH_GROWTH", "1.5"))
+        self.shrink = shrink or float(os.getenv("REFRESH_SHRINK", "0.5"))
+        self.adaptive = adaptive if adaptive is not None else os.getenv("REFRESH_ADAPTIVE", "1") != "0"
+        self.sources: Dict[str, SourceRefresh] = {}
+
+    def _source(self, source: str) -> SourceRefresh:
+        state = self.sources.get(source)
+        if state is None:
+            state = self.sources[source] = SourceRefresh(self.base)
+        return state
+
+    def ttl(self, source: str) -> float:
+        """현재 갱신 주기 (처음 보는 소스는 기준 주기)"""
+        return self._source(source).interval
+
+    def observe(self, source: str, rows: Iterable[Any], failed: bool = False,
+                fingerprint: Optional[str] = None) -> float:
+        """업스트림에서 새로 가져온 결과 기록, 이번 결과에 쓸 TTL 반환"""
+        state = self._source(source)
+        now = time.monotonic()
+        state.counters["fetches"] += 1
+        if state.last_fetch is not None and now - state.last_fetch < self.base:
+            state.counters["extra_calls"] += 1
+        state.last_fetch = now
+        state.baseline_due = now + self.base
+
+        if failed:
+            state.counters["failures"] += 1
+            return self.min_interval
+
+        fingerprint = fingerprint or content_fingerprint(rows)
+        if state.fingerprint is not None:
+            if fingerprint == state.fingerprint:
+                state.counters["unchanged"] += 1
+                factor = self.growth
+            else:
+                state.counters["changes"] += 1
+                factor = self.shrink
+            if self.adaptive:
+                state.interval = min(self.max_interval, max(self.min_interval, state.interval * factor))
+        state.fingerprint = fingerprint
+        return state.interval
+
+    def hit(self, source: str):
+        """캐시 적중 기록 (고정 주기였다면 만료됐을 시점이면 절약한 호출 1회)"""
+        state = self.sources.get(source)
+        if state is None or state.baseline_due is None:
+            return
+        now = time.monotonic()
+        if now >= state.baseline_due:
+            state.counters["saved_calls"] += 1
+            state.baseline_due = now + self.base
+
+    def stats(self) -> Dict[str, Any]:
+        sources = {
+            name: {"interval_s": round(state.interval, 1), **state.counters}
+            for name, state in self.sources.items()
+        }
+        saved = sum(s["saved_calls"] for s in sources.values())
+        extra = sum(s["extra_calls"] for s in sources.values())
+        return {
+            "adaptive": self.adaptive,
+            "base_interval_s": self.base,
+            "min_interval_s": self.min_interval,
+            "max_interval_s": self.max_interval,
+            "saved_calls": saved,
+            "extra_calls": extra,
+            "net_saved_calls": saved - extra,
+            "sources": sources,
+        }
+
+
+refresh_policy = RefreshPolicy()
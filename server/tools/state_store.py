@@ -0,0 +1,206 @@
+"""
+캐시 / 스냅샷 상태 저장소
+
+stateless HTTP 모드(MCP_STATELESS=1)에서는 여러 인스턴스가 라운드 로빈으로 요청을 나눠 받으므로
+뉴스 / 순위 캐시와 리더보드 스냅샷을 프로세스 밖의 공유 저장소에 둡니다.
+어느 인스턴스가 업스트림에서 가져왔든 다른 인스턴스는 같은 결과와 스냅샷 버전을 봅니다.
+
+- memory: 프로세스 안 dict (기본, 단일 인스턴스)
+- sqlite: 로컬 SQLite 파일 (WAL), 같은 호스트의 여러 인스턴스가 공유
+
+값은 JSON으로 저장합니다. (to_dict()를 가진 레코드는 dict로 변환)
+SQLite 저장소는 마지막으로 읽은 값을 기억해 두고, 다른 인스턴스가 바꾸지 않았으면
+디코딩하지 않고 같은 객체를 돌려줍니다.
+
+환경 변수
+- STATE_STORE: memory | sqlite (기본 memory, MCP_STATELESS=1이면 sqlite)
+- STATE_STORE_PATH: SQLite 파일 경로 (기본 .cache/state.sqlite3)
+"""
+
+import abc
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .tracing import span
+
+
+def _to_jsonable(value: Any) -> Any:
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class StateStore(abc.ABC):
+    """키-값 상태 저장소 (ttl이 지난 값은 없는 것으로 취급)"""
+
+    backend = "base"
+
+    def __init__(self):
+        self.stats_counters = {"hits": 0, "misses": 0, "sets": 0}
+
+    @abc.abstractmethod
+    async def get(self, key: str) -> Any:
+        """값 조회 (없거나 만료됐으면 None)"""
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """값 저장 (ttl초 뒤 만료, None이면 만료 없음)"""
+
+    @abc.abstractmethod
+    async def delete(self, key: str):
+        """값 삭제"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": self.backend, **self.stats_counters}
+
+
+class MemoryStateStore(StateStore):
+    """프로세스 안 저장소 (값을 복사하지 않고 그대로 보관)"""
+
+    backend = "memory"
+
+    def __init__(self):
+        super().__init__()
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+
+    async def get(self, key: str) -> Any:
+        with span("cache.get", key=key) as s:
+            entry = self._data.get(key)
+            hit = entry is not None and (entry[1] is None or entry[1] > time.time())
+            s.set(hit=hit)
+        if not hit:
+            self.stats_counters["misses"] += 1
+            return None
+        self.stats_counters["hits"] += 1
+        return entry[0]
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.stats_counters["sets"] += 1
+        self._data[key] = (value, time.time() + ttl if ttl else None)
+
+    async def delete(self, key: str):
+        self._data.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "keys": len(self._data)}
+
+
+class SQLiteStateStore(StateStore):
+    """여러 인스턴스가 공유하는 SQLite 저장소
+
+    SQLite 호출은 전용 스레드 하나에서 실행해 이벤트 루프를 막지 않습니다.
+    """
+
+    backend = "sqlite"
+
+    # 만료된 행 정리 주기 (set 횟수)
+    PURGE_EVERY = 200
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = Path(path)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="state-store")
+        self._conn: Optional[sqlite3.Connection] = None
+        # key -> (updated, 디코딩된 값)
+        self._decoded: Dict[str, Tuple[int, Any]] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS state ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, updated INTEGER NOT NULL, expires REAL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _get(self, key: str, known: Optional[int]) -> Optional[Tuple[int, Optional[str]]]:
+        # 기억해 둔 값과 같은 버전이면 본문은 읽지 않음
+        row = self._connect().execute(
+            "SELECT updated, CASE WHEN updated = ? THEN NULL ELSE value END FROM state "
+            "WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (known, key, time.time()),
+        ).fetchone()
+        return row
+
+    def _set(self, key: str, raw: str, updated: int, expires: Optional[float], purge: bool):
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO state (key, value, updated, expires) VALUES (?, ?, ?, ?)",
+            (key, raw, updated, expires),
+        )
+        if purge:
+            conn.execute("DELETE FROM state WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+
+    def _delete(self, key: str):
+        self._connect().execute("DELETE FROM state WHERE key = ?", (key,))
+
+    async def get(self, key: str) -> Any:
+        known = self._decoded.get(key)
+        with span("cache.get", key=key, backend=self.backend) as s:
+            try:
+                row = await self._run(self._get, key, known[0] if known else None)
+            except sqlite3.Error as e:
+                print(f"Error reading state {key}: {e}", file=sys.stderr)
+                row = None
+            s.set(hit=row is not None, decoded=row is not None and row[1] is not None)
+
+        if row is None:
+            self.stats_counters["misses"] += 1
+            self._decoded.pop(key, None)
+            return None
+
+        self.stats_counters["hits"] += 1
+        updated, raw = row
+        if raw is None:
+            return known[1]
+        value = json.loads(raw)
+        self._decoded[key] = (updated, value)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        self.stats_counters["sets"] += 1
+        raw = json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=_to_jsonable)
+        updated = time.time_ns()
+        purge = self.stats_counters["sets"] % self.PURGE_EVERY == 0
+        try:
+            await self._run(self._set, key, raw, updated, time.time() + ttl if ttl else None, purge)
+        except sqlite3.Error as e:
+            print(f"Error writing state {key}: {e}", file=sys.stderr)
+            return
+        # 방금 쓴 값은 이 인스턴스에서 그대로 다시 사용
+        self._decoded[key] = (updated, value)
+
+    async def delete(self, key: str):
+        self._decoded.pop(key, None)
+        await self._run(self._delete, key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "path": str(self.path), "decoded_keys": len(self._decoded)}
+
+
+def create_state_store(backend: Optional[str] = None, path: Optional[str] = None) -> StateStore:
+    """환경 변수 설정에 맞는 저장소 생성"""
+    default = "sqlite" if os.getenv("MCP_STATELESS") == "1" else "memory"
+    backend = backend or os.getenv("STATE_STORE", default)
+    if backend == "memory":
+        return MemoryStateStore()
+    if backend == "sqlite":
+        return SQLiteStateStore(path or os.getenv("STATE_STORE_PATH", ".cache/state.sqlite3"))
+    raise ValueError(f"Unknown state store: {backend}")
+
+
+state_store = create_state_store()
@@ -0,0 +1,47 @@
+"""
+도구 결과의 점진적 스트리밍
+
+소스별 부분 결과를 도착하는 즉시 MCP 알림으로 클라이언트에 보냅니다.
+클라이언트가 progressToken을 보냈다면 progress 알림(message에 JSON 청크)을,
+아니면 요청에 연결된 로그 알림(data에 청크)을 사용합니다.
+streamable HTTP에서는 두 알림 모두 해당 요청의 SSE 스트림으로 전달됩니다.
+"""
+
+import json
+import sys
+from typing import Any, Dict
+
+from mcp.server.fastmcp import Context
+
+
+class ChunkStreamer:
+    """부분 결과를 MCP 알림으로 전송하는 콜백"""
+
+    def __init__(self, ctx: Context, total: int, logger: str):
+        self.ctx = ctx
+        self.total = total
+        self.logger = logger
+        self.sent = 0
+
+    async def __call__(self, chunk: Dict[str, Any]) -> None:
+        self.sent += 1
+        payload = {"chunk": self.sent, "total": self.total, **chunk}
+
+        try:
+            meta = self.ctx.request_context.meta
+            if meta is not None and meta.progressToken is not None:
+                await self.ctx.report_progress(
+                    self.sent,
+                    self.total,
+                    json.dumps(payload, ensure_ascii=False, default=str),
+                )
+            else:
+                await self.ctx.session.send_log_message(
+                    level="info",
+                    data=payload,
+                    logger=self.logger,
+                    related_request_id=self.ctx.request_id,
+                )
+        except Exception as e:
+            # 스트리밍 실패는 최종 결과 반환에 영향을 주지 않음
+            print(f"Error streaming chunk: {e}", file=sys.stderr)
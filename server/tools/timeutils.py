@@ -0,0 +1,36 @@
+"""
+업스트림 날짜 문자열 정규화
+
+arXiv(RFC 2822 / feedparser struct_time), Hugging Face·GitHub(ISO 8601)의
+서로 다른 날짜 형식을 수집 시점에 한 번만 epoch 초(int)로 변환합니다.
+"""
+
+import calendar
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+
+def to_epoch(value: Any) -> int:
+    """날짜 값을 UTC epoch 초로 변환 (해석 불가하면 0)"""
+    if not value:
+        return 0
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, time.struct_time):
+        return calendar.timegm(value)
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        text = str(value).strip()
+        try:
+            dt = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                dt = parsedate_to_datetime(text)
+            except (TypeError, ValueError):
+                return 0
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
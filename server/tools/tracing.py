@@ -0,0 +1,355 @@
+"""
+도구 호출 추적 (span 트리)
+
+집계 지표만으로는 ai_overview 한 번이 왜 9초 걸렸는지 알 수 없으므로,
+도구 호출마다 어느 단계에 시간이 쓰였는지 span 트리로 기록합니다.
+
+    tool:ai_overview                      9012ms
+    ├─ cache.get  key=collector:aa_rankings  0.1ms  hit=false
+    ├─ http GET artificialanalysis.ai/...  8700ms  status=200 bytes=812345
+    ├─ parse  func=parse_artificial_analysis  250ms
+    └─ serialize                            30ms
+
+- 현재 span은 contextvars로 전달되므로 asyncio.gather 등으로 만든 태스크도 부모를 이어받음
+- 업스트림 HTTP 요청은 aiohttp TraceConfig(http_trace_config)로 상태 코드와 응답 크기까지 기록
+- serialize: 도구가 반환한 뒤 결과 변환이 끝나는 루프의 다음 차례까지
+- 도구 호출 밖(백그라운드 수집 등)에서는 span을 만들지 않음
+
+끝난 추적은 익스포터로 보냅니다. (span 하나당 한 줄, parent_id로 트리 복원)
+TRACE_SLOW_MS 이상 걸린 호출은 느린 호출 로그에 트리 전체를 한 줄로 남깁니다.
+익스포터도 느린 호출 로그도 없으면 도구 함수를 감싸지 않습니다.
+
+환경 변수
+- TRACE_EXPORTER: none | jsonl | "모듈:이름" (SpanExporter를 만드는 호출 가능 객체) (기본 none)
+- TRACE_FILE: jsonl 익스포터 파일 (기본 .cache/traces/spans.jsonl)
+- TRACE_SLOW_MS: 느린 호출 기준 (기본 0 = 끔)
+- TRACE_SLOW_FILE: 느린 호출 로그 파일 (기본 .cache/traces/slow.jsonl)
+"""
+
+import abc
+import asyncio
+import functools
+import importlib
+import json
+import os
+import queue
+import secrets
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+import aiohttp
+
+
+class Trace:
+    """도구 호출 하나의 span 모음"""
+
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.trace_id = secrets.token_hex(8)
+        self.wall_start = time.time()
+        self.start = time.perf_counter()
+        self.spans: List["Span"] = []
+
+
+class Span:
+    """추적 구간 (end가 None이면 진행 중)"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "start", "end", "attributes", "error")
+
+    def __init__(self, trace: Trace, name: str, parent: Optional["Span"], attributes: Dict[str, Any]):
+        self.trace = trace
+        self.span_id = len(trace.spans) + 1
+        self.parent_id = parent.span_id if parent is not None else None
+        self.name = name
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        trace.spans.append(self)
+
+    def set(self, **attributes: Any):
+        self.attributes.update(attributes)
+
+    def finish(self):
+        self.end = time.perf_counter()
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        return None if self.end is None else round((self.end - self.start) * 1000, 3)
+
+    def to_dict(self) -> Dict[str, Any]:
+        trace = self.trace
+        return {
+            "trace_id": trace.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": round(trace.wall_start + (self.start - trace.start), 6),
+            "duration_ms": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _NoopSpan:
+    """추적 중이 아닐 때 돌려주는 빈 span"""
+
+    def set(self, **attributes: Any):
+        pass
+
+
+_NOOP = _NoopSpan()
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def start_span(name: str, **attributes: Any) -> Optional[Span]:
+    """현재 span의 자식 span 시작 (현재 span은 바꾸지 않음, 추적 중이 아니면 None)"""
+    parent = _current.get()
+    if parent is None:
+        return None
+    return Span(parent.trace, name, parent, attributes)
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """with span("parse", func=...) as s: ... s.set(rows=10)"""
+    parent = _current.get()
+    if parent is None:
+        yield _NOOP
+        return
+    current = Span(parent.trace, name, parent, attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = repr(e)
+        raise
+    finally:
+        current.finish()
+        _current.reset(token)
+
+
+# =========================
+# 업스트림 HTTP
+# =========================
+
+async def _on_request_start(session, context, params):
+    url = params.url
+    context.span = start_span("http", method=params.method, url=f"{url.host}{url.path}", bytes=0)
+
+
+async def _on_request_end(session, context, params):
+    if context.span is not None:
+        context.span.set(status=params.response.status)
+        context.span.finish()
+
+
+async def _on_chunk_received(session, context, params):
+    # 본문을 다 읽을 때까지 구간을 늘림
+    if context.span is not None:
+        context.span.attributes["bytes"] += len(params.chunk)
+        context.span.finish()
+
+
+async def _on_request_exception(session, context, params):
+    if context.span is not None:
+        context.span.error = repr(params.exception)
+        context.span.finish()
+
+
+def _http_trace_config() -> aiohttp.TraceConfig:
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_request_end.append(_on_request_end)
+    config.on_response_chunk_received.append(_on_chunk_received)
+    config.on_request_exception.append(_on_request_exception)
+    return config
+
+
+# aiohttp.ClientSession(trace_configs=[http_trace_config])
+http_trace_config = _http_trace_config()
+
+
+# =========================
+# 익스포터
+# =========================
+
+class JsonlWriter:
+    """JSON 한 줄씩 파일에 추가 (쓰기는 백그라운드 스레드에서)"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, record: Dict[str, Any]):
+        self._queue.put(json.dumps(record, ensure_ascii=False, default=str))
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="trace-writer", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                while True:
+                    line = self._queue.get()
+                    if line is None:
+                        return
+                    f.write(line + "\n")
+                    if self._queue.empty():
+                        f.flush()
+        except OSError as e:
+            print(f"Error writing traces to {self.path}: {e}", file=sys.stderr)
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+
+class SpanExporter(abc.ABC):
+    """끝난 추적의 span 목록을 받는 익스포터 (이벤트 루프에서 호출되므로 막지 않아야 함)"""
+
+    @abc.abstractmethod
+    def export(self, spans: List[Dict[str, Any]]):
+        """추적 하나의 span 목록 (Span.to_dict() 형식)"""
+
+    def shutdown(self):
+        pass
+
+
+class JsonlSpanExporter(SpanExporter):
+    """span 하나당 JSON 한 줄"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.writer = JsonlWriter(path or os.getenv("TRACE_FILE", ".cache/traces/spans.jsonl"))
+
+    def export(self, spans: List[Dict[str, Any]]):
+        for record in spans:
+            self.writer.write(record)
+
+    def shutdown(self):
+        self.writer.close()
+
+
+def create_exporter(spec: Optional[str] = None) -> Optional[SpanExporter]:
+    """TRACE_EXPORTER 설정 → 익스포터 ("모듈:이름"이면 불러와 호출)"""
+    spec = spec if spec is not None else os.getenv("TRACE_EXPORTER", "none")
+    if spec in ("", "none"):
+        return None
+    if spec == "jsonl":
+        return JsonlSpanExporter()
+    module, _, attr = spec.partition(":")
+    if not attr:
+        raise ValueError(f"Unknown trace exporter: {spec}")
+    return getattr(importlib.import_module(module), attr)()
+
+
+def span_tree(trace: Trace) -> Dict[str, Any]:
+    """span 목록 → 중첩 트리 (느린 호출 로그용)"""
+    nodes = {}
+    root = None
+    for s in trace.spans:
+        nodes[s.span_id] = node = {
+            "name": s.name,
+            "offset_ms": round((s.start - trace.start) * 1000, 3),
+            "duration_ms": s.duration_ms,
+            **({"attributes": s.attributes} if s.attributes else {}),
+            **({"error": s.error} if s.error else {}),
+            "children": [],
+        }
+        if s.parent_id is None:
+            root = node
+        else:
+            nodes[s.parent_id]["children"].append(node)
+    return root
+
+
+# =========================
+# 도구 진입점
+# =========================
+
+class Tracer:
+    """도구 호출마다 추적을 시작하고 끝난 추적을 익스포터 / 느린 호출 로그로 보냄"""
+
+    def __init__(self, exporter: Optional[SpanExporter] = None, slow_ms: Optional[float] = None,
+                 slow_file: Optional[str] = None):
+        self.exporter = exporter if exporter is not None else create_exporter()
+        self.slow_ms = slow_ms if slow_ms is not None else float(os.getenv("TRACE_SLOW_MS", "0"))
+        self.slow_log = JsonlWriter(slow_file or os.getenv("TRACE_SLOW_FILE", ".cache/traces/slow.jsonl"))
+        self.stats_counters = {"traces": 0, "spans": 0, "slow": 0, "export_errors": 0}
+        self.recent_slow: Deque[Dict[str, Any]] = deque(maxlen=20)
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None or self.slow_ms > 0
+
+    def _finish(self, trace: Trace, root: Span, serialize: Span):
+        serialize.finish()
+        root.finish()
+        self.stats_counters["traces"] += 1
+        self.stats_counters["spans"] += len(trace.spans)
+
+        if self.exporter is not None:
+            try:
+                self.exporter.export([s.to_dict() for s in trace.spans])
+            except Exception as e:
+                self.stats_counters["export_errors"] += 1
+                print(f"Error exporting trace {trace.trace_id}: {e}", file=sys.stderr)
+
+        duration_ms = root.duration_ms
+        if self.slow_ms > 0 and duration_ms >= self.slow_ms:
+            self.stats_counters["slow"] += 1
+            self.slow_log.write({
+                "trace_id": trace.trace_id,
+                "tool": trace.tool,
+                "start_time": trace.wall_start,
+                "duration_ms": duration_ms,
+                "root": span_tree(trace),
+            })
+            self.recent_slow.append({"trace_id": trace.trace_id, "tool": trace.tool, "duration_ms": duration_ms})
+
+    def wrap(self, func):
+        """비동기 도구 함수를 추적의 루트 span으로 감쌈 (꺼져 있으면 원래 함수 그대로)"""
+        if not self.enabled:
+            return func
+        tool = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            trace = Trace(tool)
+            arguments = {k: v for k, v in kwargs.items() if k != "ctx"}
+            root = Span(trace, f"tool:{tool}", None, {"arguments": arguments})
+            token = _current.set(root)
+            try:
+                return await func(*args, **kwargs)
+            except BaseException as e:
+                root.error = repr(e)
+                raise
+            finally:
+                _current.reset(token)
+                # 결과 변환은 이 코루틴이 반환된 직후 같은 차례에 일어나므로 다음 차례에 마감
+                serialize = Span(trace, "serialize", root, {})
+                asyncio.get_running_loop().call_soon(self._finish, trace, root, serialize)
+
+        return wrapper
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "exporter": type(self.exporter).__name__ if self.exporter is not None else None,
+            "slow_ms": self.slow_ms,
+            **self.stats_counters,
+            "recent_slow": list(self.recent_slow),
+        }
+
+
+tracer = Tracer()
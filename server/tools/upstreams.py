@@ -0,0 +1,25 @@
+"""
+업스트림 서비스 주소
+
+부하 테스트나 로컬 개발에서 실제 arXiv / HF / GitHub / 리더보드 대신
+로컬 에뮬레이터(bench/upstream_emulator.py)를 가리키도록 환경 변수로 바꿀 수 있습니다.
+
+환경 변수
+- ARXIV_API_BASE: 기본 http://export.arxiv.org
+- HF_API_BASE: 기본 https://huggingface.co (HF 크롤러와 공유)
+- GITHUB_API_BASE: 기본 https://api.github.com
+- ARTIFICIAL_ANALYSIS_URL: 기본 https://artificialanalysis.ai/leaderboards/models
+- LMSYS_ARENA_URL: 기본 https://chat.lmsys.org/
+"""
+
+import os
+
+ARXIV_API_BASE = os.getenv("ARXIV_API_BASE", "http://export.arxiv.org").rstrip("/")
+HF_API_BASE = os.getenv("HF_API_BASE", "https://huggingface.co").rstrip("/")
+GITHUB_API_BASE = os.getenv("GITHUB_API_BASE", "https://api.github.com").rstrip("/")
+ARTIFICIAL_ANALYSIS_URL = os.getenv("ARTIFICIAL_ANALYSIS_URL", "https://artificialanalysis.ai/leaderboards/models")
+LMSYS_ARENA_URL = os.getenv("LMSYS_ARENA_URL", "https://chat.lmsys.org/")
+
+ARXIV_QUERY_URL = f"{ARXIV_API_BASE}/api/query"
+HF_MODELS_URL = f"{HF_API_BASE}/api/models"
+GITHUB_SEARCH_REPOS_URL = f"{GITHUB_API_BASE}/search/repositories"
@@ -0,0 +1,150 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tools import admission as admission_module
+from tools.admission import AdmissionController, Overloaded, parse_tool_limits
+
+
+def make_controller(**overrides) -> AdmissionController:
+    options = dict(global_limit=4, tool_limit=2, tool_limits={}, queue_size=8, queue_timeout=1.0, stale_max_age=60)
+    return AdmissionController(**{**options, **overrides})
+
+
+def test_parse_tool_limits():
+    assert parse_tool_limits("ai_overview=2, get_ai_news=6,bad=x,") == {"ai_overview": 2, "get_ai_news": 6}
+
+
+def test_explicit_zero_settings_are_not_replaced_by_defaults(monkeypatch):
+    monkeypatch.setenv("ADMISSION_GLOBAL_LIMIT", "16")
+    monkeypatch.setenv("ADMISSION_QUEUE_TIMEOUT", "10")
+    controller = AdmissionController(global_limit=0, tool_limit=0, queue_timeout=0, stale_max_age=0)
+    assert (controller.global_limit, controller.tool_limit, controller.queue_timeout, controller.stale_max_age) == (0, 0, 0, 0)
+
+    async def call():
+        async with controller.slot("tool"):
+            pass
+
+    with pytest.raises(Overloaded, match="disabled"):
+        asyncio.run(call())
+
+
+def test_tool_and_global_slot_limits():
+    controller = make_controller(global_limit=3, tool_limits={"narrow": 1})
+    peak = {"narrow": 0, "wide": 0, "all": 0}
+    running = {"narrow": 0, "wide": 0}
+
+    async def call(tool):
+        async with controller.slot(tool):
+            running[tool] += 1
+            peak[tool] = max(peak[tool], running[tool])
+            peak["all"] = max(peak["all"], sum(running.values()))
+            await asyncio.sleep(0.01)
+            running[tool] -= 1
+
+    async def scenario():
+        await asyncio.gather(*(call("narrow") for _ in range(3)), *(call("wide") for _ in range(4)))
+
+    asyncio.run(scenario())
+    assert peak == {"narrow": 1, "wide": 2, "all": 3}
+    stats = controller.stats()
+    assert stats["admitted"] == 7 and stats["in_flight"] == 0 and stats["waiting"] == 0
+    assert stats["tools"]["narrow"]["queued"] == 2
+
+
+def test_full_queue_is_rejected_immediately():
+    controller = make_controller(tool_limit=1, queue_size=1)
+    release = None
+
+    async def hold():
+        async with controller.slot("tool"):
+            await release.wait()
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold())
+        queued = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded, match="queue full") as excinfo:
+            async with controller.slot("tool"):
+                pass
+        release.set()
+        await asyncio.gather(holder, queued)
+        return excinfo.value
+
+    error = asyncio.run(scenario())
+    assert error.retry_after > 0
+    assert controller.stats()["shed_queue_full"] == 1 and controller.stats()["admitted"] == 2
+
+
+def test_queued_call_gives_up_at_the_deadline():
+    controller = make_controller(tool_limit=1, queue_timeout=0.05)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def hold():
+            async with controller.slot("tool"):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded, match="deadline"):
+            async with controller.slot("tool"):
+                pass
+        # 대기를 포기한 요청은 대기열과 슬롯을 남기지 않음
+        assert controller.waiting == 0
+        release.set()
+        await holder
+        async with controller.slot("tool"):
+            pass
+
+    asyncio.run(scenario())
+    assert controller.stats()["shed_deadline"] == 1
+
+
+def test_shed_calls_fall_back_to_a_recent_result_only(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(admission_module, "time", SimpleNamespace(monotonic=lambda: clock.now,
+                                                                  perf_counter=lambda: clock.now))
+    controller = make_controller(tool_limit=1, queue_size=0, stale_max_age=60)
+    gate = {"event": None}
+
+    async def get_news(category="all", ctx=None):
+        if gate["event"] is not None:
+            await gate["event"].wait()
+        return {"items": [category]}
+
+    guarded = controller.guard(get_news)
+
+    async def while_busy():
+        # 다른 호출이 슬롯을 점유한 동안 (대기열 0) 들어온 호출
+        gate["event"] = asyncio.Event()
+        holder = asyncio.create_task(guarded(category="other"))
+        await asyncio.sleep(0)
+        try:
+            return await guarded(category="ai", ctx=object())
+        except Overloaded as e:
+            return e.reason
+        finally:
+            gate["event"].set()
+            await holder
+            gate["event"] = None
+
+    async def scenario():
+        never_served = await while_busy()
+        await guarded(category="ai")
+        clock.now += 30
+        recent = await while_busy()
+        clock.now += 31
+        expired = await while_busy()
+        return never_served, recent, expired
+
+    never_served, recent, expired = asyncio.run(scenario())
+    assert never_served == "queue full"
+    assert recent == {"items": ["ai"], "stale": True}
+    assert expired == "queue full"
+    stats = controller.stats()
+    assert stats["served_cached"] == 1 and stats["shed_queue_full"] == 3
@@ -0,0 +1,192 @@
+import asyncio
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from tools import cache_warmer as warmer_module
+from tools.cache_warmer import CacheWarmer, SpaceSaving, WarmSpec, cacheable
+
+
+def test_space_saving_bounds_and_finds_heavy_hitters():
+    rng = random.Random(5)
+    stream = ["hot"] * 300 + ["warm"] * 150 + [f"cold{rng.randint(0, 500)}" for _ in range(600)]
+    rng.shuffle(stream)
+    sketch = SpaceSaving(16)
+    for key in stream:
+        sketch.add(key)
+
+    exact = Counter(stream)
+    assert len(sketch) == 16
+    assert [key for key, _, _ in sketch.top(2)] == ["hot", "warm"]
+    for key, count, error in sketch.top(16):
+        # count는 상한, count - error는 하한
+        assert count - error <= exact[key] <= count
+
+
+def test_space_saving_evicts_minimum_and_decays():
+    sketch = SpaceSaving(2)
+    assert sketch.add("a", 3) is None and sketch.add("b") is None
+    assert sketch.add("c") == "b"
+    assert sketch.top(2) == [("a", 3, 0), ("c", 2, 1)]
+    sketch.decay(0.5)
+    assert sketch.top(1) == [("a", 1.5, 0)]
+
+
+@pytest.mark.parametrize("result, expected", [
+    ({"items": [1]}, True),
+    ([1, 2], True),
+    (None, False),
+    ([], False),
+    ({"items": []}, False),
+    ({"models": [], "benchmark": "x"}, False),
+    ({"models": [1], "degraded": True}, False),
+    ({"recommendations": [1], "degraded_sources": ["lmsys_arena"]}, False),
+    ({"recommendations": [1], "degraded_sources": []}, True),
+    ({"success": False, "error": "bad"}, False),
+    ({"error": "Unknown benchmark"}, False),
+    ({"items": [1], "stale": True}, False),
+])
+def test_cacheable(result, expected):
+    assert cacheable(result) is expected
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    current = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(warmer_module, "time", SimpleNamespace(monotonic=lambda: current.now))
+    return current
+
+
+def make_warmer() -> CacheWarmer:
+    return CacheWarmer(top_k=5, ttl=60, lead=15, interval=10, min_count=2, decay=0.5, sketch_size=16, cache_size=8)
+
+
+class Upstream:
+    """호출 수를 세는 도구 함수"""
+
+    def __init__(self, results):
+        self.results = list(results)
+        self.calls = 0
+
+    async def tool(self, category: str = "all", limit: int = 10, cursor=None, ctx=None):
+        self.calls += 1
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+def test_entries_are_capped_at_the_source_ttl(clock):
+    warmer = make_warmer()
+    source_ttl = {"value": 20}
+    upstream = Upstream([{"items": [1]}])
+    tool = warmer.wrap(upstream.tool, WarmSpec(("category", "limit"), ttl=lambda args: source_ttl["value"]))
+
+    async def scenario():
+        await tool(category="all", limit=10)
+        clock.now += 19
+        await tool(category="all", limit=10)
+        assert upstream.calls == 1
+        clock.now += 2
+        await tool(category="all", limit=10)
+        assert upstream.calls == 2
+        # 소스 TTL이 WARM_TTL보다 길면 WARM_TTL까지
+        source_ttl["value"] = 600
+        clock.now += 25
+        await tool(category="all", limit=10)
+        clock.now += 61
+        await tool(category="all", limit=10)
+
+    asyncio.run(scenario())
+    assert upstream.calls == 4
+
+
+def test_failed_and_degraded_results_are_not_cached(clock):
+    warmer = make_warmer()
+    upstream = Upstream([{"items": []}, {"items": [1], "degraded": True}, {"items": [1]}])
+    tool = warmer.wrap(upstream.tool, WarmSpec(("category", "limit")))
+
+    async def scenario():
+        return [await tool() for _ in range(4)]
+
+    results = asyncio.run(scenario())
+    assert results == [{"items": []}, {"items": [1], "degraded": True}, {"items": [1]}, {"items": [1]}]
+    assert upstream.calls == 3
+    assert warmer.stats()["not_cached"] == 2 and warmer.stats()["hits"] == 1
+
+
+def test_version_change_invalidates_tokens(clock):
+    warmer = make_warmer()
+    store = {"version": 1}
+    upstream = Upstream([{"items": [1], "since": "v1"}, {"items": [1], "since": "v2"}])
+    tool = warmer.wrap(upstream.tool, WarmSpec(("category", "limit"), version=lambda: store["version"]))
+
+    async def scenario():
+        first = await tool()
+        assert (await tool()) is first
+        store["version"] = 2
+        return await tool()
+
+    assert asyncio.run(scenario())["since"] == "v2"
+    assert upstream.calls == 2 and warmer.stats()["invalidated"] == 1
+
+
+def test_version_is_read_after_the_call(clock):
+    """실행 중에 새 항목이 색인되면 그 뒤의 버전으로 보관"""
+    warmer = make_warmer()
+    store = {"version": 1}
+
+    async def tool(category: str = "all", limit: int = 10):
+        store["version"] += 1
+        return {"items": [store["version"]]}
+
+    wrapped = warmer.wrap(tool, WarmSpec(("category", "limit"), version=lambda: store["version"]))
+
+    async def scenario():
+        return await wrapped(), await wrapped()
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+
+
+def test_single_flight_and_bypass(clock):
+    warmer = make_warmer()
+    upstream = Upstream([{"items": [1]}])
+
+    async def slow(category: str = "all", limit: int = 10, cursor=None, ctx=None):
+        await asyncio.sleep(0.01)
+        return await upstream.tool(category, limit, cursor)
+
+    slow.__name__ = "get_ai_news"
+    tool = warmer.wrap(slow, WarmSpec(("category", "limit")))
+
+    async def scenario():
+        results = await asyncio.gather(*(tool(limit=5, ctx=object()) for _ in range(5)))
+        assert upstream.calls == 1 and all(r is results[0] for r in results)
+        # 키 인자가 아닌 인자(cursor)가 기본값이 아니면 캐시를 거치지 않음
+        await tool(limit=5, cursor="abc")
+        await tool(limit=5, cursor="abc")
+
+    asyncio.run(scenario())
+    assert upstream.calls == 3 and warmer.stats()["bypassed"] == 2
+
+
+def test_warm_once_refreshes_frequent_keys_before_expiry(clock):
+    warmer = make_warmer()
+    upstream = Upstream([{"items": [1]}])
+    tool = warmer.wrap(upstream.tool, WarmSpec(("category", "limit")))
+
+    async def scenario():
+        for _ in range(3):
+            await tool(category="research")
+        await tool(category="industry")
+        assert warmer.candidates() == []
+        clock.now += 50
+        assert await warmer.warm_once() == 1
+        clock.now += 30
+        await tool(category="research")
+
+    asyncio.run(scenario())
+    stats = warmer.stats()
+    assert upstream.calls == 3
+    assert stats["refreshes"] == 1 and stats["saved_misses"] == 1
+    assert stats["top"][0]["key"] == 'tool:{"category": "research", "limit": 10}'
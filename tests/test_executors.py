@@ -0,0 +1,28 @@
+import asyncio
+import operator
+
+import pytest
+
+from tools import executors
+
+
+@pytest.fixture
+def restore_executor():
+    mode, workers = executors._mode, executors._workers
+    yield
+    executors.configure_executor(mode, workers)
+
+
+@pytest.mark.parametrize("mode", executors.EXECUTOR_MODES)
+def test_run_decode_uses_one_shared_pool(mode, restore_executor):
+    executors.configure_executor(mode, 1)
+    assert asyncio.run(executors.run_decode(operator.add, 2, 3)) == 5
+    pool = executors.get_pool()
+    assert (pool is None) == (mode == "inline")
+    assert executors.get_pool() is pool
+    assert executors.executor_stats() == {"executor": mode, "workers": 1}
+
+
+def test_unknown_mode_rejected(restore_executor):
+    with pytest.raises(ValueError):
+        executors.configure_executor("fork")
@@ -0,0 +1,84 @@
+import asyncio
+
+from tools.feeds import Feed, FeedHub, diff_items
+
+
+def by_key(*items):
+    return {item["id"]: item for item in items}
+
+
+def test_diff_items_added_removed_changed():
+    previous = by_key({"id": "a", "title": "A", "stars": 1}, {"id": "b", "title": "B", "stars": 5})
+    current = by_key({"id": "b", "title": "B", "stars": 7}, {"id": "c", "title": "C", "stars": 0})
+
+    diff = diff_items(previous, current, summary_fields=("title", "url"), watch_fields=("stars",), limit=10)
+    assert diff == {
+        "added": [{"key": "c", "title": "C"}],
+        "removed": ["a"],
+        "changed": [{"key": "b", "fields": {"stars": [5, 7]}}],
+        "truncated": False,
+    }
+
+
+def test_diff_items_ignores_unwatched_fields_and_truncates():
+    previous = by_key({"id": "a", "title": "old"})
+    current = by_key({"id": "a", "title": "new"}, *({"id": str(i)} for i in range(5)))
+
+    diff = diff_items(previous, current, summary_fields=(), watch_fields=(), limit=3)
+    assert diff["changed"] == []
+    assert [item["key"] for item in diff["added"]] == ["0", "1", "2"]
+    assert diff["truncated"] is True
+    assert diff_items(current, current, (), ("title",), 3) == {"added": [], "removed": [], "changed": [],
+                                                               "truncated": False}
+
+
+class FakeSession:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.notifications = []
+
+    async def send_notification(self, notification):
+        if self.fail:
+            raise ConnectionError("closed")
+        self.notifications.append(notification)
+
+
+def test_feed_hub_versions_and_notifies_only_on_change():
+    pages = [
+        [{"model": "a"}, {"model": "b"}],
+        [{"model": "a"}, {"model": "b"}],
+        [],
+        [{"model": "b"}, {"model": "a"}, {"model": "c"}],
+    ]
+
+    async def fetch():
+        return pages.pop(0)
+
+    hub = FeedHub(interval=60, diff_limit=10)
+    hub.register(Feed("airec://test", "test", "", fetch, key_field="model", summary_fields=("model",), ranked=True))
+    session, broken = FakeSession(), FakeSession(fail=True)
+    hub.subscribe("airec://test", session)
+    hub.subscribe("airec://test", broken)
+
+    async def scenario():
+        # 첫 수집은 기준 버전 (알림 없음), 같은 내용 / 빈 목록은 버전 유지
+        assert await hub.refresh("airec://test") is None
+        assert await hub.refresh("airec://test") is None
+        assert await hub.refresh("airec://test") is None
+        assert hub.feeds["airec://test"].version == 1
+        return await hub.refresh("airec://test")
+
+    diff = asyncio.run(scenario())
+    assert diff["version"] == 2 and diff["previous_version"] == 1
+    assert diff["added"] == [{"key": "c", "model": "c"}]
+    assert sorted(diff["changed"], key=lambda c: c["key"]) == [
+        {"key": "a", "fields": {"rank": [1, 2]}},
+        {"key": "b", "fields": {"rank": [2, 1]}},
+    ]
+
+    assert len(session.notifications) == 1
+    params = session.notifications[0].root.params
+    assert str(params.uri) == "airec://test" and params.meta.model_dump()["diff"] == diff
+    # 알림에 실패한 세션은 구독 해제
+    assert list(hub.subscribers["airec://test"]) == [session]
+    assert hub.stats()["failed_notifications"] == 1
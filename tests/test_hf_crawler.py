@@ -0,0 +1,125 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer
+
+from bench.upstream_emulator import UpstreamEmulator
+from tools import hf_crawler as hf_crawler_module
+from tools.hf_crawler import HFCatalogCrawler
+from tools.model_search_index import ModelSearchIndex
+
+MODELS = 23
+PAGE = 5
+
+
+@pytest.fixture(autouse=True)
+def small_pages(monkeypatch):
+    monkeypatch.setattr(hf_crawler_module, "PAGE_SIZE", PAGE)
+
+
+def make_emulator() -> UpstreamEmulator:
+    emulator = UpstreamEmulator(seed=1)
+    emulator.hf_models = emulator.hf_models[:MODELS]
+    emulator.hf_by_id = {m["id"]: m for m in emulator.hf_models}
+    return emulator
+
+
+def make_crawler(server: TestServer, data_dir) -> HFCatalogCrawler:
+    return HFCatalogCrawler(base_url=str(server.make_url("/hf")), data_dir=str(data_dir),
+                            partitions=["all"], enabled=True, token="")
+
+
+async def serve(emulator: UpstreamEmulator) -> TestServer:
+    server = TestServer(emulator.app())
+    await server.start_server()
+    return server
+
+
+def test_emulator_pages_with_link_header():
+    async def scenario():
+        server = await serve(make_emulator())
+        try:
+            async with aiohttp.ClientSession() as session:
+                url = server.make_url("/hf/api/models").with_query(
+                    [("sort", "lastModified"), ("direction", "-1"), ("limit", "10"), ("expand[]", "author")])
+                seen = []
+                while url:
+                    async with session.get(url) as response:
+                        seen.extend(await response.json())
+                        next_link = response.links.get("next")
+                        if next_link:
+                            assert next_link["url"].query.getall("expand[]") == ["author"]
+                        url = next_link["url"] if next_link else None
+            return seen
+        finally:
+            await server.close()
+
+    seen = asyncio.run(scenario())
+    assert len(seen) == MODELS
+    assert len({m["id"] for m in seen}) == MODELS
+    modified = [m["lastModified"] for m in seen]
+    assert modified == sorted(modified, reverse=True)
+
+
+def test_full_crawl_resume_and_incremental(tmp_path):
+    emulator = make_emulator()
+
+    async def scenario():
+        server = await serve(emulator)
+        try:
+            # 1) 세 번째 페이지 처리 중 중단
+            first = make_crawler(server, tmp_path)
+            calls = []
+
+            def fail_on_third_page(records):
+                calls.append(len(records))
+                if len(calls) == 3:
+                    raise RuntimeError("interrupted")
+
+            first.listeners.append(fail_on_third_page)
+            status = await first.crawl()
+            assert status["pages"] == 3 and status["errors"] == 1
+            assert status["cycle"] == 0
+            assert status["in_progress"]["all"] == {"seen": 2 * PAGE, "done": False}
+
+            # 2) 새 인스턴스가 체크포인트에서 이어서 진행 (이미 받은 상세 정보는 다시 받지 않음)
+            resumed = make_crawler(server, tmp_path)
+            index = ModelSearchIndex()
+            index.attach(resumed)
+            assert len(index) == 0 and not resumed.loaded
+            status = await resumed.crawl()
+            assert status["pages"] == 3
+            assert status["detail_fetches"] == MODELS - 3 * PAGE
+            assert status["unchanged"] == PAGE
+            assert status["models"] == MODELS and len(index) == MODELS
+            assert status["cycle"] == 1 and status["in_progress"] == {}
+            high_water = status["high_water"]
+            assert high_water == max(m["lastModified"] for m in emulator.hf_models)
+
+            # 3) 증분 크롤: 새로 바뀐 모델만, 이미 본 시점에 닿은 첫 페이지에서 중단
+            for model in emulator.hf_models[10:12]:
+                model["lastModified"] = "2999-01-01T00:00:00.000Z"
+            resumed.stats = dict.fromkeys(resumed.stats, 0)
+            status = await resumed.crawl()
+            assert status["pages"] == 1
+            assert status["detail_fetches"] == 2
+            assert status["cycle"] == 2
+            assert status["high_water"] == "2999-01-01T00:00:00.000Z"
+        finally:
+            await server.close()
+
+    asyncio.run(scenario())
+
+
+def test_corpus_is_not_read_until_crawl(tmp_path):
+    (tmp_path / "corpus.jsonl").write_text('{"id": "a/b", "pipeline_tag": "text-generation"}\n', encoding="utf-8")
+
+    crawler = HFCatalogCrawler(data_dir=str(tmp_path), enabled=False)
+    index = ModelSearchIndex()
+    index.attach(crawler)
+    assert crawler.corpus == {} and len(index) == 0
+    assert crawler.status()["enabled"] is False and crawler.status()["loaded"] is False
+
+    asyncio.run(crawler.load())
+    assert list(crawler.corpus) == ["a/b"] and len(index) == 1
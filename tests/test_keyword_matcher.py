@@ -0,0 +1,23 @@
+from tools.keyword_matcher import KeywordMatcher, model_requirement_matcher
+
+
+def test_overlapping_keywords_match_in_one_pass():
+    matcher = KeywordMatcher({"he": ["a"], "she": ["b"], "his": ["c"], "hers": ["d"]})
+    assert matcher.find("ushers") == ["she", "he", "hers"]
+    assert matcher.classify("ushers") == ["b", "a", "d"]
+
+
+def test_case_insensitive_and_deduplicated():
+    matcher = KeywordMatcher({"Image": ["img"], "image gen": ["img", "gen"]})
+    assert matcher.classify("IMAGE gen and another image") == ["img", "gen"]
+
+
+def test_no_match_and_empty_keyword():
+    matcher = KeywordMatcher({"": ["never"], "code": ["code"]})
+    assert matcher.classify("") == []
+    assert matcher.classify("writing prose") == []
+
+
+def test_korean_and_multiword_keywords():
+    intents = model_requirement_matcher.classify("고전 문헌 번역과 요약")
+    assert intents == ["reasoning", "long-context", "multilingual", "translation", "summarization"]
@@ -0,0 +1,61 @@
+import asyncio
+from pathlib import Path
+
+from tools.leaderboards import parse_artificial_analysis, parse_lmsys_arena
+from tools.realtime_collector import SAMPLE_LMSYS_ARENA, RealtimeAIDataCollector
+
+FIXTURES = Path(__file__).parent / "fixtures" / "leaderboards"
+
+
+def fixture(name: str) -> str:
+    return (FIXTURES / name).read_text(encoding="utf-8")
+
+
+def test_artificial_analysis_html_table():
+    rows = parse_artificial_analysis(fixture("artificial_analysis_table.html"))["rows"]
+    assert rows == [
+        {"model": "GPT-5 (high)", "creator": "OpenAI", "intelligence_index": 68, "speed": 136.2,
+         "price_per_1m": 3.44, "context_window": "400k"},
+        {"model": "Claude 4 Sonnet", "creator": "Anthropic", "intelligence_index": 59, "speed": 1053,
+         "price_per_1m": 6.0, "context_window": "200k"},
+        {"model": "Gemini 2.5 Pro", "creator": "Google", "intelligence_index": 65.5, "speed": 143,
+         "price_per_1m": 3.44, "context_window": "1m"},
+    ]
+
+
+def test_artificial_analysis_next_data_blob():
+    rows = parse_artificial_analysis(fixture("artificial_analysis_next_data.html"))["rows"]
+    assert rows == [
+        {"model": "o3", "creator": "OpenAI", "intelligence_index": 67, "speed": 188.4,
+         "price_per_1m": 3.5, "context_window": "200k"},
+        {"model": "DeepSeek V3.1", "creator": "DeepSeek", "intelligence_index": 58, "speed": 21,
+         "price_per_1m": 0.84, "context_window": "128k"},
+    ]
+
+
+def test_lmsys_arena_gradio_config():
+    rows = parse_lmsys_arena(fixture("lmsys_arena_gradio.html"))["rows"]
+    assert [(r["rank"], r["model"], r["elo_rating"], r["organization"]) for r in rows] == [
+        (1, "GPT-5", 1442, "OpenAI"),
+        (2, "Gemini-2.5-Pro", 1437, "Google"),
+        (3, "Claude Opus 4.1", 1416, "Anthropic"),
+    ]
+
+
+def test_broken_page_returns_no_rows():
+    content = fixture("broken.html")
+    assert parse_artificial_analysis(content)["rows"] == []
+    assert parse_lmsys_arena(content)["rows"] == []
+
+
+def test_unreachable_leaderboard_is_reported_as_degraded_fallback():
+    collector = RealtimeAIDataCollector()
+    collector.sources["lmsys_arena"] = "http://127.0.0.1:1/"
+
+    rows = asyncio.run(collector.fetch_lmsys_arena())
+
+    assert [r["model"] for r in rows] == [r["model"] for r in SAMPLE_LMSYS_ARENA]
+    assert collector.snapshot_info("lmsys_arena")["origin"] == "fallback"
+    assert collector.degraded_sources() == ["lmsys_arena"]
+    stats = collector.ingest_stats()["lmsys_arena"]
+    assert stats["fallback"] == 1 and stats["live"] == 0 and stats["last_error"]
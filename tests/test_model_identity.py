@@ -0,0 +1,53 @@
+import pytest
+
+from tools.model_identity import ModelIdentityIndex, base_identity_key, identity_key
+
+
+@pytest.mark.parametrize("a, b", [
+    ("Claude Opus 4.5", "claude-opus-4-5-20251101"),
+    ("Claude Opus 4.5", "anthropic/claude-opus-4.5"),
+    ("Claude 4 Sonnet", "claude-sonnet-4"),
+    ("GPT-5 (high)", "gpt-5-high"),
+    ("Claude 3.7 Sonnet (Thinking)", "claude-3-7-sonnet-thinking"),
+    ("GPT-4o (Nov '24)", "gpt-4o"),
+    ("Gemini 2.5 Pro Preview", "gemini-2.5-pro-exp"),
+])
+def test_same_model(a, b):
+    assert identity_key(a) == identity_key(b)
+
+
+@pytest.mark.parametrize("a, b", [
+    ("GPT-5 (high)", "GPT-5 (low)"),
+    ("GPT-5 (high)", "GPT-5"),
+    ("o3 (Reasoning)", "o3 (Non-reasoning)"),
+    ("Claude Opus 4.5", "Claude Opus 4.1"),
+    ("Llama 3 8B", "Llama 3 70B"),
+])
+def test_different_models(a, b):
+    assert identity_key(a) != identity_key(b)
+
+
+def test_base_key_drops_qualifiers_only():
+    assert base_identity_key("GPT-5 (high)") == identity_key("GPT-5")
+    assert base_identity_key("gpt-5-high") == identity_key("gpt-5-high")
+    assert identity_key("(high)") == () == base_identity_key(None)
+
+
+def test_variants_keep_their_own_rows_and_fall_back_to_base_model():
+    aa = [{"model": "GPT-5 (high)", "score": 70}, {"model": "GPT-5 (low)", "score": 60},
+          {"model": "Claude Opus 4.5", "score": 71}]
+    arena = [{"model": "gpt-5", "elo": 1290}, {"model": "claude-opus-4-5-20251101", "elo": 1300},
+             {"model": "gpt-5-low", "elo": 1250}]
+    index = ModelIdentityIndex({"artificial_analysis": aa, "lmsys_arena": arena})
+
+    high = index.lookup("GPT-5 (high)")
+    low = index.lookup("GPT-5 (low)")
+    assert high["artificial_analysis"]["score"] == 70 and low["artificial_analysis"]["score"] == 60
+    # 변형 행이 있으면 그 행, 없으면 기본 모델 행
+    assert low["lmsys_arena"]["elo"] == 1250
+    assert high["lmsys_arena"]["elo"] == 1290
+    # 기본 모델 이름으로는 변형 행을 가져오지 않음
+    assert "artificial_analysis" not in index.lookup("GPT-5")
+    assert index.lookup("unknown model") == {}
+
+    assert index.joined("artificial_analysis", "lmsys_arena") == 3
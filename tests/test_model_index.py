@@ -0,0 +1,89 @@
+import asyncio
+import math
+import random
+
+import pytest
+
+from tools.model_index import DIMENSIONS, ModelIndex, parse_context_tokens
+from tools.realtime_collector import query_models
+
+ROWS = [
+    {"model": "big", "intelligence_index": 80, "speed": 50, "price_per_1m": 10.0, "context_window": "1m"},
+    {"model": "fast", "intelligence_index": 60, "speed": 300, "price_per_1m": 1.0, "context_window": "128k"},
+    {"model": "cheap", "intelligence_index": 50, "speed": 100, "price_per_1m": 0.2, "context_window": "400k"},
+    {"model": "dominated", "intelligence_index": 45, "speed": 90, "price_per_1m": 0.5, "context_window": "128k"},
+    {"model": "unpriced", "intelligence_index": 90, "speed": 10, "price_per_1m": None, "context_window": "200k"},
+]
+
+
+def names(results):
+    return [r["model"] for r in results]
+
+
+@pytest.mark.parametrize("value, tokens", [("1m", 1_000_000), ("400K", 400_000), ("128k tokens", 128_000),
+                                           ("1,048,576", 1_048_576), (200000, 200000), (None, 0), ("n/a", 0)])
+def test_parse_context_tokens(value, tokens):
+    assert parse_context_tokens(value) == tokens
+
+
+def test_pareto_frontier_excludes_dominated_models():
+    index = ModelIndex(ROWS)
+    frontier = {ROWS[i]["model"] for i in index.frontier}
+    assert frontier == {"big", "fast", "cheap", "unpriced"}
+    assert index.describe(3)["pareto_optimal"] is False
+
+
+def test_query_filters_and_orders():
+    index = ModelIndex(ROWS)
+    assert names(index.query(min_context=400_000, maximize="intelligence")) == ["big", "cheap"]
+    assert names(index.query(max_price=5, maximize="speed", limit=2)) == ["fast", "cheap"]
+    assert names(index.query(maximize="price", limit=3)) == ["cheap", "dominated", "fast"]
+    # 가격이 없는 모델은 가격 조건에서 항상 탈락
+    assert "unpriced" not in names(index.query(max_price=1000, limit=10))
+    assert names(index.query(limit=1)) == ["unpriced"]
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_query_non_positive_limit_returns_nothing(limit):
+    assert ModelIndex(ROWS).query(limit=limit) == []
+
+
+def test_query_unknown_dimension_raises():
+    with pytest.raises(ValueError):
+        ModelIndex(ROWS).query(maximize="vibes")
+
+
+def test_query_matches_brute_force():
+    rng = random.Random(3)
+    rows = [
+        {"model": f"m{i}", "intelligence_index": rng.randint(20, 90), "speed": rng.randint(10, 400),
+         "price_per_1m": rng.choice([None, round(rng.uniform(0.1, 20), 2)]),
+         "context_window": f"{rng.choice([8, 32, 128, 200, 1000])}k"}
+        for i in range(200)
+    ]
+    index = ModelIndex(rows)
+    for _ in range(50):
+        min_context = rng.choice([0, 32_000, 128_000, 500_000])
+        max_price = rng.choice([None, 1, 5, 10])
+        min_speed = rng.choice([0, 100, 200])
+        maximize = rng.choice(list(DIMENSIONS))
+        limit = rng.choice([1, 3, 10])
+
+        matches = [
+            i for i in range(len(rows))
+            if index.columns["context"][i] >= min_context
+            and index.columns["price"][i] <= (math.inf if max_price is None else max_price)
+            and index.columns["speed"][i] >= min_speed
+        ]
+        column = index.columns[maximize]
+        expected = sorted((column[i] for i in matches), reverse=DIMENSIONS[maximize])[:limit]
+
+        results = index.query(min_context, max_price, min_speed, 0, maximize, limit)
+        got = [column[next(i for i, r in enumerate(rows) if r["model"] == m)] for m in names(results)]
+        assert got == expected
+
+
+def test_query_models_reports_unknown_dimension():
+    result = asyncio.run(query_models(maximize="vibes"))
+    assert result["success"] is False
+    assert "vibes" in result["error"] and "intelligence" in result["error"]
@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from tools import model_search_index as search_module
+from tools.model_search_index import RECENT_SECONDS, ModelSearchIndex, tag_terms
+from tools.records import ModelRecord
+
+DAY = 86400
+NOW = 1_760_000_000.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    current = SimpleNamespace(now=NOW)
+    monkeypatch.setattr(search_module, "time", SimpleNamespace(time=lambda: current.now))
+    return current
+
+
+def iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def record(model_id: str, downloads: int = 0, modified: float = 0, tags=("pytorch",)) -> ModelRecord:
+    return ModelRecord.from_dict({
+        "id": model_id,
+        "pipeline_tag": "text-generation",
+        "tags": list(tags),
+        "downloads": downloads,
+        "last_modified": iso(modified) if modified else "",
+    })
+
+
+def scores(index: ModelSearchIndex, keywords=(), k: int = 10):
+    results, _ = index.search("text-generation", list(keywords), k=k)
+    return {r["name"]: r["relevance_score"] for r in results}
+
+
+def test_tag_terms_split_on_separators():
+    assert tag_terms("license:Apache-2.0") == {"license:apache-2.0", "license", "apache", "2", "0"}
+
+
+def test_recency_bonus_is_evaluated_at_query_time(clock):
+    index = ModelSearchIndex()
+    index.add([
+        record("org/fresh", modified=NOW - 29 * DAY),
+        record("org/popular", downloads=500_000, modified=NOW - 365 * DAY),
+        record("org/both", downloads=500_000, modified=NOW - 10 * DAY),
+    ])
+    assert scores(index) == {"org/fresh": 10, "org/popular": 20, "org/both": 30}
+
+    clock.now = NOW + 2 * DAY
+    assert scores(index) == {"org/popular": 20, "org/both": 30}
+
+    clock.now = NOW + 21 * DAY
+    results, total = index.search("text-generation", [], k=10)
+    assert {r["name"]: r["relevance_score"] for r in results} == {"org/popular": 20, "org/both": 20}
+    assert all("최근 업데이트" not in r["reasons"] for r in results)
+    assert total == 2
+
+
+def test_readded_record_uses_its_new_modified_time(clock):
+    index = ModelSearchIndex()
+    index.add([record("org/model", modified=NOW - 29 * DAY)])
+    clock.now = NOW + DAY / 2
+    index.add([record("org/model", modified=clock.now)])
+
+    clock.now = NOW + RECENT_SECONDS / 2
+    assert scores(index) == {"org/model": 10}
+    clock.now = NOW + RECENT_SECONDS + DAY
+    assert scores(index) == {}
+
+
+def test_keyword_matches_rank_with_static_score(clock):
+    index = ModelSearchIndex()
+    index.add([
+        record("org/chat", tags=("chat", "pytorch")),
+        record("org/popular", downloads=500_000),
+        record("org/plain"),
+    ])
+    assert scores(index, ["chat"]) == {"org/chat": 10, "org/popular": 20}
+    results, total = index.search("text-generation", ["chat"], k=1)
+    assert [r["name"] for r in results] == ["org/popular"] and total == 2
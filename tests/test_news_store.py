@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+
+from tools import ai_news
+from tools.news_store import NewsStore
+from tools.refresh_policy import RefreshPolicy
+from tools.state_store import MemoryStateStore
+
+
+def news(i, source="arXiv", type_="research", tags=()):
+    return {"title": f"item {i}", "url": f"https://example.com/{i}", "timestamp": 1000 + i,
+            "source": source, "type": type_, "tags": list(tags)}
+
+
+def filled_store(count=25):
+    store = NewsStore()
+    store.add_many(news(i, *(("GitHub", "project") if i % 2 else ())) for i in range(count))
+    return store
+
+
+def test_cursor_pages_cover_every_item_once_newest_first():
+    store = filled_store()
+    seen, cursor = [], None
+    while True:
+        page = store.page(limit=7, cursor=cursor)
+        seen += [item["timestamp"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == sorted(range(1000, 1025), reverse=True)
+
+
+def test_filtered_pages_follow_the_same_cursor():
+    store = filled_store()
+    first = store.page(source="GitHub", limit=5)
+    second = store.page(source="GitHub", limit=5, cursor=first["next_cursor"])
+    stamps = [item["timestamp"] for item in first["items"] + second["items"]]
+    assert stamps == [1023, 1021, 1019, 1017, 1015, 1013, 1011, 1009, 1007, 1005]
+    assert all(item["source"] == "GitHub" for item in second["items"])
+
+
+def test_page_projects_fields():
+    page = filled_store().page(limit=1, fields=("title", "url"))
+    assert page["items"] == [{"title": "item 24", "url": "https://example.com/24"}]
+
+
+def test_changes_since_returns_only_new_items_and_continues_after_truncation():
+    store = filled_store(5)
+    token = store.since_token()
+    assert store.changes_since(token)["items"] == []
+
+    store.add_many(news(i) for i in range(5, 10))
+    first = store.changes_since(token, limit=3)
+    assert first["truncated"] is True
+    rest = store.changes_since(first["since"], limit=10)
+    assert rest["truncated"] is False
+    titles = [item["title"] for item in first["items"] + rest["items"]]
+    assert titles == [f"item {i}" for i in range(5, 10)]
+
+
+def test_foreign_since_token_falls_back_to_time_watermark():
+    old = filled_store(5)
+    token = old.since_token()
+    restarted = filled_store(8)
+    changes = restarted.changes_since(token)
+    assert [item["timestamp"] for item in changes["items"]] == [1005, 1006, 1007]
+
+
+def test_readding_unchanged_items_is_a_no_op_and_changes_are_reindexed():
+    store = filled_store(3)
+    assert store.add_many([news(1)]) == 0
+    token = store.since_token()
+    assert store.add_many([{**news(1), "timestamp": 2000}]) == 1
+    assert len(store) == 3
+    assert [item["timestamp"] for item in store.changes_since(token)["items"]] == [2000]
+
+
+def test_capacity_evicts_oldest():
+    store = NewsStore(max_items=4)
+    store.add_many(news(i) for i in range(6))
+    assert [item["timestamp"] for item in store.page(limit=10)["items"]] == [1005, 1004, 1003, 1002]
+
+
+@pytest.fixture
+def isolated_news(monkeypatch):
+    """업스트림 대신 고정 결과를 돌려주는 ai_news (캐시 / 저장소는 테스트마다 새로)"""
+    monkeypatch.setattr(ai_news, "state_store", MemoryStateStore())
+    monkeypatch.setattr(ai_news, "news_store", NewsStore())
+    monkeypatch.setattr(ai_news, "refresh_policy", RefreshPolicy())
+    monkeypatch.setattr(ai_news, "_indexed", {})
+
+    def canned(source, type_):
+        async def fetch(self, *args, limit=10, **kwargs):
+            count = args[-1] if args else limit
+            return [{**news(i, source, type_), "url": f"https://example.com/{source}/{i}"} for i in range(count)]
+        return fetch
+
+    monkeypatch.setattr(ai_news.AINewsCollector, "fetch_arxiv_papers", canned("arXiv", "research"))
+    monkeypatch.setattr(ai_news.AINewsCollector, "fetch_huggingface_models", canned("Hugging Face", "model"))
+    monkeypatch.setattr(ai_news.AINewsCollector, "fetch_github_trending", canned("GitHub", "project"))
+
+
+def test_cached_news_with_zero_limit_returns_no_items(isolated_news):
+    result = asyncio.run(ai_news.get_cached_news(limit=0))
+    assert result["items"] == []
+    assert result["next_cursor"] is None
+
+
+def test_cached_news_cursor_continues_after_the_first_page(isolated_news):
+    async def scenario():
+        first = await ai_news.get_cached_news(limit=2)
+        second = await ai_news.get_cached_news(limit=2, cursor=first["next_cursor"])
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert len(first["items"]) == 2 and first["next_cursor"] is not None
+    assert first["items"][-1]["timestamp"] >= second["items"][0]["timestamp"]
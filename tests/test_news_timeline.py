@@ -0,0 +1,80 @@
+import json
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from tools.ai_news import AINewsCollector
+from tools.decoders import decode_arxiv_news, decode_github_news, decode_hf_news
+from tools.timeutils import to_epoch
+
+# 2024-03-01T12:00:00Z
+NOON = 1709294400
+
+
+@pytest.mark.parametrize("value", [
+    "2024-03-01T12:00:00Z",
+    "2024-03-01T12:00:00.000Z",
+    "2024-03-01T21:00:00+09:00",
+    "2024-03-01T12:00:00",
+    "Fri, 01 Mar 2024 12:00:00 GMT",
+    "Fri, 01 Mar 2024 07:00:00 -0500",
+    time.gmtime(NOON),
+    datetime(2024, 3, 1, 12, tzinfo=timezone.utc),
+    NOON,
+    float(NOON),
+])
+def test_to_epoch_normalizes_every_upstream_format(value):
+    assert to_epoch(value) == NOON
+
+
+@pytest.mark.parametrize("value", [None, "", "yesterday", 0])
+def test_to_epoch_returns_zero_when_unparseable(value):
+    assert to_epoch(value) == 0
+
+
+def at(hours):
+    return datetime.fromtimestamp(NOON + hours * 3600, timezone.utc)
+
+
+def arxiv_feed(hours):
+    entries = "".join(
+        f"""<entry><title>Paper {h}</title><id>http://arxiv.org/abs/{h}</id>
+        <link href="http://arxiv.org/abs/{h}"/><summary>s</summary>
+        <published>{at(h).strftime("%a, %d %b %Y %H:%M:%S +0000")}</published></entry>"""
+        for h in hours
+    )
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'
+
+
+def test_timeline_merges_unsorted_sources_with_mixed_formats():
+    # 소스별로 순서가 뒤섞이고 날짜 형식도 서로 다른 응답
+    papers = decode_arxiv_news(arxiv_feed([1, 7, 4]))
+    models = decode_hf_news(json.dumps([
+        {"id": f"org/m{h}", "lastModified": at(h).strftime("%Y-%m-%dT%H:%M:%S.000Z")} for h in (2, 8, 5)
+    ]))
+    repos = decode_github_news(json.dumps({"items": [
+        {"full_name": f"org/r{h}", "html_url": f"https://github.com/org/r{h}",
+         "created_at": at(h).isoformat()} for h in (6, 3, 9)
+    ]}), 10)
+    for items in (papers, models, repos):
+        assert [item["timestamp"] for item in items] == sorted((item["timestamp"] for item in items), reverse=True)
+
+    collector = AINewsCollector()
+    sources = {"arXiv": papers, "Hugging Face": models, "GitHub": repos}
+    timeline = collector.build_aggregate(sources, limit=5)
+    hours = [(item["timestamp"] - NOON) // 3600 for item in timeline["items"]]
+    assert hours == [9, 8, 7, 6, 5]
+    assert [item["source"] for item in timeline["items"][:3]] == ["GitHub", "Hugging Face", "arXiv"]
+    assert timeline["total_count"] == 9
+
+    everything = collector.build_aggregate(sources, limit=100)["items"]
+    assert [(item["timestamp"] - NOON) // 3600 for item in everything] == list(range(9, 0, -1))
+    research = collector.build_aggregate(sources, category="research", limit=10)
+    assert [item["title"] for item in research["items"]] == ["Paper 7", "Paper 4", "Paper 1"]
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_timeline_with_non_positive_limit_is_empty(limit):
+    sources = {"arXiv": [{"title": "p", "timestamp": NOON, "type": "research"}]}
+    assert AINewsCollector().build_aggregate(sources, limit=limit)["items"] == []
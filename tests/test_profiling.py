@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+from tools.profiling import LoopStallDetector, SamplingProfiler, collapse_stack
+
+
+def test_collapse_stack_is_root_first():
+    import sys
+
+    def leaf():
+        return collapse_stack(sys._getframe())
+
+    stack = leaf()
+    assert stack.split(";")[-1].startswith("leaf (test_profiling.py:")
+    assert "test_collapse_stack_is_root_first" in stack.split(";")[-2]
+
+
+def blocking_handler():
+    # 이벤트 루프를 막는 동기 호출
+    time.sleep(0.3)
+
+
+def test_stall_detector_records_the_blocking_stack(capsys):
+    detector = LoopStallDetector(threshold_ms=50)
+
+    async def scenario():
+        detector.start()
+        await asyncio.sleep(0.1)
+        blocking_handler()
+        await asyncio.sleep(0.1)
+        detector.stop()
+
+    asyncio.run(scenario())
+    assert detector.stalls == 1
+    stall = detector.recent[0]
+    assert stall["stalled_ms"] >= 50
+    assert "blocking_handler" in stall["stack"]
+
+    captured = capsys.readouterr()
+    # stdio 전송을 깨뜨리지 않도록 진단 출력은 stderr로만
+    assert captured.out == ""
+    assert "Event loop stalled" in captured.err and "blocking_handler" in captured.err
+
+
+def test_stall_detector_is_off_without_threshold():
+    detector = LoopStallDetector(threshold_ms=0)
+
+    async def scenario():
+        detector.start()
+        blocking_handler()
+
+    asyncio.run(scenario())
+    assert detector._thread is None and detector.stalls == 0
+
+
+def spin(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_wrap_saves_samples_of_slow_calls_under_the_tool_name(tmp_path, capsys):
+    profiler = SamplingProfiler(sample_rate=0, slow_ms=100, profile_dir=str(tmp_path), interval_ms=2)
+
+    async def busy_tool(seconds):
+        spin(seconds)
+        return "done"
+
+    wrapped = profiler.wrap(busy_tool)
+
+    async def scenario():
+        # 호출 마감은 루프의 다음 차례에
+        assert await wrapped(0.01) == "done"
+        await asyncio.sleep(0)
+        assert await wrapped(0.3) == "done"
+        await asyncio.sleep(0)
+
+    asyncio.run(scenario())
+    deadline = time.monotonic() + 5
+    while not profiler.recent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    profiler.stop()
+
+    stats = profiler.stats()
+    assert stats["calls"] == 2 and stats["profiled"] == 1 and stats["slow"] == 1
+    [path] = tmp_path.iterdir()
+    assert "-busy_tool-" in path.name and path.suffix == ".folded"
+    lines = path.read_text().splitlines()
+    spinning = sum(int(line.rsplit(" ", 1)[1]) for line in lines if "busy_tool" in line and ";spin (" in line)
+    assert spinning >= 10
+    assert all(not line.startswith(("profiler;", "loop-stall-detector;")) for line in lines)
+    assert capsys.readouterr().out == ""
+
+
+def test_wrap_returns_the_function_when_disabled():
+    profiler = SamplingProfiler(sample_rate=0, slow_ms=0)
+
+    async def tool():
+        return 1
+
+    assert profiler.wrap(tool) is tool
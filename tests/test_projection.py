@@ -0,0 +1,96 @@
+import pytest
+
+from tools.ai_agents import AIAgentCatalog
+from tools.projection import decode_token, encode_token, page_meta, page_window, paginate, parse_fields, project
+from tools.records import NewsItem
+
+
+@pytest.mark.parametrize("fields, expected", [
+    (None, None),
+    ("", None),
+    (" , ", None),
+    ("id,name", ("id", "name")),
+    (" id , name ,id", ("id", "name")),
+    (["name", "id"], ("name", "id")),
+])
+def test_parse_fields(fields, expected):
+    assert parse_fields(fields) == expected
+
+
+def test_project_selects_fields_without_copying_full_records():
+    agent = {"id": "a", "name": "A", "features": ["x"], "rating": 4.5}
+    assert project(agent, None) is agent
+    assert project(agent, ("id", "missing", "rating")) == {"id": "a", "rating": 4.5}
+    assert project(agent, ("id",), {"relevance_score": 3}) == {"id": "a", "relevance_score": 3}
+    full = project(agent, None, {"relevance_score": 3})
+    assert full == {**agent, "relevance_score": 3} and "relevance_score" not in agent
+
+
+def test_project_records_converts_tuples_to_lists():
+    item = NewsItem(title="t", tags=("a", "b"), source="arXiv")
+    assert project(item, ("title", "tags")) == {"title": "t", "tags": ["a", "b"]}
+    assert project(item, None)["source"] == "arXiv"
+
+
+def test_cursor_round_trip_covers_every_item_once():
+    items = [{"id": i} for i in range(10)]
+    seen, cursor = [], None
+    while True:
+        page, meta = paginate(items, ("id",), limit=4, cursor=cursor, version=3)
+        seen += [item["id"] for item in page]
+        cursor = meta["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == list(range(10))
+    assert decode_token(encode_token({"o": 4, "v": 3})) == {"o": 4, "v": 3}
+
+
+def test_cursor_takes_precedence_over_offset():
+    cursor = encode_token({"o": 6, "v": 1})
+    assert page_window(10, offset=2, limit=3, cursor=cursor, version=1) == (6, 9)
+    assert page_window(10, offset=8, limit=5) == (8, 10)
+    assert page_window(10, offset=20, limit=5) == (20, 20)
+
+
+def test_cursor_from_another_snapshot_or_garbage_is_rejected():
+    _, meta = paginate([{"id": i} for i in range(10)], limit=3, version=1)
+    with pytest.raises(ValueError, match="different snapshot"):
+        page_window(10, limit=3, cursor=meta["next_cursor"], version=2)
+    with pytest.raises(ValueError, match="Invalid token"):
+        page_window(10, limit=3, cursor="not a token!", version=1)
+
+
+@pytest.mark.parametrize("limit", [0, -2])
+def test_empty_page_has_no_next_cursor(limit):
+    start, end = page_window(10, offset=3, limit=limit)
+    assert (start, end) == (3, 3)
+    assert page_meta(10, start, end) == {"offset": 3, "returned": 0, "next_cursor": None}
+
+
+def test_catalog_list_pages_with_fields():
+    catalog = AIAgentCatalog()
+    first = catalog.list_agents(fields="id,name", limit=5)
+    second = catalog.list_agents(fields="id,name", limit=5, cursor=first["next_cursor"])
+    third = catalog.list_agents(fields="id,name", limit=5, cursor=second["next_cursor"])
+    assert first["count"] == len(catalog.agents)
+    assert all(set(agent) == {"id", "name"} for agent in first["agents"])
+    ids = [a["id"] for page in (first, second, third) for a in page["agents"]]
+    assert ids == [agent["id"] for agent in catalog.agents]
+    assert third["next_cursor"] is None
+
+    catalog.version += 1
+    with pytest.raises(ValueError):
+        catalog.list_agents(limit=5, cursor=first["next_cursor"])
+    assert catalog.list_agents(limit=0)["next_cursor"] is None
+
+
+def test_catalog_search_pages_keep_relevance_order():
+    catalog = AIAgentCatalog()
+    everything = catalog.search_agents("code", fields=("id",))
+    scores = [r["relevance_score"] for r in everything["results"]]
+    assert scores == sorted(scores, reverse=True) and everything["next_cursor"] is None
+
+    first = catalog.search_agents("code", fields=("id",), limit=2)
+    rest = catalog.search_agents("code", fields=("id",), limit=10, cursor=first["next_cursor"])
+    assert first["results"] + rest["results"] == everything["results"]
+    assert set(first["results"][0]) == {"id", "relevance_score"}
@@ -0,0 +1,67 @@
+import random
+
+from tools.ranking_history import CHECKPOINT_EVERY, BenchmarkHistory, MetricColumn, RankingHistory
+
+
+def test_metric_column_decodes_any_window_across_checkpoints():
+    rng = random.Random(7)
+    values = [rng.randint(0, 5000) for _ in range(CHECKPOINT_EVERY * 3 + 5)]
+    column = MetricColumn()
+    for value in values:
+        column.append(value)
+
+    assert len(column.checkpoints) == 4
+    for start, end in [(0, len(values)), (CHECKPOINT_EVERY - 1, CHECKPOINT_EVERY + 2),
+                       (CHECKPOINT_EVERY * 2, CHECKPOINT_EVERY * 2 + 1), (50, 40)]:
+        assert column.decode(start, end) == values[start:end]
+
+
+def test_series_restores_scaled_values_and_missing():
+    history = BenchmarkHistory("artificial_analysis")
+    history.append([{"model": "GPT-4o", "intelligence_index": 71.25, "price_per_1m": 4.375, "rank": 2}], 100)
+    history.append([{"model": "gpt-4o", "intelligence_index": 72.5, "rank": 1}], 200)
+
+    series = history.series("GPT-4O", 0, 300)
+    assert series["model"] == "GPT-4o"
+    assert series["timestamps"] == [100, 200]
+    assert series["intelligence_index"] == [71.25, 72.5]
+    assert series["price_per_1m"] == [4.375, None]
+    assert series["rank"] == [2, 1]
+    assert history.series("GPT-4o", 150, 300)["timestamps"] == [200]
+    assert history.series("unknown", 0, 300) is None
+
+
+def test_out_of_order_snapshot_ignored():
+    history = BenchmarkHistory("lmsys_arena")
+    history.append([{"model": "a", "elo_rating": 1200}], 200)
+    history.append([{"model": "a", "elo_rating": 1100}], 100)
+    assert list(history.times) == [200]
+
+
+def test_rank_changes_derives_ranks_and_sorts_by_movement():
+    history = BenchmarkHistory("lmsys_arena")
+    history.append([{"model": "a", "elo_rating": 1300}, {"model": "b", "elo_rating": 1200},
+                    {"model": "c", "elo_rating": 1100}], 100)
+    history.append([{"model": "a", "elo_rating": 1250}, {"model": "b", "elo_rating": 1200},
+                    {"model": "c", "elo_rating": 1350}, {"model": "d", "elo_rating": 1000}], 200)
+
+    changes = history.rank_changes(0, 300)
+    assert [c["model"] for c in changes] == ["c", "a", "b", "d"]
+    assert changes[0] == {"model": "c", "rank_then": 3, "rank_now": 1, "change": 2}
+    assert changes[-1]["change"] is None
+    assert history.rank_changes(300, 400) == []
+
+
+def test_trend_persists_and_reloads(tmp_path):
+    path = str(tmp_path / "history.jsonl")
+    history = RankingHistory(path)
+    history.append("lmsys_arena", [{"model": "a", "elo_rating": 1200, "votes": 10}], timestamp=None)
+    history.append("unknown_benchmark", [{"model": "a"}])
+
+    reloaded = RankingHistory(path)
+    trend = reloaded.trend("lmsys_arena", "a", days=1)
+    assert trend["found"] and trend["snapshots"] == 1
+    assert trend["summary"]["elo_rating"] == {"first": 1200, "last": 1200, "change": 0, "min": 1200, "max": 1200}
+    assert "unknown_benchmark" not in reloaded.benchmarks
+    assert reloaded.trend("artificial_analysis", "a") == {
+        "benchmark": "artificial_analysis", "days": 90, "snapshots": 0, "model": "a", "found": False}
@@ -0,0 +1,54 @@
+import sys
+
+import pytest
+
+from tools.records import ModelRecord, NewsItem
+
+
+def fresh(text: str) -> str:
+    """intern되지 않은 새 문자열 객체"""
+    return "".join(list(text))
+
+
+def test_records_have_no_instance_dict():
+    item = NewsItem(title="t", source="arXiv")
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.unknown_attribute = 1
+    full = dict.fromkeys(NewsItem.FIELDS, 0)
+    assert sys.getsizeof(NewsItem(**full)) < sys.getsizeof(full)
+
+
+def test_categorical_fields_and_sequences_are_interned():
+    a = NewsItem(source=fresh("Hugging Face"), tags=[fresh("text-generation"), fresh("pytorch")])
+    b = NewsItem(source=fresh("Hugging Face"), tags=[fresh("text-generation")])
+    assert a.source is b.source
+    assert a.tags[0] is b.tags[0]
+    assert isinstance(a.tags, tuple)
+    # 범주형이 아닌 필드는 intern하지 않음
+    assert NewsItem(title=fresh("Paper title")).title is not NewsItem(title=fresh("Paper title")).title
+
+
+def test_dict_compatible_access_distinguishes_unset_from_none():
+    item = NewsItem(title="t", summary=None)
+    assert item["title"] == "t" and item.get("summary", "x") is None
+    assert "summary" in item and "url" not in item
+    assert item.get("url", "default") == "default"
+    with pytest.raises(KeyError):
+        item["url"]
+    assert list(item.keys()) == ["title", "summary"]
+    assert item.to_dict() == {"title": "t", "summary": None}
+
+
+def test_unknown_fields_are_kept_in_overflow():
+    data = {"id": "org/model", "tags": ["a"], "gated": True, "safetensors": {"total": 7}}
+    record = ModelRecord.from_dict(data)
+    assert record.extra == {"gated": True, "safetensors": {"total": 7}}
+    assert record["gated"] is True and "safetensors" in record
+    assert list(record.keys()) == ["id", "tags", "gated", "safetensors"]
+    assert record.to_dict() == data
+    assert ModelRecord.from_dict(record.to_dict()).to_dict() == data
+
+
+def test_known_fields_leave_overflow_empty():
+    assert ModelRecord(id="org/model").extra is None
@@ -0,0 +1,129 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from tools import ai_news
+from tools import refresh_policy as policy_module
+from tools.refresh_policy import RefreshPolicy, content_fingerprint
+from tools.state_store import state_store
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    current = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(policy_module, "time", SimpleNamespace(monotonic=lambda: current.now))
+    return current
+
+
+def make_policy(**overrides) -> RefreshPolicy:
+    options = dict(base=300, min_interval=60, max_interval=1000, growth=1.5, shrink=0.5, adaptive=True)
+    return RefreshPolicy(**{**options, **overrides})
+
+
+ROWS = [{"id": "a", "title": "A", "downloads": 10}, {"id": "b", "title": "B", "downloads": 3}]
+
+
+def test_fingerprint_ignores_volatile_counters_but_not_content_or_order():
+    bumped = [{**row, "downloads": row["downloads"] + 100} for row in ROWS]
+    assert content_fingerprint(bumped) == content_fingerprint(ROWS)
+    assert content_fingerprint(ROWS[::-1]) != content_fingerprint(ROWS)
+    assert content_fingerprint([{**ROWS[0], "title": "A2"}, ROWS[1]]) != content_fingerprint(ROWS)
+
+
+def test_interval_grows_when_unchanged_and_shrinks_on_change(clock):
+    policy = make_policy()
+    assert policy.observe("src", ROWS) == 300
+    intervals = [policy.observe("src", ROWS) for _ in range(4)]
+    assert intervals == [450, 675, 1000, 1000]
+
+    changed = [{"id": "c", "title": "C"}]
+    assert policy.observe("src", changed) == 500
+    for _ in range(5):
+        changed = [{"id": changed[0]["id"] + "x"}]
+        policy.observe("src", changed)
+    assert policy.ttl("src") == 60
+    assert policy.stats()["sources"]["src"]["changes"] == 6
+
+
+def test_failures_retry_at_minimum_without_touching_fingerprint(clock):
+    policy = make_policy()
+    policy.observe("src", ROWS)
+    assert policy.observe("src", [], failed=True) == 60
+    assert policy.ttl("src") == 300
+    assert policy.observe("src", ROWS) == 450
+    counters = policy.stats()["sources"]["src"]
+    assert counters["failures"] == 1 and counters["unchanged"] == 1
+
+
+def test_non_adaptive_policy_keeps_base_interval(clock):
+    policy = make_policy(adaptive=False)
+    for _ in range(3):
+        assert policy.observe("src", ROWS) == 300
+
+
+def test_saved_and_extra_calls(clock):
+    policy = make_policy()
+    policy.hit("unknown")
+    policy.observe("src", ROWS)
+    clock.now += 100
+    policy.hit("src")
+    clock.now += 250
+    policy.hit("src")
+    policy.hit("src")
+    clock.now += 300
+    policy.hit("src")
+    clock.now += 10
+    policy.observe("src", ROWS)
+    # 기준 주기 안에 다시 가져오면 추가 호출
+    clock.now += 40
+    policy.observe("src", ROWS)
+
+    stats = policy.stats()
+    assert stats["saved_calls"] == 2 and stats["extra_calls"] == 1 and stats["net_saved_calls"] == 1
+    assert "unknown" not in stats["sources"]
+
+
+def test_alternating_news_limits_do_not_collapse_the_interval(monkeypatch, clock):
+    """limit이 번갈아 들어와도 소스 + 항목 수별로 관측하므로 변경으로 세지 않음"""
+    policy = make_policy(max_interval=5000)
+    monkeypatch.setattr(ai_news, "refresh_policy", policy)
+    papers = [{"title": f"Paper {i}", "url": f"https://arxiv.org/abs/{i}"} for i in range(20)]
+    fetches = []
+
+    def fetcher(per_source):
+        async def fetch():
+            fetches.append(per_source)
+            return papers[:per_source]
+        return fetch
+
+    collector = ai_news.AINewsCollector()
+
+    async def scenario():
+        for _ in range(4):
+            for limit in (10, 30):
+                per_source = ai_news.per_source_limit(limit)
+                key = ai_news.refresh_key("arxiv", per_source)
+                # 캐시가 만료된 뒤의 요청
+                await state_store.delete(f"news_source:{key}")
+                items = await collector.fetch_source_cached("arXiv", per_source, fetcher(per_source))
+                assert len(items) == per_source
+                clock.now += 400
+        await state_store.delete("news_source:arxiv:4")
+        await state_store.delete("news_source:arxiv:11")
+
+    asyncio.run(scenario())
+    assert fetches == [4, 11] * 4
+    sources = policy.stats()["sources"]
+    assert set(sources) == {"arxiv:4", "arxiv:11"}
+    for counters in sources.values():
+        assert counters["changes"] == 0 and counters["unchanged"] == 3
+    assert policy.ttl("arxiv:4") == policy.ttl("arxiv:11") == pytest.approx(300 * 1.5 ** 3)
+    assert ai_news._refresh_keys(10) == ["arxiv:4", "huggingface:4", "github_trending:4"]
+
+    # 같은 키로 섞어 관측하면 항목 수 차이만으로 매번 변경이 되어 최소 주기로 줄어듦
+    mixed = make_policy()
+    for _ in range(4):
+        mixed.observe("arxiv", papers[:4])
+        mixed.observe("arxiv", papers[:11])
+    assert mixed.ttl("arxiv") == 60
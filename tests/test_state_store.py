@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from tools.records import NewsItem
+from tools.state_store import StateStore, create_state_store
+
+
+def test_state_store_is_abstract():
+    with pytest.raises(TypeError):
+        StateStore()
+
+    class Partial(StateStore):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_set_get_expire_delete(backend, tmp_path):
+    store = create_state_store(backend, str(tmp_path / "state.sqlite3"))
+
+    async def scenario():
+        await store.set("news", {"items": [NewsItem(title="t", source="arXiv")]}, ttl=60)
+        await store.set("expired", [1], ttl=-1)
+        value = await store.get("news")
+        assert (await store.get("expired")) is None
+        await store.delete("news")
+        assert (await store.get("news")) is None
+        return value
+
+    value = asyncio.run(scenario())
+    title = value["items"][0]["title"]
+    assert title == "t"
+    assert store.stats()["backend"] == backend
+    assert store.stats()["sets"] == 2
+
+
+def test_sqlite_instances_share_values(tmp_path):
+    path = str(tmp_path / "state.sqlite3")
+    writer, reader = create_state_store("sqlite", path), create_state_store("sqlite", path)
+
+    async def scenario():
+        await writer.set("rankings", {"version": 1})
+        first = await reader.get("rankings")
+        # 바뀌지 않았으면 다시 디코딩하지 않고 같은 객체
+        assert (await reader.get("rankings")) is first
+        await writer.set("rankings", {"version": 2})
+        return first, await reader.get("rankings")
+
+    first, second = asyncio.run(scenario())
+    assert first == {"version": 1} and second == {"version": 2}
@@ -0,0 +1,98 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from tools import ai_news
+from tools.refresh_policy import RefreshPolicy
+from tools.state_store import MemoryStateStore
+from tools.streaming import ChunkStreamer
+
+
+class StubContext:
+    """MCP Context 대역 (보낸 알림을 기록)"""
+
+    def __init__(self, progress_token=None, fail=False):
+        self.request_context = SimpleNamespace(meta=SimpleNamespace(progressToken=progress_token))
+        self.request_id = "req-1"
+        self.fail = fail
+        self.sent = []
+        self.session = SimpleNamespace(send_log_message=self._log)
+
+    async def report_progress(self, progress, total, message):
+        if self.fail:
+            raise ConnectionError("client went away")
+        self.sent.append(("progress", progress, total, json.loads(message)))
+
+    async def _log(self, level, data, logger, related_request_id):
+        self.sent.append(("log", level, logger, related_request_id, data))
+
+
+def test_chunks_go_out_as_progress_when_the_client_sent_a_token():
+    ctx = StubContext(progress_token="tok")
+    streamer = ChunkStreamer(ctx, total=2, logger="get_ai_news")
+
+    async def scenario():
+        await streamer({"source": "arXiv", "items": [{"title": "p"}]})
+        await streamer({"source": "GitHub", "items": []})
+
+    asyncio.run(scenario())
+    assert ctx.sent == [
+        ("progress", 1, 2, {"chunk": 1, "total": 2, "source": "arXiv", "items": [{"title": "p"}]}),
+        ("progress", 2, 2, {"chunk": 2, "total": 2, "source": "GitHub", "items": []}),
+    ]
+
+
+@pytest.mark.parametrize("meta", [None, SimpleNamespace(progressToken=None)])
+def test_chunks_fall_back_to_request_log_messages(meta):
+    ctx = StubContext()
+    ctx.request_context.meta = meta
+    streamer = ChunkStreamer(ctx, total=3, logger="ai_overview")
+    asyncio.run(streamer({"source": "arXiv", "items": []}))
+    assert ctx.sent == [("log", "info", "ai_overview", "req-1",
+                         {"chunk": 1, "total": 3, "source": "arXiv", "items": []})]
+
+
+def test_streaming_failures_do_not_raise(capsys):
+    ctx = StubContext(progress_token="tok", fail=True)
+    asyncio.run(ChunkStreamer(ctx, total=1, logger="get_ai_news")({"source": "arXiv"}))
+    captured = capsys.readouterr()
+    assert captured.out == "" and "Error streaming chunk" in captured.err
+
+
+def test_aggregation_streams_each_source_before_returning_the_merged_result(monkeypatch):
+    monkeypatch.setattr(ai_news, "state_store", MemoryStateStore())
+    monkeypatch.setattr(ai_news, "refresh_policy", RefreshPolicy())
+    events = []
+
+    def slow_source(source, type_, delay):
+        async def fetch(self, *args, **kwargs):
+            await asyncio.sleep(delay)
+            return [{"title": f"{source} {i}", "source": source, "type": type_, "timestamp": 100 * delay + i}
+                    for i in range(2)]
+        return fetch
+
+    monkeypatch.setattr(ai_news.AINewsCollector, "fetch_arxiv_papers", slow_source("arXiv", "research", 0.03))
+    monkeypatch.setattr(ai_news.AINewsCollector, "fetch_huggingface_models", slow_source("Hugging Face", "model", 0.01))
+    monkeypatch.setattr(ai_news.AINewsCollector, "fetch_github_trending", slow_source("GitHub", "project", 0.02))
+
+    ctx = StubContext(progress_token="tok")
+    streamer = ChunkStreamer(ctx, total=3, logger="get_ai_news")
+
+    async def on_chunk(chunk):
+        events.append(("chunk", chunk["source"]))
+        await streamer(chunk)
+
+    async def scenario():
+        result = await ai_news.AINewsCollector().get_ai_news_aggregated(category="industry", limit=3, on_chunk=on_chunk)
+        events.append(("result", len(result["items"])))
+        return result
+
+    result = asyncio.run(scenario())
+    # 가장 빠른 소스부터 도착 즉시 전달한 뒤 병합 결과 반환
+    assert events == [("chunk", "Hugging Face"), ("chunk", "GitHub"), ("chunk", "arXiv"), ("result", 3)]
+    assert [sent[1] for sent in ctx.sent] == [1, 2, 3]
+    # 부분 결과에도 카테고리 필터 적용
+    assert ctx.sent[2][3]["items"] == []
+    assert [item["source"] for item in result["items"]] == ["GitHub", "GitHub", "Hugging Face"]
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+
+from tools.tracing import SpanExporter, Tracer, create_exporter, span
+
+
+class ListExporter(SpanExporter):
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(spans)
+
+
+def test_span_exporter_is_abstract():
+    with pytest.raises(TypeError):
+        SpanExporter()
+
+    class Incomplete(SpanExporter):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_create_exporter_specs():
+    assert create_exporter("none") is None
+    assert isinstance(create_exporter("tests.test_tracing:ListExporter"), ListExporter)
+    with pytest.raises(ValueError):
+        create_exporter("nonsense")
+
+
+def test_tracer_records_nested_spans(tmp_path):
+    exporter = ListExporter()
+    tracer = Tracer(exporter=exporter, slow_ms=0, slow_file=str(tmp_path / "slow.jsonl"))
+
+    async def tool(query: str, ctx=None):
+        with span("cache.get", key=query) as s:
+            s.set(hit=False)
+            with span("parse"):
+                pass
+        return {"query": query}
+
+    async def scenario():
+        result = await tracer.wrap(tool)(query="q", ctx=object())
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(scenario()) == {"query": "q"}
+    [spans] = exporter.traces
+    by_name = {s["name"]: s for s in spans}
+    assert list(by_name) == ["tool:tool", "cache.get", "parse", "serialize"]
+    root = by_name["tool:tool"]
+    assert root["parent_id"] is None and root["attributes"] == {"arguments": {"query": "q"}}
+    assert by_name["cache.get"]["parent_id"] == root["span_id"]
+    assert by_name["cache.get"]["attributes"] == {"key": "q", "hit": False}
+    assert by_name["parse"]["parent_id"] == by_name["cache.get"]["span_id"]
+    assert by_name["serialize"]["parent_id"] == root["span_id"]
+    assert all(s["duration_ms"] is not None and s["trace_id"] == root["trace_id"] for s in spans)
+    assert tracer.stats()["traces"] == 1
+
+
+def test_spans_outside_a_tool_call_are_noops():
+    with span("parse") as s:
+        s.set(rows=1)
+    assert Tracer(exporter=None, slow_ms=0).wrap(test_spans_outside_a_tool_call_are_noops) \
+        is test_spans_outside_a_tool_call_are_noops